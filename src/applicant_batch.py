@@ -0,0 +1,138 @@
+from array import array
+
+from dataset_store import DICT_LIMIT, RowView
+
+class _Column:
+    """One field of an ApplicantBatch
+
+    Starts out categorical: every distinct value is stored once in `values`
+    and rows hold uint16 codes into it. A column that exceeds the dictionary
+    limit (names, e-mails, addresses...) is converted to a plain list of
+    values, where a dictionary would only add overhead.
+    """
+
+    __slots__ = ('values', 'codes', 'lookup')
+
+    def __init__(self):
+        self.values = []
+        self.codes = array('H')
+        self.lookup = {}
+
+    def append(self, value, dict_limit):
+        lookup = self.lookup
+        if lookup is None:
+            self.values.append(value)
+            return
+        code = lookup.get(value)
+        if code is None:
+            if len(self.values) >= dict_limit:
+                self._to_plain()
+                self.values.append(value)
+                return
+            code = lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def _to_plain(self):
+        values = self.values
+        self.values = [values[code] for code in self.codes]
+        self.codes = None
+        self.lookup = None
+
+    def get(self, index):
+        if self.codes is None:
+            return self.values[index]
+        return self.values[self.codes[index]]
+
+    def __iter__(self):
+        if self.codes is None:
+            return iter(self.values)
+        values = self.values
+        return (values[code] for code in self.codes)
+
+class ApplicantBatch:
+    """Column-oriented container for many applicant records
+
+    Stores each field as a column instead of one 95-key dict per record:
+    low-cardinality fields (gender, religion, job category, cities...) are
+    interned once and kept as 2-byte codes. Indexing or iterating yields
+    read-only dict-like rows (dataset_store.RowView), so render_indonesian_pdf(),
+    create_indonesian_pdf() and ktp_data() accept them in place of dicts.
+    generate_applicant_batch() builds one directly from the generator.
+    """
+
+    __slots__ = ('fieldnames', 'dict_limit', '_columns', '_size')
+
+    def __init__(self, fieldnames, dict_limit=DICT_LIMIT):
+        self.fieldnames = list(fieldnames)
+        self.dict_limit = min(dict_limit, 0xFFFF)
+        self._columns = {field: _Column() for field in self.fieldnames}
+        self._size = 0
+
+    @classmethod
+    def from_records(cls, records, fieldnames=None, dict_limit=DICT_LIMIT):
+        """Build a batch from an iterable of record mappings"""
+        records = iter(records)
+        first = next(records, None)
+        batch = cls(fieldnames or (first.keys() if first is not None else ()), dict_limit)
+        if first is not None:
+            batch.append(first)
+            batch.extend(records)
+        return batch
+
+    @classmethod
+    def from_columns(cls, columns, dict_limit=DICT_LIMIT):
+        """Build a batch from {field: sequence} columns (e.g. a columnar generator batch)"""
+        batch = cls(columns, dict_limit)
+        sizes = {len(values) for values in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(sizes)}")
+        limit = batch.dict_limit
+        for field, values in columns.items():
+            column = batch._columns[field]
+            for value in values:
+                column.append(value, limit)
+        batch._size = sizes.pop() if sizes else 0
+        return batch
+
+    def append(self, record):
+        limit = self.dict_limit
+        for field, column in self._columns.items():
+            column.append(record[field], limit)
+        self._size += 1
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def value(self, index, field):
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        return self._columns[field].get(index)
+
+    def column(self, field):
+        """All values of one field, in record order"""
+        return iter(self._columns[field])
+
+    def categories(self, field):
+        """Distinct values of a categorical field (code -> value), or None once it went plain"""
+        column = self._columns[field]
+        return None if column.codes is None else tuple(column.values)
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        return RowView(self, index)
+
+    def __iter__(self):
+        return (RowView(self, index) for index in range(self._size))
+
+    def __repr__(self):
+        categorical = sum(column.codes is not None for column in self._columns.values())
+        return (f"ApplicantBatch({self._size} records, {len(self.fieldnames)} fields, "
+                f"{categorical} categorical)")
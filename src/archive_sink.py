@@ -0,0 +1,148 @@
+import csv
+import io
+import os
+import queue
+import tarfile
+import threading
+import time
+import zipfile
+
+# Archive formats by file extension; PNG and PDF payloads are already
+# compressed, so .zip and .tar store members as they are
+ARCHIVE_FORMATS = {
+    '.zip': ('zip', None),
+    '.tar': ('tar', 'w'),
+    '.tar.gz': ('tar', 'w:gz'),
+    '.tgz': ('tar', 'w:gz'),
+}
+INDEX_SUFFIX = '.index.csv'
+INDEX_FIELDS = ('key', 'member', 'size', 'offset')
+
+def archive_format(path):
+    """('zip' | 'tar', tarfile mode) for an archive path, or None if it is not one"""
+    lower = path.lower()
+    for extension in sorted(ARCHIVE_FORMATS, key=len, reverse=True):
+        if lower.endswith(extension):
+            return ARCHIVE_FORMATS[extension]
+    return None
+
+def index_path(archive_path):
+    return archive_path + INDEX_SUFFIX
+
+class ArchiveWriter:
+    """Streams in-memory artifacts into one ZIP or tar archive on a background thread
+
+    Renderers hand over (member name, bytes) with add() and go straight back
+    to rendering; a writer thread appends the members to the archive, so
+    compression and disk I/O overlap with drawing. The queue is bounded, so a
+    slow disk applies back-pressure instead of buffering the whole run.
+
+    Next to the archive, `<archive>.index.csv` lists every member with its
+    key (the application_id), size and offset: the local header offset inside
+    a ZIP, or the data offset inside the (uncompressed) tar stream.
+    """
+
+    def __init__(self, path, queue_size=256):
+        fmt = archive_format(path)
+        if fmt is None:
+            raise ValueError(f"Unsupported archive type for {path!r}; use one of {', '.join(ARCHIVE_FORMATS)}")
+        self.path = path
+        self.kind, mode = fmt
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.kind == 'zip':
+            self._archive = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True)
+        else:
+            self._archive = tarfile.open(path, mode)
+        self._index_file = open(index_path(path), 'w', newline='', encoding='utf-8')
+        self._index = csv.writer(self._index_file)
+        self._index.writerow(INDEX_FIELDS)
+        self._queue = queue.Queue(queue_size)
+        self._error = None
+        self._closed = False
+        self.members = 0
+        self.bytes_written = 0
+        self._thread = threading.Thread(target=self._run, name='archive-writer', daemon=True)
+        self._thread.start()
+
+    def add(self, member, data, key=''):
+        """Queue one member; raises the writer thread's error once a write has failed"""
+        if self._closed:
+            raise ValueError("ArchiveWriter is closed")
+        if not self._put((member, data, key)):
+            raise self._error
+
+    def _put(self, item):
+        """Queue `item` unless the writer thread has stopped; returns whether it was queued
+
+        Waits in short steps while the queue is full, so a producer blocked on
+        back-pressure notices a failed writer instead of waiting forever.
+        """
+        while self._error is None:
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                self._write(*item)
+            except Exception as e:
+                # Stop at the first failure: later members would only land
+                # in an archive that is already incomplete
+                self._error = e
+                return
+
+    def _write(self, member, data, key):
+        if self.kind == 'zip':
+            info = zipfile.ZipInfo(member, date_time=time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            self._archive.writestr(info, data)
+            offset = info.header_offset
+        else:
+            info = tarfile.TarInfo(member)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            self._archive.addfile(info, io.BytesIO(data))
+            # Data is the last thing written, padded to whole blocks
+            blocks = -(-len(data) // tarfile.BLOCKSIZE)
+            offset = self._archive.offset - blocks * tarfile.BLOCKSIZE
+        self._index.writerow((key, member, len(data), offset))
+        self.members += 1
+        self.bytes_written += len(data)
+
+    def close(self):
+        """Flush the queue, finish the archive and its index
+
+        Raises the writer thread's error, if any, after closing the files.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._put(None)
+        self._thread.join()
+        try:
+            self._archive.close()
+        finally:
+            self._index_file.close()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.close()
+        except Exception:
+            # Don't mask the exception already leaving the with block (often
+            # this very error, re-raised by add())
+            if exc_type is None:
+                raise
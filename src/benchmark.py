@@ -0,0 +1,449 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+# Benchmarks are run as `python3 src/benchmark.py <name>` from the repo root
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def _rate(label, count, seconds):
+    print(f"  {label:<28} {count / seconds:>12,.0f} records/s   ({seconds * 1e6 / count:,.1f} us/record)")
+
+def bench_generation(args):
+    """Per-record dict loop (live Faker, pooled) vs the NumPy columnar batch engine"""
+    import generate_indonesian_dummy_data as generator
+    from faker_pool import FastRandom
+
+    n = args.records
+    print(f"📊 Generation benchmark: {n:,} records, pool size {args.pool_size:,}")
+
+    live_n = max(1, n // 10)
+    start = time.perf_counter()
+    for i in range(live_n):
+        generator._build_record(i, generator.fake, random)
+    _rate("dict loop (live Faker)", live_n, time.perf_counter() - start)
+
+    pool = generator._build_pool(1, args.pool_size)
+    rng = FastRandom(1)
+    pooled = pool.bind(rng)
+    start = time.perf_counter()
+    for i in range(n):
+        generator._build_record(i, pooled, rng)
+    _rate("dict loop (pooled)", n, time.perf_counter() - start)
+
+    try:
+        import numpy as np
+        from columnar_generator import generate_columnar_batch
+        from id_allocator import IdAllocator
+    except ImportError:
+        print("  columnar engine skipped (numpy not installed)")
+        return
+    np_rng = np.random.default_rng(1)
+    ids = IdAllocator(1)
+    start = time.perf_counter()
+    for batch_start in range(0, n, args.batch_size):
+        generate_columnar_batch(min(args.batch_size, n - batch_start), pool, np_rng, ids, batch_start)
+    _rate("columnar batches (NumPy)", n, time.perf_counter() - start)
+
+def bench_memory(args):
+    """Heap held by a list of per-record dicts vs the same records in an ApplicantBatch"""
+    import gc
+    import tracemalloc
+    import generate_indonesian_dummy_data as generator
+    from applicant_batch import ApplicantBatch
+    from faker_pool import FastRandom
+
+    n = args.records
+    print(f"🧠 Memory benchmark: {n:,} records, pool size {args.pool_size:,}")
+    pooled = generator._build_pool(1, args.pool_size)
+
+    def records():
+        rng = FastRandom(1)
+        fake = pooled.bind(rng)
+        return (generator._build_record(i, fake, rng) for i in range(n))
+
+    def measure(build):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        container = build()
+        seconds = time.perf_counter() - start
+        held, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return container, held, seconds
+
+    rows, dict_bytes, dict_seconds = measure(lambda: list(records()))
+    del rows
+    batch, batch_bytes, batch_seconds = measure(
+        lambda: ApplicantBatch.from_records(records(), generator.FIELDNAMES))
+    print(f"  {'list of dicts':<28} {dict_bytes / n:>12,.0f} bytes/record   ({dict_seconds:.2f}s)")
+    print(f"  {'ApplicantBatch':<28} {batch_bytes / n:>12,.0f} bytes/record   ({batch_seconds:.2f}s)")
+    print(f"  {batch!r}: {batch_bytes / dict_bytes:.0%} of the dict memory")
+
+def bench_pdf(args):
+    """Per-form PDF time: template rebuilt per form, compiled FormTemplate, canvas engine"""
+    import tempfile
+    import generate_indonesian_pdf_forms as forms
+    import generate_indonesian_dummy_data as generator
+
+    n = args.forms
+    print(f"📄 PDF benchmark: {n:,} forms, best of {args.repeat} rounds")
+    rows = [generator.generate_record(i, seed=1, pooled=True, pool_size=args.pool_size) for i in range(n)]
+
+    start = time.perf_counter()
+    for _ in range(n):
+        forms.FormTemplate()
+    print(f"  {'FormTemplate() alone':<28} {(time.perf_counter() - start) * 1e6 / n:>12,.1f} us")
+
+    modes = {
+        # What every call used to do: styles, TableStyles and static paragraphs from scratch
+        "template rebuilt per form": lambda row, out: forms.create_indonesian_pdf(
+            row, out, template=forms.FormTemplate()),
+        "compiled FormTemplate": lambda row, out: forms.create_indonesian_pdf(
+            row, out, template=forms.get_form_template()),
+        "fixed-layout canvas engine": lambda row, out: forms.create_indonesian_pdf(
+            row, out, engine='canvas'),
+    }
+    best = dict.fromkeys(modes, float('inf'))
+    with tempfile.TemporaryDirectory() as tmp:
+        for render in modes.values():
+            for row in rows[:10]:
+                render(row, tmp)  # warm up fonts and reportlab caches
+        # Rounds alternate between the modes so drift affects both equally
+        for _ in range(args.repeat):
+            for label, render in modes.items():
+                start = time.perf_counter()
+                for row in rows:
+                    render(row, tmp)
+                best[label] = min(best[label], time.perf_counter() - start)
+    for label, seconds in best.items():
+        _rate(label, n, seconds)
+
+def bench_pdf_document(args):
+    """One multi-applicant PDF: static layout drawn inline vs shared Form XObjects"""
+    import tempfile
+    import generate_indonesian_pdf_forms as forms
+    import generate_indonesian_dummy_data as generator
+
+    n = args.forms
+    print(f"📚 PDF document benchmark: {n:,} forms in one file, best of {args.repeat} rounds")
+    rows = [generator.generate_record(i, seed=1, pooled=True, pool_size=args.pool_size) for i in range(n)]
+    renderer = forms.get_canvas_renderer()
+
+    modes = {"inline layout": False, "Form XObject layout": True}
+    best = dict.fromkeys(modes, float('inf'))
+    sizes = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        renderer.render_document(rows[:10], os.path.join(tmp, 'warmup.pdf'))
+        for _ in range(args.repeat):
+            for label, use_forms in modes.items():
+                path = os.path.join(tmp, f"{use_forms}.pdf")
+                start = time.perf_counter()
+                renderer.render_document(rows, path, use_forms=use_forms)
+                best[label] = min(best[label], time.perf_counter() - start)
+                sizes[label] = os.path.getsize(path)
+    for label, seconds in best.items():
+        _rate(label, n, seconds)
+        print(f"  {'':<28} {sizes[label]:>12,} bytes      ({sizes[label] / n:,.0f} bytes/form)")
+
+def bench_ektp(args):
+    """Per-card e-KTP time: create.py run as a subprocess per card vs the in-process KtpRenderer"""
+    import json
+    import subprocess
+    import tempfile
+    import generate_ektp_images_from_csv as ektp
+    import generate_indonesian_dummy_data as generator
+    from create import KtpRenderer
+
+    n = args.cards
+    print(f"🪪 e-KTP benchmark: {n:,} cards, best of {args.repeat} rounds")
+    src = os.path.dirname(os.path.abspath(__file__))
+    photo = os.path.join(src, 'assets', 'images.jpg')
+    cards = [ektp.ktp_data(generator.generate_record(i, seed=1, pooled=True, pool_size=args.pool_size), photo)
+             for i in range(n)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        def subprocess_per_card(data, out):
+            # What the driver used to do for every row
+            data_json = os.path.join(tmp, 'data.json')
+            with open(data_json, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            subprocess.run([sys.executable, os.path.join(src, 'create.py'), data_json, '-o', out],
+                           check=True, stdout=subprocess.DEVNULL)
+
+        renderer = KtpRenderer()
+        modes = {
+            "subprocess per card": subprocess_per_card,
+            "in-process, render only": lambda data, out: renderer.render(data),
+            "in-process KtpRenderer": renderer.save,
+        }
+        best = dict.fromkeys(modes, float('inf'))
+        for _ in range(args.repeat):
+            for label, render in modes.items():
+                start = time.perf_counter()
+                for i, data in enumerate(cards):
+                    render(data, os.path.join(tmp, f"ktp_{i}.png"))
+                best[label] = min(best[label], time.perf_counter() - start)
+    for label, seconds in best.items():
+        _rate(label, n, seconds)
+    strips = renderer.text_strips
+    print(f"  text strip cache: {strips.hits / (strips.hits + strips.misses):.0%} hits, {len(strips):,} strips")
+
+def bench_ektp_codecs(args):
+    """e-KTP cards/s and bytes/card per output codec, drawn and encoded as the driver does"""
+    import generate_ektp_images_from_csv as ektp
+    import generate_indonesian_dummy_data as generator
+    from card_codec import CardCodec
+    from create import get_ktp_renderer
+
+    n = args.cards
+    threads = args.encode_threads
+    print(f"🗜️  e-KTP codec benchmark: {n:,} cards, {threads} encoder threads, best of {args.repeat} rounds")
+    photo = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'images.jpg')
+    # Archive-style tasks: cards are encoded into memory, so disk speed stays out of it
+    rows = [generator.generate_record(i, seed=1, pooled=True, pool_size=args.pool_size) for i in range(n)]
+    tasks = [(i, row['application_id'], ektp.ktp_data(row, photo), None) for i, row in enumerate(rows, 1)]
+    codecs = [CardCodec.parse(spec) for spec in args.codecs.split(',')]
+
+    renderer = get_ktp_renderer()
+    for task in tasks:
+        renderer.render(task[2])  # warm up the base card and text strips
+    best = {str(codec): float('inf') for codec in codecs}
+    sizes = {}
+    for _ in range(args.repeat):
+        for codec in codecs:
+            start = time.perf_counter()
+            if threads:
+                results = list(ektp._render_pipelined(iter(tasks), codec, threads))
+            else:
+                results = [ektp._render_card(task, codec) for task in tasks]
+            best[str(codec)] = min(best[str(codec)], time.perf_counter() - start)
+            sizes[str(codec)] = sum(len(result[1][1]) for result in results)
+    for label, seconds in best.items():
+        print(f"  {label:<16} {n / seconds:>8,.1f} cards/s   {sizes[label] / n:>10,.0f} bytes/card")
+
+def bench_ektp_tensor(args):
+    """Random-access reads of e-KTP cards: decoding PNG files vs the memmapped tensor export"""
+    import tempfile
+    import numpy as np
+    from PIL import Image
+    import generate_ektp_images_from_csv as ektp
+    import generate_indonesian_dummy_data as generator
+    from card_codec import CardCodec
+    from card_tensor import CardTensor, CardTensorWriter
+    from create import CARD_TEXT, get_ktp_renderer
+
+    n = args.cards
+    print(f"🧮 e-KTP tensor benchmark: {n:,} cards read in random order, best of {args.repeat} rounds")
+    photo = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'images.jpg')
+    rows = [generator.generate_record(i, seed=1, pooled=True, pool_size=args.pool_size) for i in range(n)]
+    renderer = get_ktp_renderer()
+    width, height = renderer.template.size
+    order = list(range(n))
+    random.Random(1).shuffle(order)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        codec = CardCodec()
+        tensor_path = os.path.join(tmp, 'cards.npy')
+        with CardTensorWriter(tensor_path, n, height, width, len(renderer.mode),
+                              [entry[0] for entry in CARD_TEXT]) as tensor:
+            for slot, row in enumerate(rows):
+                task = (slot + 1, row['application_id'], ektp.ktp_data(row, photo),
+                        os.path.join(tmp, f"{slot}.png"))
+                image = ektp._draw_card(task)
+                ektp._encode_card(task, image, codec)
+                tensor.record(slot, task[1], ektp._encode_card(task, image, tensor)[1])
+
+        cards = CardTensor(tensor_path)
+        modes = {
+            "PNG files, decoded": lambda slot: np.asarray(Image.open(os.path.join(tmp, f"{slot}.png"))),
+            # Copying forces every page of the card to be read
+            "tensor memmap": lambda slot: np.array(cards[slot]),
+        }
+        best = dict.fromkeys(modes, float('inf'))
+        for _ in range(args.repeat):
+            for label, read in modes.items():
+                start = time.perf_counter()
+                for slot in order:
+                    read(slot)
+                best[label] = min(best[label], time.perf_counter() - start)
+    for label, seconds in best.items():
+        _rate(label, n, seconds)
+
+def bench_ektp_photos(args):
+    """e-KTP draw time with a photo pool: decoding every card's photo vs cached tiles"""
+    import tempfile
+    from PIL import Image, ImageDraw
+    import generate_ektp_images_from_csv as ektp
+    import generate_indonesian_dummy_data as generator
+    from create import KtpRenderer, PhotoTileCache
+    from photo_pool import PhotoPool
+
+    n = args.cards
+    print(f"🧑 e-KTP photo pool benchmark: {n:,} cards, {args.photos} photos, best of {args.repeat} rounds")
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = os.path.join(tmp, 'photos')
+        os.makedirs(folder)
+        for i in range(args.photos):
+            photo = Image.new('RGB', (600, 800), tuple(rng.randrange(256) for _ in range(3)))
+            ImageDraw.Draw(photo).ellipse((150, 160, 450, 480), fill=(230, 190, 160))
+            photo.save(os.path.join(folder, f"photo{i:04d}.jpg"), quality=90)
+        pool = PhotoPool(folder)
+        rows = [generator.generate_record(i, seed=1, pooled=True, pool_size=args.pool_size) for i in range(n)]
+        cards = [ektp.ktp_data(row, pool.photo_for(row['application_id'])) for row in rows]
+
+        renderer = KtpRenderer()
+        tile_dir = os.path.join(tmp, 'tiles')
+        warm = PhotoTileCache(max(args.photos, 1))
+        modes = {
+            # A one-tile cache misses whenever the photo changes, like decoding per card
+            "decode per card": lambda: PhotoTileCache(1),
+            "in-memory tile cache": lambda: warm,
+            # Fresh in memory every round, as in a later run; the first round fills the directory
+            "on-disk tiles (new run)": lambda: PhotoTileCache(max(args.photos, 1), tile_dir),
+        }
+        for card in cards:
+            renderer.render(card)  # warm up the text strips
+        best = dict.fromkeys(modes, float('inf'))
+        for _ in range(args.repeat):
+            for label, cache in modes.items():
+                renderer.photo_tiles = cache()
+                start = time.perf_counter()
+                for card in cards:
+                    renderer.render(card)
+                best[label] = min(best[label], time.perf_counter() - start)
+    for label, seconds in best.items():
+        _rate(label, n, seconds)
+
+def bench_ektp_fit(args):
+    """Fitting long e-KTP fields: a textlength() call per candidate size vs TextFitter"""
+    import generate_ektp_images_from_csv as ektp
+    import generate_indonesian_dummy_data as generator
+    from create import FIT_WIDTHS, MIN_FIT_SIZE, TextFitter, card_text, get_ktp_renderer
+
+    n = args.records
+    print(f"📏 e-KTP text fitting benchmark: {n:,} cards x {len(FIT_WIDTHS)} fields, best of {args.repeat} rounds")
+    rows = [generator.generate_record(i, seed=1, pooled=True, pool_size=args.pool_size) for i in range(n)]
+    strings = [(text[field], width) for text in (card_text(ektp.ktp_data(row, '')) for row in rows)
+               for field, width in FIT_WIDTHS.items()]
+    base = get_ktp_renderer().fdata
+    fonts = {size: base.font_variant(size=size) for size in range(MIN_FIT_SIZE, base.size + 1)}
+
+    def naive():
+        for text, width in strings:
+            size = base.size
+            while size > MIN_FIT_SIZE and fonts[size].getlength(text) > width:
+                size -= 1
+
+    def fitter(cold):
+        fit = TextFitter(base)
+        def run():
+            for text, width in strings:
+                fit.fit(text, width)
+            if cold:
+                fit.fits = type(fit.fits)(fit.fits.maxsize)
+        return run
+
+    modes = {
+        "textlength per size": naive,
+        "TextFitter, new strings": fitter(cold=True),
+        "TextFitter, memoized": fitter(cold=False),
+    }
+    best = dict.fromkeys(modes, float('inf'))
+    for _ in range(args.repeat):
+        for label, run in modes.items():
+            start = time.perf_counter()
+            run()
+            best[label] = min(best[label], time.perf_counter() - start)
+    overflowing = sum(fonts[base.size].getlength(text) > width for text, width in strings)
+    for label, seconds in best.items():
+        _rate(label, n, seconds)
+    print(f"  {overflowing:,} of {len(strings):,} strings needed a smaller size")
+
+# Modules that a plain import of each entry point must not pull in
+STARTUP_FORBIDDEN = {
+    'cli': ('faker', 'reportlab', 'numpy', 'PIL'),
+    'generate_indonesian_dummy_data': ('faker', 'reportlab', 'numpy'),
+    'dataset_store': ('faker', 'reportlab', 'numpy'),
+}
+
+def bench_startup(args):
+    """Wall time of short CLI runs; fails if a run exceeds the budget or an import turns eager"""
+    import subprocess
+    import tempfile
+
+    src = os.path.dirname(os.path.abspath(__file__))
+    cli = os.path.join(src, 'cli.py')
+    print(f"🚀 Startup benchmark: best of {args.repeat} runs, budget {args.max_startup:.2f}s")
+    failures = []
+
+    for module, forbidden in STARTUP_FORBIDDEN.items():
+        probe = (f"import sys; import {module}; "
+                 f"print(','.join(m for m in {forbidden!r} if m in sys.modules))")
+        loaded = subprocess.run([sys.executable, '-c', probe], cwd=src, check=True,
+                                capture_output=True, text=True).stdout.strip()
+        status = "ok" if not loaded else f"EAGER: {loaded}"
+        print(f"  import {module:<36} {status}")
+        if loaded:
+            failures.append(f"import {module} loads {loaded}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = {
+            "cli.py --help": [cli, '--help'],
+            "cli.py data --help": [cli, 'data', '--help'],
+            f"cli.py data -n {args.startup_records}": [
+                cli, 'data', '-n', str(args.startup_records), '--seed', '1',
+                '-o', os.path.join(tmp, 'startup.csv')],
+        }
+        for label, command in runs.items():
+            best = float('inf')
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                subprocess.run([sys.executable] + command, check=True, stdout=subprocess.DEVNULL)
+                best = min(best, time.perf_counter() - start)
+            over = best > args.max_startup
+            print(f"  {label:<43} {best * 1000:>8.0f} ms{'   OVER BUDGET' if over else ''}")
+            if over:
+                failures.append(f"{label} took {best:.2f}s")
+
+    if failures:
+        print("❌ Startup regression: " + "; ".join(failures))
+        raise SystemExit(1)
+    print("✅ Startup within budget")
+
+BENCHMARKS = {
+    'ektp': bench_ektp,
+    'ektp-codecs': bench_ektp_codecs,
+    'ektp-fit': bench_ektp_fit,
+    'ektp-photos': bench_ektp_photos,
+    'ektp-tensor': bench_ektp_tensor,
+    'generation': bench_generation,
+    'memory': bench_memory,
+    'pdf': bench_pdf,
+    'pdf-document': bench_pdf_document,
+    'startup': bench_startup,
+}
+
+def main(argv=None):
+    """Command-line entry point (also used by `cli.py benchmark`)"""
+    parser = argparse.ArgumentParser(description="Run performance benchmarks")
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS), help="Benchmark to run")
+    parser.add_argument('-n', '--records', type=int, default=20000, help="Records per benchmark")
+    parser.add_argument('--pool-size', type=int, default=8192, help="FakerPool size")
+    parser.add_argument('--batch-size', type=int, default=65536, help="Columnar batch size")
+    parser.add_argument('--forms', type=int, default=200, help="Forms rendered by the pdf benchmarks")
+    parser.add_argument('--cards', type=int, default=20, help="Cards rendered by the ektp benchmark")
+    parser.add_argument('--photos', type=int, default=50, help="Photos in the ektp-photos pool")
+    parser.add_argument('--codecs', default='png,png:1,png-palette,jpeg:90,webp:80',
+                        help="Comma-separated codec specs for the ektp-codecs benchmark")
+    parser.add_argument('--encode-threads', type=int, default=2, help="Encoder threads for ektp-codecs")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per startup measurement (best is kept)")
+    parser.add_argument('--max-startup', type=float, default=1.0, help="Startup budget per run in seconds")
+    parser.add_argument('--startup-records', type=int, default=10, help="Records in the small startup run")
+    args = parser.parse_args(argv)
+    BENCHMARKS[args.benchmark](args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import io
+
+from PIL import Image
+
+# name -> (Pillow format, file extension, option name, default)
+CODECS = {
+    'png': ('PNG', '.png', 'compress_level', 6),
+    'png-palette': ('PNG', '.png', 'colors', 256),
+    'jpeg': ('JPEG', '.jpg', 'quality', 90),
+    'webp': ('WEBP', '.webp', 'quality', 80),
+}
+
+class CardCodec:
+    """How rendered cards are encoded: a codec from CODECS and its setting
+
+    Specs look like 'png' or 'png:1' (zlib compress level 0-9), 'jpeg:85' and
+    'webp:80' (quality 0-100), 'png-palette:64' (quantized to that many
+    colors, then written as an 8-bit PNG). 'png' without a level writes the
+    same files as before codecs were selectable.
+    """
+
+    def __init__(self, name='png', value=None):
+        if name not in CODECS:
+            raise ValueError(f"Unknown codec {name!r}; expected one of {', '.join(CODECS)}")
+        self.name = name
+        self.format, self.extension, self.option, default = CODECS[name]
+        self.value = default if value is None else value
+        low, high = {'compress_level': (0, 9), 'colors': (2, 256), 'quality': (0, 100)}[self.option]
+        if not low <= self.value <= high:
+            raise ValueError(f"{name} {self.option} must be between {low} and {high}, got {self.value}")
+
+    @classmethod
+    def parse(cls, spec):
+        """CardCodec from 'name' or 'name:value'"""
+        name, _, value = spec.partition(':')
+        try:
+            return cls(name, int(value) if value else None)
+        except ValueError as e:
+            if value and not value.isdigit():
+                raise ValueError(f"Codec setting must be a whole number, got {spec!r}") from e
+            raise
+
+    def __str__(self):
+        return f"{self.name}:{self.value}"
+
+    def __repr__(self):
+        return f"CardCodec({self.name!r}, {self.value!r})"
+
+    def encode(self, image):
+        """The encoded file contents of `image`"""
+        buffer = io.BytesIO()
+        if self.name == 'png-palette':
+            image = image.quantize(self.value, method=Image.Quantize.FASTOCTREE)
+            image.save(buffer, self.format, optimize=False)
+        else:
+            image.save(buffer, self.format, **{self.option: self.value})
+        return buffer.getvalue()
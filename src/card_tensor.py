@@ -0,0 +1,115 @@
+import json
+import os
+
+import numpy as np
+
+# <name>.npy holds the pixels, <name>.labels.json the rows they belong to
+LABELS_SUFFIX = '.labels.json'
+
+def labels_path(tensor_path):
+    return os.path.splitext(tensor_path)[0] + LABELS_SUFFIX
+
+class CardTensorWriter:
+    """Render sink that puts cards straight into one N×H×W×C uint8 array on disk
+
+    The array is a preallocated .npy file opened as np.memmap, so np.load()
+    (or CardTensor) maps it back without decoding anything. Slot i holds the
+    card of row i. The labels sidecar is JSON:
+    {"fields": ["application_id", <card_text() fields>], "rows": [[...], ...],
+     "shape": [N, H, W, C]}; rows are streamed as they are recorded, and a
+    card that failed to render keeps a zero slot and null strings.
+
+    Pickled into worker processes the writer only keeps its path; store()
+    there opens the same file read-write and fills the slot in place, so the
+    pixels never travel back to the main process.
+    """
+
+    def __init__(self, path, count, height, width, channels=3, fields=()):
+        self.path = path
+        self.shape = (count, height, width, channels)
+        self.fields = ('application_id',) + tuple(fields)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.cards = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8, shape=self.shape)
+        self.labels_path = labels_path(path)
+        self._labels = open(self.labels_path, 'w', encoding='utf-8')
+        self._labels.write(f'{{"fields": {json.dumps(self.fields)},\n"rows": [')
+        self.rows = 0
+
+    def __getstate__(self):
+        return {'path': self.path, 'shape': self.shape, 'fields': self.fields}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state, cards=None, _labels=None, rows=0)
+
+    def store(self, slot, image):
+        """Copy a rendered PIL image into its slot"""
+        if self.cards is None:
+            self.cards = np.load(self.path, mmap_mode='r+')
+        self.cards[slot] = np.asarray(image)
+
+    def record(self, slot, key, strings):
+        """Labels of `slot` (strings by field, None if the card failed); slots are recorded in order"""
+        if slot != self.rows:
+            raise ValueError(f"Card {slot} recorded out of order; expected {self.rows}")
+        fields = self.fields[1:]
+        row = [key] + ([strings[field] for field in fields] if strings is not None else [None] * len(fields))
+        self._labels.write((',\n' if self.rows else '\n') + json.dumps(row, ensure_ascii=False))
+        self.rows += 1
+
+    def close(self, check=True):
+        """Finish the labels sidecar; with `check`, raise ValueError unless every slot was recorded"""
+        if self._labels is None:
+            return
+        self._labels.write(f'\n],\n"shape": {json.dumps(self.shape)}}}\n')
+        self._labels.close()
+        self._labels = None
+        self.cards.flush()
+        self.cards = None
+        if check and self.rows != self.shape[0]:
+            raise ValueError(f"{self.path} has room for {self.shape[0]} cards but {self.rows} were recorded")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # A render that failed midway leaves slots unrecorded; let its error propagate
+        self.close(check=exc_type is None)
+
+class CardTensor:
+    """Zero-copy random access to a CardTensorWriter export
+
+    cards[i] (or tensor[i]) is an H×W×C view into the mapped file; nothing is
+    read from disk until its pixels are touched. labels(i) gives the
+    ground-truth strings drawn on card i.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.cards = np.load(path, mmap_mode='r')
+        with open(labels_path(path), encoding='utf-8') as f:
+            sidecar = json.load(f)
+        self.fields = sidecar['fields']
+        self._rows = sidecar['rows']
+        self._slots = None
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __getitem__(self, slot):
+        return self.cards[slot]
+
+    def labels(self, slot):
+        """{field: string} of card `slot`, application_id included"""
+        return dict(zip(self.fields, self._rows[slot]))
+
+    @property
+    def application_ids(self):
+        return [row[0] for row in self._rows]
+
+    def slot(self, application_id):
+        """Slot of the card of `application_id`"""
+        if self._slots is None:
+            self._slots = {row[0]: slot for slot, row in enumerate(self._rows)}
+        return self._slots[application_id]
@@ -0,0 +1,38 @@
+import importlib
+import os
+import sys
+
+# Keep this module free of heavy imports: the scheduler starts it once per
+# small batch, so only the module behind the chosen command gets loaded.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+COMMANDS = {
+    'data': ('generate_indonesian_dummy_data', "Generate job application data (CSV)"),
+    'pdf': ('generate_indonesian_pdf_forms', "Render PDF application forms"),
+    'ektp': ('generate_ektp_images_from_csv', "Render e-KTP images"),
+    'store': ('dataset_store', "Convert between CSV and the binary .ijad dataset"),
+    'benchmark': ('benchmark', "Run a performance benchmark"),
+}
+
+def usage():
+    lines = ["usage: cli.py <command> [args...]", "", "commands:"]
+    lines += [f"  {name:<10} {description}" for name, (_, description) in COMMANDS.items()]
+    lines += ["", "Run `cli.py <command> --help` for the options of a command."]
+    return "\n".join(lines)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ('-h', '--help'):
+        print(usage())
+        return 0
+    command, rest = argv[0], argv[1:]
+    if command not in COMMANDS:
+        print(f"cli.py: unknown command {command!r}\n\n{usage()}", file=sys.stderr)
+        return 2
+    module = importlib.import_module(COMMANDS[command][0])
+    sys.argv = [f"cli.py {command}"] + rest
+    module.main(rest)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
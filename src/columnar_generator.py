@@ -0,0 +1,367 @@
+import csv
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from faker_pool import DEFAULT_POOL_SIZE, _years_before
+from generate_indonesian_dummy_data import (
+    EXPERIENCE_LEVELS, FIELDNAMES, GENERAL_SKILLS, INDONESIAN_CERTIFICATIONS, INDONESIAN_CITIES,
+    INDONESIAN_COMPANIES, INDONESIAN_LANGUAGES, INDONESIAN_UNIVERSITIES, JOB_CATEGORIES,
+    JOB_CATEGORY_NAMES, MAJORS_BY_CATEGORY, PHONE_PREFIXES,
+    SALARY_RANGES_IDR, _build_pool, derive_seed,
+)
+from id_allocator import NIK_PROVINCE_CODES, IdAllocator
+
+DEFAULT_BATCH_SIZE = 65536
+
+class _Grouped:
+    """Option lists per group flattened into one array with offsets, for vectorised lookups"""
+
+    def __init__(self, options_by_group):
+        self.sizes = np.array([len(options) for options in options_by_group], dtype=np.int64)
+        self.offsets = np.concatenate(([0], np.cumsum(self.sizes)[:-1])).astype(np.int64)
+        self.values = np.array([value for options in options_by_group for value in options], dtype=object)
+
+    def pick(self, rng, groups):
+        """One option per row from the option list of that row's group"""
+        sizes = self.sizes[groups]
+        return self.values[self.offsets[groups] + (rng.random(len(groups)) * sizes).astype(np.int64)]
+
+    def sample(self, rng, groups, counts):
+        """counts[i] distinct options per row (like random.sample), as a list of lists"""
+        sizes = self.sizes[groups]
+        width = int(self.sizes.max())
+        keys = rng.random((len(groups), width))
+        # Slots past the end of a row's option list sort last and are never taken
+        keys[np.arange(width) >= sizes[:, None]] = 2.0
+        take = int(counts.max()) if len(counts) else 0
+        order = np.argsort(keys, axis=1)[:, :take]
+        picked = self.values[self.offsets[groups][:, None] + order].tolist()
+        return [row[:count] for row, count in zip(picked, counts.tolist())]
+
+def _options(values):
+    return np.asarray(values, dtype=object)
+
+def _pick(rng, values, n):
+    """Uniform choice from a sequence of options for n rows"""
+    return _options(values)[rng.integers(0, len(values), n)]
+
+def _coin(rng, n, true_weight=1, total=2):
+    """Vectorised rng.choice((True, False, ...)) with true_weight Trues out of total"""
+    return rng.integers(0, total, n) < true_weight
+
+def _blank_unless(mask, values):
+    return np.where(mask, values, '')
+
+def _join(rows):
+    return [', '.join(row) for row in rows]
+
+def _date_strings(first_day, last_day, fmt):
+    """Every date in [first_day, last_day] formatted once, for index lookups"""
+    return _options([(first_day + timedelta(days=d)).strftime(fmt)
+                     for d in range((last_day - first_day).days + 1)])
+
+def _phones(rng, n):
+    prefixes = _pick(rng, PHONE_PREFIXES, n).tolist()
+    a = rng.integers(1000, 10000, n).tolist()
+    b = rng.integers(1000, 10000, n).tolist()
+    return _options([f"+62 {p[1:]}-{x}-{y}" for p, x, y in zip(prefixes, a, b)])
+
+class _Tables:
+    """Static lookup tables, built once per process"""
+
+    def __init__(self):
+        categories = JOB_CATEGORY_NAMES
+        self.positions = _Grouped([JOB_CATEGORIES[c]["positions"] for c in categories])
+        self.skills = _Grouped([JOB_CATEGORIES[c]["skills"] + GENERAL_SKILLS for c in categories])
+        self.companies = _Grouped([INDONESIAN_COMPANIES.get(c, ["PT Generic Indonesia"]) for c in categories])
+        self.certifications = _Grouped([INDONESIAN_CERTIFICATIONS.get(c, []) for c in categories])
+        self.majors = _Grouped([MAJORS_BY_CATEGORY.get(c, ["Umum"]) for c in categories])
+        # Education choices grouped by experience level, same rules as _build_record()
+        self.education = _Grouped([
+            ("S1 (Sarjana)", "D3 (Diploma)") if level in ("Entry Level", "1-3 tahun")
+            else ("S1 (Sarjana)", "S2 (Magister)") if level in ("3-5 tahun", "5-8 tahun")
+            else ("S2 (Magister)", "S3 (Doktor)", "S1 (Sarjana)")
+            for level in EXPERIENCE_LEVELS
+        ])
+        self.languages = _Grouped([INDONESIAN_LANGUAGES])
+        self.programming = _Grouped([['Python', 'Java', 'JavaScript', 'PHP', 'SQL', 'R']])
+        self.salary_min = np.array([SALARY_RANGES_IDR[level][0] for level in EXPERIENCE_LEVELS], dtype=np.int64)
+        self.salary_max = np.array([SALARY_RANGES_IDR[level][1] for level in EXPERIENCE_LEVELS], dtype=np.int64)
+        self.certificate_counts = np.minimum(3, self.certifications.sizes)
+        self.teknologi = categories.index('Teknologi')
+        self.pemasaran = categories.index('Pemasaran')
+
+        today = date.today()
+        self.today = today
+        self.application_dates = _date_strings(today - timedelta(days=60), today, '%d/%m/%Y')
+        self.start_dates = _date_strings(today, today + timedelta(days=90), '%d/%m/%Y')
+        # Same birth date window as Faker's date_of_birth(minimum_age=22, maximum_age=65)
+        self.birth_first = _years_before(today, 66) + timedelta(days=1)
+        birth_last = _years_before(today, 22)
+        self.birth_dates_slash = _date_strings(self.birth_first, birth_last, '%d/%m/%Y')
+        self.birth_dates_dash = _date_strings(self.birth_first, birth_last, '%d-%m-%Y')
+
+_tables = None
+
+def _get_tables():
+    global _tables
+    if _tables is None or _tables.today != date.today():
+        _tables = _Tables()
+    return _tables
+
+def _niks(ids, start_index, n):
+    """Vectorised IdAllocator.nik() for a contiguous index range"""
+    values = ids.nik_numbers(np.arange(start_index, start_index + n, dtype=np.uint64)).astype(np.int64)
+    values, serial = np.divmod(values, 900000)
+    province, regency = np.divmod(values, 90 * 90)
+    regency, district = np.divmod(regency, 90)
+    codes = _options(NIK_PROVINCE_CODES)[province].tolist()
+    return [f"{code}{r}{d}{s}" for code, r, d, s
+            in zip(codes, (regency + 10).tolist(), (district + 10).tolist(), (serial + 100000).tolist())]
+
+def generate_columnar_batch(num_records, pool, rng, ids, start_index=0):
+    """Generate num_records applications as columns ({field: list}) with NumPy
+
+    `pool` is a FakerPool supplying the Faker-derived values, `rng` a
+    numpy Generator and `ids` the IdAllocator for application_id/NIK. All categorical draws, bounded integers and the
+    conditional rules of _build_record() (positions/skills/companies by
+    category, education and salary by experience) are evaluated per column.
+    """
+    n = num_records
+    t = _get_tables()
+    pools = {name: _options(values) for name, values in pool.pools.items()}
+
+    def faker(method, count=n):
+        values = pools[method]
+        return values[rng.integers(0, len(values), count)]
+
+    cols = {}
+
+    # Category, position and names
+    category = rng.integers(0, len(JOB_CATEGORY_NAMES), n)
+    position = t.positions.pick(rng, category)
+    male = _coin(rng, n)
+    first_name = np.where(male, faker('first_name_male'), faker('first_name_female'))
+    last_name = faker('last_name')
+
+    # Experience, salary and education
+    experience = rng.integers(0, len(EXPERIENCE_LEVELS), n)
+    salary_min = t.salary_min[experience]
+    desired_salary = salary_min + (rng.random(n) * (t.salary_max[experience] - salary_min + 1)).astype(np.int64)
+    education_level = t.education.pick(rng, experience)
+
+    # Work history, skills, certifications
+    previous_companies = t.companies.sample(rng, category, np.minimum(3, t.companies.sizes[category]))
+    selected_skills = t.skills.sample(rng, category, rng.integers(5, 9, n))
+    selected_certs = t.certifications.sample(rng, category, (rng.random(n) * (t.certificate_counts[category] + 1)).astype(np.int64))
+
+    # References: 2-4 are drawn per applicant, only the first three are kept
+    reference_count = rng.integers(2, 5, n)
+    references = []
+    ref_company_slot = rng.integers(0, 3, (3, n)).tolist()
+    for slot in range(3):
+        names = zip(faker('first_name').tolist(), faker('last_name').tolist())
+        titles = faker('job').tolist()
+        phones = faker('phone_number').tolist()
+        emails = faker('email').tolist()
+        present = (reference_count > slot).tolist()
+        references.append([
+            f"{first} {last}, {title} di {companies[choice % len(companies)]}, {phone}, {email}" if keep else ''
+            for (first, last), title, companies, choice, phone, email, keep
+            in zip(names, titles, previous_companies, ref_company_slot[slot], phones, emails, present)
+        ])
+
+    work_authorization = _pick(rng, ("WNI (Warga Negara Indonesia)", "WNA dengan Work Permit", "Permanent Resident"), n)
+    city = _pick(rng, INDONESIAN_CITIES, n)
+
+    languages = t.languages.sample(rng, np.zeros(n, dtype=np.int64), rng.integers(2, 5, n))
+
+    first_list = first_name.tolist()
+    last_list = last_name.tolist()
+    first_lower = [name.lower() for name in first_list]
+    last_lower = [name.lower() for name in last_list]
+    full_name = [f"{first} {last}" for first, last in zip(first_list, last_list)]
+    birth_span = len(t.birth_dates_slash)
+    is_teknologi = category == t.teknologi
+    is_portfolio_category = is_teknologi | (category == t.pemasaran)
+
+    # Application Info
+    cols['application_id'] = [ids.application_id(i) for i in range(start_index, start_index + n)]
+    cols['application_date'] = t.application_dates[rng.integers(0, len(t.application_dates), n)]
+    cols['application_status'] = _pick(rng, ('Pending', 'Under Review', 'Interview Scheduled'), n)
+
+    # Personal Information
+    cols['first_name'] = first_list
+    cols['middle_name'] = _blank_unless(_coin(rng, n), faker('first_name'))
+    cols['last_name'] = last_list
+    cols['preferred_name'] = _blank_unless(_coin(rng, n, 1, 3), first_name)
+    cols['gender'] = np.where(male, 'Male', 'Female')
+    cols['date_of_birth'] = t.birth_dates_slash[rng.integers(0, birth_span, n)]
+    cols['nik'] = _niks(ids, start_index, n)
+
+    # e-KTP specific fields
+    cols['full_name'] = full_name
+    cols['birth_place'] = faker('city')
+    cols['birth_date'] = t.birth_dates_dash[rng.integers(0, birth_span, n)]
+    cols['blood_type'] = _pick(rng, ('A', 'B', 'AB', 'O', '-'), n)
+    cols['address'] = faker('street_address')
+    cols['rt_rw'] = [f"{rt:03d}/{rw:03d}" for rt, rw in zip(rng.integers(1, 21, n).tolist(), rng.integers(1, 16, n).tolist())]
+    cols['village_kelurahan'] = [f"{suffix} {name}" for suffix, name in zip(faker('city_suffix').tolist(), faker('city').tolist())]
+    cols['district_kecamatan'] = ["Kecamatan " + name for name in faker('city').tolist()]
+    cols['religion'] = _pick(rng, ('Islam', 'Kristen', 'Katolik', 'Hindu', 'Buddha', 'Konghucu', 'Lainnya'), n)
+    cols['marital_status'] = _pick(rng, ('Belum Menikah', 'Menikah', 'Duda/Janda'), n)
+    cols['occupation'] = faker('job')
+    cols['nationality'] = ['WNI'] * n
+    cols['valid_until'] = ['SEUMUR HIDUP'] * n
+    cols['province'] = faker('state')
+    cols['regency_city'] = city
+
+    # Contact Information
+    cols['email'] = [f"{first}.{last}@{domain}" for first, last, domain in zip(first_lower, last_lower, faker('domain_name').tolist())]
+    cols['phone_primary'] = _phones(rng, n)
+    cols['phone_secondary'] = _blank_unless(_coin(rng, n, 1, 3), _phones(rng, n))
+    cols['address_street'] = faker('street_address')
+    cols['address_city'] = city
+    cols['address_province'] = faker('state')
+    cols['address_postal_code'] = faker('postcode')
+    cols['address_country'] = ['Indonesia'] * n
+    cols['linkedin_profile'] = [f"https://linkedin.com/in/{first}-{last}-{suffix}"
+                                for first, last, suffix in zip(first_lower, last_lower, rng.integers(100, 1000, n).tolist())]
+    website = _coin(rng, n, 1, 4).tolist()
+    cols['personal_website'] = [f"https://{first}{last}.com" if keep else ''
+                                for first, last, keep in zip(first_lower, last_lower, website)]
+
+    # Position Information
+    cols['position_applied'] = position
+    cols['department'] = _options(JOB_CATEGORY_NAMES)[category]
+    cols['employment_type'] = _pick(rng, ('Full-time', 'Part-time', 'Contract', 'Magang'), n)
+    cols['desired_salary'] = [f"Rp {salary:,}" for salary in desired_salary.tolist()]
+    cols['salary_negotiable'] = _pick(rng, ('Ya', 'Tidak'), n)
+    cols['start_date_available'] = t.start_dates[rng.integers(0, len(t.start_dates), n)]
+    cols['notice_period'] = _pick(rng, ('Segera', '2 minggu', '1 bulan', '2 bulan'), n)
+
+    # Work Authorization
+    cols['work_authorization'] = work_authorization
+    cols['visa_status'] = np.where(work_authorization == 'WNA dengan Work Permit', 'Work Permit', 'N/A')
+    cols['willing_to_relocate'] = _pick(rng, ("Ya", "Tidak", "Dalam Pulau Jawa saja", "Dalam kota saja"), n)
+    cols['remote_work_preference'] = _pick(rng, ("Fully Remote", "Hybrid", "Work from Office", "Fleksibel"), n)
+    cols['travel_willingness'] = [f"{value}%" for value in rng.integers(0, 51, n).tolist()]
+
+    # Education
+    cols['education_level'] = education_level
+    cols['university_name'] = _pick(rng, INDONESIAN_UNIVERSITIES, n)
+    cols['degree_major'] = t.majors.pick(rng, category)
+    cols['degree_minor'] = _blank_unless(_coin(rng, n, 1, 3), t.majors.pick(rng, category))
+    cols['graduation_year'] = rng.integers(2010, 2025, n)
+    gpa = np.round(rng.uniform(3.0, 4.0, n), 2).tolist()
+    cols['gpa'] = [value if keep else '' for value, keep in zip(gpa, _coin(rng, n).tolist())]
+    cols['academic_honors'] = _blank_unless(
+        _coin(rng, n, 1, 3),
+        _pick(rng, ('Magna Cum Laude', 'Cum Laude', 'Dean\'s List', 'Wisudawan Terbaik', ''), n))
+
+    # Professional Experience
+    cols['total_experience'] = _options(EXPERIENCE_LEVELS)[experience]
+    cols['current_employer'] = t.companies.pick(rng, category)
+    cols['current_position'] = faker('job')
+    current_min = (desired_salary * 0.8).astype(np.int64)
+    current_max = (desired_salary * 1.1).astype(np.int64)
+    current_salary = current_min + (rng.random(n) * (current_max - current_min + 1)).astype(np.int64)
+    cols['current_salary'] = [f"Rp {salary:,}" for salary in current_salary.tolist()]
+    cols['previous_employer_1'] = [companies[0] for companies in previous_companies]
+    cols['previous_position_1'] = faker('job')
+    cols['previous_employer_2'] = [companies[1] for companies in previous_companies]
+    cols['previous_position_2'] = faker('job')
+    cols['reason_for_leaving'] = _pick(rng, ('Pengembangan Karir', 'Peluang Lebih Baik', 'Relokasi', 'Restrukturisasi Perusahaan', 'Mencari Tantangan Baru'), n)
+
+    # Skills & Qualifications
+    cols['technical_skills'] = _join(skills[:4] for skills in selected_skills)
+    cols['soft_skills'] = _join(skills[4:] for skills in selected_skills)
+    programming = t.programming.sample(rng, np.zeros(n, dtype=np.int64), rng.integers(2, 5, n))
+    cols['programming_languages'] = [', '.join(langs) if tech else ''
+                                     for langs, tech in zip(programming, is_teknologi.tolist())]
+    cols['certifications'] = [', '.join(certs) if certs else 'Tidak ada' for certs in selected_certs]
+    cols['languages_spoken'] = _join(languages)
+
+    # Additional Information
+    cols['cover_letter_submitted'] = _pick(rng, ('Ya', 'Tidak'), n)
+    portfolio = (is_portfolio_category & _coin(rng, n)).tolist()
+    cols['portfolio_url'] = [f"https://portfolio.{first}{last}.com" if keep else ''
+                             for first, last, keep in zip(first_lower, last_lower, portfolio)]
+    github = (is_teknologi & _coin(rng, n)).tolist()
+    cols['github_profile'] = [f"https://github.com/{first}{last}{suffix}" if keep else ''
+                              for first, last, suffix, keep
+                              in zip(first_lower, last_lower, rng.integers(10, 100, n).tolist(), github)]
+
+    # Background Check
+    cols['criminal_background'] = _pick(rng, ('Tidak', 'Tidak', 'Tidak', 'Ya'), n)
+    cols['drug_test_consent'] = _pick(rng, ('Ya', 'Tidak'), n)
+    cols['reference_check_consent'] = ['Ya'] * n
+
+    # References
+    cols['reference_1'], cols['reference_2'], cols['reference_3'] = references
+    cols['emergency_contact_name'] = [f"{first} {last}" for first, last in zip(faker('first_name').tolist(), faker('last_name').tolist())]
+    cols['emergency_contact_relationship'] = _pick(rng, ('Suami/Istri', 'Orang Tua', 'Saudara', 'Teman'), n)
+    cols['emergency_contact_phone'] = _phones(rng, n)
+
+    # Preferences
+    cols['preferred_work_schedule'] = _pick(rng, ('Standar (9-17)', 'Jam Fleksibel', 'Mulai Pagi', 'Mulai Siang'), n)
+    cols['overtime_availability'] = _pick(rng, ('Ya', 'Terbatas', 'Tidak'), n)
+    cols['weekend_availability'] = _pick(rng, ('Ya', 'Kadang-kadang', 'Tidak'), n)
+
+    # How they found the job
+    cols['how_found_position'] = _pick(rng, ('Website Perusahaan', 'LinkedIn', 'JobStreet', 'Karir.com', 'Referensi', 'Job Fair', 'Recruiter'), n)
+    referral = _coin(rng, n, 1, 3).tolist()
+    cols['referral_source'] = [f"{first} {last}" if keep else ''
+                               for first, last, keep in zip(faker('first_name').tolist(), faker('last_name').tolist(), referral)]
+
+    # Additional Questions
+    cols['why_interested'] = [f"Saya tertarik dengan posisi ini karena {sentence} dan ingin berkontribusi untuk kemajuan perusahaan."
+                              for sentence in faker('sentence').tolist()]
+    skill_pick = rng.random(n).tolist()
+    cols['career_goals'] = [f"Tujuan karir saya adalah {sentence} dan mengembangkan keahlian dalam {skills[int(u * len(skills))]}."
+                            for sentence, skills, u in zip(faker('sentence').tolist(), selected_skills, skill_pick)]
+    cols['greatest_strength'] = _pick(rng, ('Problem Solving', 'Kepemimpinan', 'Komunikasi', 'Keahlian Teknis', 'Kerja Tim'), n)
+    cols['biggest_weakness'] = _pick(rng, ('Perfeksionis', 'Public Speaking', 'Delegasi', 'Manajemen Waktu'), n)
+
+    # Indonesian specific fields
+    bpjs = _coin(rng, n).tolist()
+    cols['bpjs_number'] = [f"BPJS-{value}" if keep else ''
+                           for value, keep in zip(rng.integers(10000000, 100000000, n).tolist(), bpjs)]
+    npwp_parts = zip(*(part.tolist() for part in (
+        rng.integers(10, 100, n), rng.integers(100, 1000, n), rng.integers(100, 1000, n),
+        rng.integers(1, 10, n), rng.integers(100, 1000, n), rng.integers(100, 1000, n),
+        _coin(rng, n))))
+    cols['npwp_number'] = [f"{a}.{b}.{c}.{d}-{e}.{f}" if keep else '' for a, b, c, d, e, f, keep in npwp_parts]
+
+    # Signature and Consent
+    cols['electronic_signature'] = full_name
+    cols['signature_date'] = [datetime.now().strftime('%d/%m/%Y')] * n
+    cols['terms_accepted'] = ['Ya'] * n
+    cols['privacy_policy_accepted'] = ['Ya'] * n
+
+    return {field: (cols[field].tolist() if isinstance(cols[field], np.ndarray) else cols[field])
+            for field in FIELDNAMES}
+
+def iter_columnar_batches(num_records, seed=None, pool_size=DEFAULT_POOL_SIZE,
+                          batch_size=DEFAULT_BATCH_SIZE, start_index=0):
+    """Yield columnar batches covering num_records applications"""
+    pool = _build_pool(seed, pool_size)
+    rng = np.random.default_rng(None if seed is None else derive_seed(seed, 'columnar'))
+    ids = IdAllocator(seed)
+    end = start_index + num_records
+    for batch_start in range(start_index, end, batch_size):
+        yield generate_columnar_batch(min(batch_size, end - batch_start), pool, rng, ids, batch_start)
+
+def save_columnar_to_csv(batches, filename='indonesian_job_applications.csv'):
+    """Write columnar batches to CSV without materialising per-row dicts"""
+    total = 0
+    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(FIELDNAMES)
+        for batch in batches:
+            writer.writerows(zip(*(batch[field] for field in FIELDNAMES)))
+            total += len(batch['application_id'])
+    print(f"✅ Generated {total} realistic Indonesian records and saved to {filename}")
+    print(f"📊 Total columns: {len(FIELDNAMES)}")
+    return total
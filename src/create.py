@@ -1,65 +1,345 @@
-from PIL import Image, ImageDraw, ImageFont
-# from datetime import date
-import json
-
-# font size list
-size=[25,32,16,40]
-
-# Open file data.json
-f=open("data.json")
-data=json.load(f)
-
-# open template
-tmp=Image.open("src/assets/Template.png")
-
-# open second image for pas photo
-pas_photo=Image.open(data["pas_photo"])
-
-# Font list
-font=["src/font/Arrial.ttf", "src/font/Sign.ttf","src/font/Ocr.ttf"]
-# Font for provinsi
-fprov=ImageFont.truetype(font[0], size[0])
-# Font for NIK
-fnik=ImageFont.truetype(font[2],size[1])
-# Font for data
-fdata=ImageFont.truetype(font[0],size[2])
-# Font for signature
-fsign=ImageFont.truetype(font[1],size[3])
-
-# Create condition if photo size not same 432
-if pas_photo.size[0] != 432:
-	croped = pas_photo.crop((0,0,432,450))
-	csize = croped.resize((round(pas_photo.size[0]*0.4), round(pas_photo.size[1]*0.4)))
-	tmp.paste(csize, (520,140))
-else:
-	csize = pas_photo.resize((round(pas_photo.size[0]*0.4), round(pas_photo.size[1]*0.4)))
-	tmp.paste(csize, (520,140))
-
-# sign
-s = data["nama"].split()
-sign=s[0]
-print("[XXX]GENERATE FAKE E-KTP SUCCESS")
-print(data)
-
-# Draw in Image
-write=ImageDraw.Draw(tmp)
-write.text((380,45), f"PROVINSI {data['provinsi'].upper()}", fill=("black"), font=fprov, anchor="ms")
-write.text((380,70), f"KOTA {data['kota'].upper()}", fill=("black"), font=fprov, anchor="ms")
-write.text((170,105), data["nik"], fill=("black"), font=fnik, anchor="lt")
-write.text((190,145), data["nama"].upper(), fill=("black"), font=fdata, anchor="lt")
-write.text((190,168), data["ttl"].upper(), fill=("black"), font=fdata, anchor="lt")
-write.text((190,191), data["jenis_kelamin"].upper(), fill=("black"), font=fdata, anchor="lt")
-write.text((463,190), data["golongan_darah"].upper(),fill=("black"), font=fdata, anchor="lt")
-write.text((190,212), data["alamat"].upper(), fill=("black"), font=fdata, anchor="lt")
-write.text((190,234), data["rt/rw"].upper(), fill=("black"), font=fdata, anchor="lt")
-write.text((190,257), data["kel/desa"].upper(), fill=("black"), font=fdata, anchor="lt")
-write.text((190,279), data["kecamatan"].upper(), fill=("black"), font=fdata, anchor="lt")
-write.text((190,300), data["agama"].upper(), fill=("black"), font=fdata, anchor="lt")
-write.text((190,323), data["status"].upper(), fill=("black"), font=fdata, anchor="lt")
-write.text((190,346), data["pekerjaan"].upper(), fill=("black"), font=fdata, anchor="lt")
-write.text((190,369), data["kewarganegaraan"].upper(), fill=("black"), font=fdata, anchor="lt")
-write.text((190,390), data["masa_berlaku"].upper(), fill=("black"), font=fdata, anchor="lt")
-write.text((553,340), f"KOTA {data['kota'].upper()}", fill=("black"), font=fdata, anchor="lt")
-write.text((570,360), data["terbuat"], fill=("black"), font=fdata, anchor="lt")
-write.text((540,395), sign, fill=("black"), font=fsign, anchor="lt")
-tmp.save("src/result.png", quality=95)
+import argparse
+import hashlib
+import json
+import os
+import string
+from collections import OrderedDict
+
+from PIL import Image, ImageDraw, ImageFont
+
+# Assets are found next to this file, whatever the working directory
+HERE = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE = os.path.join(HERE, "assets", "Template.png")
+# Font list
+FONTS = (os.path.join(HERE, "font", "Arrial.ttf"),
+         os.path.join(HERE, "font", "Sign.ttf"),
+         os.path.join(HERE, "font", "Ocr.ttf"))
+# font size list
+SIZES = (25, 32, 16, 40)
+# Top-left corner of the pas photo on the card
+PHOTO_POSITION = (520, 140)
+
+# What the script mode reads and writes
+DATA_JSON = "data.json"
+RESULT_PNG = os.path.join(HERE, "result.png")
+
+# Text drawn on every card: (field, position, text, font, anchor, cached).
+# Text is a format string over the card data; uppercased unless it is a date
+# or the NIK. Field names the string in card_text() (OCR ground truth).
+# Cached strings repeat across cards (cities, religions, jobs, dates) and are
+# blitted from the text strip cache; the rest is unique per card and drawn.
+CARD_TEXT = (
+    ("provinsi", (380, 45), "PROVINSI {provinsi}", "fprov", "ms", True),
+    ("kota", (380, 70), "KOTA {kota}", "fprov", "ms", True),
+    ("nik", (170, 105), "{nik}", "fnik", "lt", False),
+    ("nama", (190, 145), "{nama}", "fdata", "lt", False),
+    ("ttl", (190, 168), "{ttl}", "fdata", "lt", False),
+    ("jenis_kelamin", (190, 191), "{jenis_kelamin}", "fdata", "lt", True),
+    ("golongan_darah", (463, 190), "{golongan_darah}", "fdata", "lt", True),
+    ("alamat", (190, 212), "{alamat}", "fdata", "lt", False),
+    ("rt/rw", (190, 234), "{rt/rw}", "fdata", "lt", True),
+    ("kel/desa", (190, 257), "{kel/desa}", "fdata", "lt", True),
+    ("kecamatan", (190, 279), "{kecamatan}", "fdata", "lt", True),
+    ("agama", (190, 300), "{agama}", "fdata", "lt", True),
+    ("status", (190, 323), "{status}", "fdata", "lt", True),
+    ("pekerjaan", (190, 346), "{pekerjaan}", "fdata", "lt", True),
+    ("kewarganegaraan", (190, 369), "{kewarganegaraan}", "fdata", "lt", True),
+    ("masa_berlaku", (190, 390), "{masa_berlaku}", "fdata", "lt", True),
+    ("kota_terbit", (553, 340), "KOTA {kota}", "fdata", "lt", True),
+    ("terbuat", (570, 360), "{terbuat}", "fdata", "lt", True),
+    ("tanda_tangan", (540, 395), "{sign}", "fsign", "lt", True),
+)
+# Drawn as given, not uppercased
+VERBATIM = ("{nik}", "{terbuat}", "{sign}")
+INK = "black"
+# Fields that can be long enough to run into the photo (x 520): they are
+# shrunk to this width, down to MIN_FIT_SIZE, instead of spilling over
+FIT_WIDTHS = {"nama": 320, "alamat": 320, "pekerjaan": 320}
+MIN_FIT_SIZE = 9
+
+class LruCache:
+    """Dict with a size bound that evicts the least recently used entry"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = self.misses = 0
+
+    def get(self, key, build):
+        """The entry for `key`, built with build() on a miss"""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = self._entries[key] = build()
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def __len__(self):
+        return len(self._entries)
+
+class TextFitter:
+    """The largest size of a font, down to `min_size`, at which a string fits a width
+
+    Widths are sums over a table of glyph advances per size, measured once
+    per character (printable ASCII up front), instead of a FreeType layout
+    per string and candidate size. A long string starts from the size its
+    width scales to and moves by a step or two, since hinting keeps small
+    sizes from scaling exactly. Results are memoized per (text, font, size,
+    width), so text that fits costs one sum the first time and a dict
+    lookup after that.
+    """
+
+    def __init__(self, font, min_size=MIN_FIT_SIZE, cache_size=4096):
+        self.font = font
+        self.min_size = min(min_size, font.size)
+        self._fonts = {font.size: font}
+        self._advances = {}
+        self.fits = LruCache(cache_size)
+        self.advances(font.size)
+
+    def font_at(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = self.font.font_variant(size=size)
+        return font
+
+    def baseline_shift(self, font):
+        """How far down to draw top-anchored text in `font` to keep the base font's baseline"""
+        return self.font.getmetrics()[0] - font.getmetrics()[0]
+
+    def advances(self, size):
+        """{character: advance width} of the font at `size`"""
+        table = self._advances.get(size)
+        if table is None:
+            font = self.font_at(size)
+            table = self._advances[size] = {c: font.getlength(c) for c in string.printable}
+        return table
+
+    def width(self, text, size):
+        table = self.advances(size)
+        try:
+            return sum(map(table.__getitem__, text))
+        except KeyError:
+            font = self.font_at(size)
+            for c in set(text) - table.keys():
+                table[c] = font.getlength(c)
+            return sum(map(table.__getitem__, text))
+
+    def fit(self, text, max_width):
+        """Font to draw `text` with so it is at most `max_width` pixels wide"""
+        return self.fits.get((text, self.font.path, self.font.size, max_width), lambda: self._fit(text, max_width))
+
+    def _fit(self, text, max_width):
+        base = self.font.size
+        width = self.width(text, base)
+        if width <= max_width:
+            return self.font
+        size = max(self.min_size, min(base - 1, int(base * max_width / width)))
+        while size > self.min_size and self.width(text, size) > max_width:
+            size -= 1
+        while size + 1 < base and self.width(text, size + 1) <= max_width:
+            size += 1
+        return self.font_at(size)
+
+def photo_tile(photo_path, mode, card_size):
+    """The pas photo as pasted on a card: cropped, resized, in the card's mode
+    and clipped to the part that lands on the card"""
+    with Image.open(photo_path) as pas_photo:
+        # Create condition if photo size not same 432
+        if pas_photo.size[0] != 432:
+            photo = pas_photo.crop((0, 0, 432, 450))
+        else:
+            photo = pas_photo
+        csize = photo.resize((round(pas_photo.size[0] * 0.4), round(pas_photo.size[1] * 0.4)))
+    x, y = PHOTO_POSITION
+    width, height = min(csize.width, card_size[0] - x), min(csize.height, card_size[1] - y)
+    if (width, height) != csize.size:
+        csize = csize.crop((0, 0, width, height))
+    return csize.convert(mode)
+
+class PhotoTileCache:
+    """Ready-to-paste pas photo tiles, decoded, cropped and resized once per source
+
+    Tiles are kept in a bounded LRU cache. With `cache_dir` every tile is
+    also stored there as raw pixels, keyed by the source's path, size and
+    modification time, so later runs (and other worker processes) skip
+    decoding the JPEG altogether.
+    """
+
+    # Bump when photo_tile() changes what a tile looks like
+    VERSION = 1
+
+    def __init__(self, maxsize=256, cache_dir=None):
+        self.tiles = LruCache(maxsize)
+        self.cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def get(self, photo_path, mode, card_size):
+        return self.tiles.get((photo_path, mode, card_size), lambda: self._load(photo_path, mode, card_size))
+
+    def _load(self, photo_path, mode, card_size):
+        if not self.cache_dir:
+            return photo_tile(photo_path, mode, card_size)
+        stat = os.stat(photo_path)
+        key = f"{self.VERSION}|{os.path.abspath(photo_path)}|{stat.st_size}|{stat.st_mtime_ns}|{mode}|{card_size}"
+        path = os.path.join(self.cache_dir, hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest() + '.tile')
+        try:
+            with open(path, 'rb') as f:
+                header = f.readline().split()
+                return Image.frombytes(header[0].decode('ascii'), (int(header[1]), int(header[2])), f.read())
+        except (FileNotFoundError, IndexError, ValueError):
+            pass
+        tile = photo_tile(photo_path, mode, card_size)
+        # Workers may write the same tile at once; each renames its own complete file into place
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(f"{tile.mode} {tile.width} {tile.height}\n".encode('ascii'))
+            f.write(tile.tobytes())
+        os.replace(tmp, path)
+        return tile
+
+class KtpRenderer:
+    """Draws e-KTP cards from a data dict; template and fonts are loaded once
+
+    Pas photos are decoded, cropped and resized once into a PhotoTileCache,
+    so a card starts as a copy of the template with a tile pasted in; for
+    the static photo a base card (template plus photo) can be composited
+    once and shared, see base_card(). Strings that repeat across
+    cards are rendered once into a grayscale strip, kept in an LRU cache
+    keyed by (string, font, size), and blitted with the ink as a mask; only
+    the unique fields (NIK, name, birth date, address) are drawn per card.
+    Name, address and job are shrunk to FIT_WIDTHS by a TextFitter when
+    they would run into the photo.
+
+    A renderer keeps no per-card state, so one instance serves a whole batch
+    and several runs in the same directory no longer share a data.json or
+    result.png.
+    """
+
+    def __init__(self, template=TEMPLATE, fonts=FONTS, sizes=SIZES, text_cache_size=4096, mode=None,
+                 photo_tiles=None):
+        # `template` is a path or an already decoded image (e.g. one attached
+        # from shared memory); cards are drawn in `mode`, the template's own
+        # mode unless given
+        if isinstance(template, Image.Image):
+            self.template = template
+        else:
+            with Image.open(template) as image:
+                image.load()
+                self.template = image
+        self.mode = mode or self.template.mode
+        # Font for provinsi
+        self.fprov = ImageFont.truetype(fonts[0], sizes[0])
+        # Font for NIK
+        self.fnik = ImageFont.truetype(fonts[2], sizes[1])
+        # Font for data
+        self.fdata = ImageFont.truetype(fonts[0], sizes[2])
+        # Font for signature
+        self.fsign = ImageFont.truetype(fonts[1], sizes[3])
+        self._base_cards = {}
+        self.text_strips = LruCache(text_cache_size)
+        self.photo_tiles = photo_tiles or PhotoTileCache()
+        self.fitters = {font_name: TextFitter(getattr(self, font_name))
+                        for field, _, _, font_name, _, _ in CARD_TEXT if field in FIT_WIDTHS}
+
+    def render(self, data):
+        """The card for `data` (the keys of ktp_data) as a new image"""
+        photo_path = data["pas_photo"]
+        base = self._base_cards.get(photo_path)
+        if base is not None:
+            card = base.convert(self.mode)
+        else:
+            card = self.template.convert(self.mode)
+            card.paste(self.photo_tiles.get(photo_path, self.mode, card.size), PHOTO_POSITION)
+        self._draw_text(card, data)
+        return card
+
+    def save(self, data, path_or_fileobj, format=None):
+        """Render the card for `data` straight into a file path or file object"""
+        self.render(data).save(path_or_fileobj, format=format, quality=95)
+
+    def base_card(self, photo_path):
+        """Template with the pas photo pasted in; built once and used for every card with that photo"""
+        card = self._base_cards.get(photo_path)
+        if card is None:
+            card = self._base_cards[photo_path] = self.template.convert(self.mode)
+            card.paste(self.photo_tiles.get(photo_path, self.mode, card.size), PHOTO_POSITION)
+        return card
+
+    def add_base_card(self, photo_path, card):
+        """Use `card` (built by base_card(), possibly in another process) for `photo_path`"""
+        self._base_cards[photo_path] = card
+
+    def _draw_text(self, card, data):
+        write = ImageDraw.Draw(card)
+        for (field, (x, y), _, font_name, anchor, cached), value in zip(CARD_TEXT, card_text(data).values()):
+            font = getattr(self, font_name)
+            if field in FIT_WIDTHS:
+                fitter = self.fitters[font_name]
+                font = fitter.fit(value, FIT_WIDTHS[field])
+                if font is not fitter.font:
+                    y += fitter.baseline_shift(font)
+            if not cached:
+                write.text((x, y), value, fill=INK, font=font, anchor=anchor)
+                continue
+            strip, (left, top) = self.text_strips.get(
+                (value, font.path, font.size, anchor), lambda: self._text_strip(value, font, anchor))
+            if strip is not None:
+                card.paste(INK, (x + left, y + top), strip)
+
+    @staticmethod
+    def _text_strip(text, font, anchor):
+        """(coverage mask, offset from the anchor point) of `text`, as ImageDraw.text would draw it"""
+        left, top, right, bottom = font.getbbox(text, anchor=anchor)
+        if right <= left or bottom <= top:
+            return None, (0, 0)
+        strip = Image.new("L", (right - left, bottom - top))
+        ImageDraw.Draw(strip).text((-left, -top), text, fill=255, font=font, anchor=anchor)
+        return strip, (left, top)
+
+def card_text(data):
+    """{field: string} exactly as drawn on the card for `data`, in CARD_TEXT order"""
+    # sign
+    values = dict(data, sign=data["nama"].split()[0])
+    strings = {}
+    for field, _, text, _, _, _ in CARD_TEXT:
+        value = text.format_map(values)
+        strings[field] = value if text in VERBATIM else value.upper()
+    return strings
+
+_renderer = None
+
+def get_ktp_renderer():
+    """Process-wide KtpRenderer, created on first use"""
+    global _renderer
+    if _renderer is None:
+        _renderer = KtpRenderer()
+    return _renderer
+
+def render_ktp(data, path_or_fileobj=None, format=None):
+    """Render one e-KTP card; returns the image, or writes it to `path_or_fileobj`"""
+    renderer = get_ktp_renderer()
+    if path_or_fileobj is None:
+        return renderer.render(data)
+    renderer.save(data, path_or_fileobj, format=format)
+
+def main(argv=None):
+    """Script mode: render the card described by data.json into src/result.png"""
+    parser = argparse.ArgumentParser(description="Render one e-KTP image from a JSON data file")
+    parser.add_argument('data_json', nargs='?', default=DATA_JSON, help="Card data (see generate_ektp_images_from_csv.ktp_data)")
+    parser.add_argument('-o', '--output', default=RESULT_PNG, help="Where to write the image")
+    args = parser.parse_args(argv)
+    with open(args.data_json, encoding="utf-8") as f:
+        data = json.load(f)
+    render_ktp(data, args.output)
+    print("[XXX]GENERATE FAKE E-KTP SUCCESS")
+    print(data)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+import argparse
+import csv
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from collections.abc import Mapping
+
+# File layout (all integers little-endian):
+#   MAGIC | header length (uint64) | header JSON | column sections (8-byte aligned)
+# Column kinds:
+#   dict - one uint16/uint32 code per row, values listed in the header
+#   int  - one int64 per row
+#   str  - (rows + 1) uint64 offsets followed by a UTF-8 string heap
+MAGIC = b"IJAD\x00\x01\x00\x00"
+EXTENSION = ".ijad"
+DICT_LIMIT = 4096
+
+_INT_PATTERN = re.compile(r"-?(0|[1-9][0-9]{0,17})\Z")
+
+if sys.byteorder != 'little':
+    raise ImportError("dataset_store memory-maps little-endian arrays and needs a little-endian host")
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+class _ColumnScan:
+    """First-pass statistics for one CSV column"""
+
+    def __init__(self, name, dict_limit):
+        self.name = name
+        self.dict_limit = dict_limit
+        self.values = {}
+        self.is_int = True
+        self.heap_bytes = 0
+
+    def add(self, value):
+        if self.values is not None and value not in self.values:
+            if len(self.values) >= self.dict_limit:
+                self.values = None
+            else:
+                self.values[value] = len(self.values)
+        if self.is_int and not _INT_PATTERN.match(value):
+            self.is_int = False
+        self.heap_bytes += len(value.encode('utf-8'))
+
+    def spec(self, rows):
+        """Pick the cheapest encoding and return the header entry for it"""
+        if self.is_int and rows:
+            return {'name': self.name, 'kind': 'int', 'size': 8 * rows}
+        if self.values is not None:
+            width = 2 if len(self.values) <= 0xFFFF else 4
+            return {'name': self.name, 'kind': 'dict', 'width': width,
+                    'values': list(self.values), 'size': width * rows}
+        return {'name': self.name, 'kind': 'str', 'heap': self.heap_bytes,
+                'size': 8 * (rows + 1) + self.heap_bytes}
+
+def _records(reader, width):
+    """Data rows of a csv.reader past its header, as csv.DictReader sees them
+
+    Blank lines are skipped and short rows padded with '', so both passes of
+    csv_to_store() agree with each other and with count_rows(); a row with more
+    fields than the header is rejected rather than silently cut.
+    """
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row += [''] * (width - len(row))
+        elif len(row) > width:
+            raise ValueError(f"Line {reader.line_num} has {len(row)} fields but the header has {width}")
+        yield row
+
+def csv_to_store(csv_path, store_path, dict_limit=DICT_LIMIT):
+    """Convert a CSV file to the binary format in two streaming passes"""
+    with open(csv_path, newline='', encoding='utf-8') as csvfile:
+        reader = csv.reader(csvfile)
+        names = next(reader, None) or []
+        scans = [_ColumnScan(name, dict_limit) for name in names]
+        rows = 0
+        for row in _records(reader, len(names)):
+            for scan, value in zip(scans, row):
+                scan.add(value)
+            rows += 1
+
+    columns = [scan.spec(rows) for scan in scans]
+    # Header size depends on the offsets written into it, so lay out twice
+    offset = 0
+    for _ in range(2):
+        header = json.dumps({'rows': rows, 'columns': columns}, ensure_ascii=False).encode('utf-8')
+        offset = _align(len(MAGIC) + 8 + len(header) + 64)
+        for column in columns:
+            column['offset'] = offset
+            offset = _align(offset + column['size'])
+    header = json.dumps({'rows': rows, 'columns': columns}, ensure_ascii=False).encode('utf-8')
+    total = max(offset, 1)
+
+    with open(store_path, 'w+b') as out:
+        out.truncate(total)
+        out.write(MAGIC + struct.pack('<Q', len(header)) + header)
+        out.flush()
+        with mmap.mmap(out.fileno(), total) as mm:
+            _fill_columns(csv_path, mm, columns, rows)
+            mm.flush()
+    return rows
+
+def _fill_columns(csv_path, mm, columns, rows):
+    """Second pass: write every value straight into its mapped column section"""
+    view = memoryview(mm)
+    writers = []
+    for column in columns:
+        start = column['offset']
+        if column['kind'] == 'int':
+            writers.append(('int', view[start:start + 8 * rows].cast('q'), None))
+        elif column['kind'] == 'dict':
+            width = column['width']
+            codes = view[start:start + width * rows].cast('H' if width == 2 else 'I')
+            writers.append(('dict', codes, {value: code for code, value in enumerate(column['values'])}))
+        else:
+            offsets = view[start:start + 8 * (rows + 1)].cast('Q')
+            offsets[0] = 0
+            heap_start = start + 8 * (rows + 1)
+            writers.append(('str', offsets, [heap_start, 0]))
+
+    try:
+        with open(csv_path, newline='', encoding='utf-8') as csvfile:
+            reader = csv.reader(csvfile)
+            width = len(next(reader, None) or ())
+            for index, row in enumerate(_records(reader, width)):
+                for (kind, target, extra), value in zip(writers, row):
+                    if kind == 'int':
+                        target[index] = int(value)
+                    elif kind == 'dict':
+                        target[index] = extra[value]
+                    else:
+                        data = value.encode('utf-8')
+                        heap_start, cursor = extra
+                        mm[heap_start + cursor:heap_start + cursor + len(data)] = data
+                        extra[1] = cursor + len(data)
+                        target[index + 1] = extra[1]
+    finally:
+        for _, target, _ in writers:
+            target.release()
+        view.release()
+
+class RowView(Mapping):
+    """Read-only dict-like view of one row; values are decoded on access"""
+
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key):
+        return self._store.value(self._index, key)
+
+    def __iter__(self):
+        return iter(self._store.fieldnames)
+
+    def __len__(self):
+        return len(self._store.fieldnames)
+
+    def __repr__(self):
+        return f"RowView({self._index}, {dict(self)!r})"
+
+class DatasetStore:
+    """Memory-mapped reader for the binary dataset format
+
+    Columns are exposed as zero-copy memoryviews over the mapped file; rows
+    are lazy RowView mappings, so only the fields that are actually read get
+    decoded.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a {EXTENSION} dataset")
+        (header_len,) = struct.unpack_from('<Q', self._mm, len(MAGIC))
+        start = len(MAGIC) + 8
+        header = json.loads(self._mm[start:start + header_len].decode('utf-8'))
+        self.rows = header['rows']
+        self.columns = header['columns']
+        self.fieldnames = [column['name'] for column in self.columns]
+        self._view = memoryview(self._mm)
+        self._readers = {column['name']: self._column_reader(column) for column in self.columns}
+
+    def _column_reader(self, column):
+        start, rows = column['offset'], self.rows
+        if column['kind'] == 'int':
+            # Rows stay drop-in compatible with csv.DictReader, so ints come back as text
+            values = self._view[start:start + 8 * rows].cast('q')
+            return lambda index: str(values[index])
+        if column['kind'] == 'dict':
+            width = column['width']
+            codes = self._view[start:start + width * rows].cast('H' if width == 2 else 'I')
+            dictionary = column['values']
+            return lambda index: dictionary[codes[index]]
+        offsets = self._view[start:start + 8 * (rows + 1)].cast('Q')
+        heap = start + 8 * (rows + 1)
+        mm = self._mm
+        return lambda index: mm[heap + offsets[index]:heap + offsets[index + 1]].decode('utf-8')
+
+    def value(self, index, field):
+        if not 0 <= index < self.rows:
+            raise IndexError(index)
+        return self._readers[field](index)
+
+    def numbers(self, field):
+        """Zero-copy int64 memoryview of a numeric ('int') column"""
+        column = self.columns[self.fieldnames.index(field)]
+        if column['kind'] != 'int':
+            raise TypeError(f"Column {field!r} is stored as {column['kind']!r}, not 'int'")
+        start = column['offset']
+        return self._view[start:start + 8 * self.rows].cast('q')
+
+    def column(self, field):
+        """All values of one column, decoded lazily as they are iterated"""
+        reader = self._readers[field]
+        return (reader(index) for index in range(self.rows))
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.rows
+        if not 0 <= index < self.rows:
+            raise IndexError(index)
+        return RowView(self, index)
+
+    def __iter__(self):
+        return (RowView(self, index) for index in range(self.rows))
+
+    def close(self):
+        # Drop the column closures first so the memoryviews can be released
+        self._readers = {}
+        if getattr(self, '_view', None) is not None:
+            self._view.release()
+            self._view = None
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                # A RowView/column view is still alive; the map closes with it
+                pass
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def store_to_csv(store_path, csv_path):
+    """Export a binary dataset back to CSV"""
+    with DatasetStore(store_path) as store, open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(store.fieldnames)
+        readers = [store._readers[field] for field in store.fieldnames]
+        for index in range(store.rows):
+            writer.writerow([reader(index) for reader in readers])
+        return store.rows
+
+def read_rows(path):
+    """Yield dict-like rows from either a CSV file or a binary dataset"""
+    if path.endswith(EXTENSION):
+        with DatasetStore(path) as store:
+            yield from store
+    else:
+        with open(path, newline='', encoding='utf-8') as csvfile:
+            yield from csv.DictReader(csvfile)
+
+def count_rows(path):
+    """Number of rows read_rows(path) yields, without building them"""
+    if path.endswith(EXTENSION):
+        with DatasetStore(path) as store:
+            return len(store)
+    with open(path, newline='', encoding='utf-8') as csvfile:
+        # Blank lines are skipped like csv.DictReader does; the first row is the header
+        return max(0, sum(1 for row in csv.reader(csvfile) if row) - 1)
+
+def main(argv=None):
+    """Command-line entry point (also used by `cli.py store`)"""
+    parser = argparse.ArgumentParser(description="Convert between CSV and the binary dataset format")
+    sub = parser.add_subparsers(dest='command', required=True)
+    to_bin = sub.add_parser('import', help="CSV -> binary dataset")
+    to_bin.add_argument('csv_file')
+    to_bin.add_argument('store_file')
+    to_csv = sub.add_parser('export', help="binary dataset -> CSV")
+    to_csv.add_argument('store_file')
+    to_csv.add_argument('csv_file')
+    args = parser.parse_args(argv)
+
+    if args.command == 'import':
+        rows = csv_to_store(args.csv_file, args.store_file)
+        csv_size, store_size = os.path.getsize(args.csv_file), os.path.getsize(args.store_file)
+        print(f"✅ Imported {rows} rows into {args.store_file} ({store_size:,} bytes, {store_size / max(csv_size, 1):.0%} of CSV)")
+    else:
+        rows = store_to_csv(args.store_file, args.csv_file)
+        print(f"✅ Exported {rows} rows to {args.csv_file}")
+
+if __name__ == "__main__":
+    main()
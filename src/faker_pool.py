@@ -0,0 +1,112 @@
+import random
+from datetime import date, timedelta
+
+# Faker methods used by the generator that are pre-drawn into pools
+POOLED_METHODS = (
+    'first_name', 'first_name_male', 'first_name_female', 'last_name',
+    'job', 'company', 'phone_number', 'email', 'domain_name',
+    'city', 'city_suffix', 'state', 'street_address', 'postcode', 'sentence',
+)
+
+DEFAULT_POOL_SIZE = 65536
+
+def _day_offset(value):
+    """Parse Faker-style relative dates ('today', '-60d', '+90d') into a day offset"""
+    if value == 'today':
+        return 0
+    if isinstance(value, str) and value.endswith('d'):
+        return int(value[:-1])
+    raise ValueError(f"Unsupported relative date for pooled mode: {value!r}")
+
+def _years_before(day, years):
+    """Same calendar day `years` earlier (29 Feb falls back to 28 Feb)"""
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+class LazyFaker:
+    """Stand-in for a Faker instance that is only created on first use
+
+    Importing faker and loading a locale's providers dominates the start-up of
+    short runs, so modules keep one of these at import time instead.
+    """
+
+    def __init__(self, locale):
+        self.locale = locale
+        self._instance = None
+
+    @property
+    def instance(self):
+        if self._instance is None:
+            from faker import Faker
+            self._instance = Faker(self.locale)
+        return self._instance
+
+    def __getattr__(self, name):
+        return getattr(self.instance, name)
+
+class FastRandom(random.Random):
+    """random.Random with float-scaled choice/randint instead of rejection sampling
+
+    The bias is below 2**-40 for the small ranges used here, and each draw is a
+    single call into the C generator. Only the public methods are overridden;
+    sample(), shuffle() and randrange() keep the stock implementation.
+    """
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
+    def randint(self, a, b):
+        return a + int(self.random() * (b - a + 1))
+
+class FakerPool:
+    """Drop-in stand-in for the Faker methods used by the generator
+
+    Each method in POOLED_METHODS is drawn `pool_size` times from a real Faker
+    instance up front; afterwards every call just picks a random element of the
+    pool. Larger pools give more distinct values (realism), smaller pools build
+    faster. Dates are computed directly from the RNG instead of going through
+    Faker's date parsing.
+    """
+
+    def __init__(self, fake, pool_size=DEFAULT_POOL_SIZE, rng=None):
+        self.pool_size = pool_size
+        self.pools = {}
+        for method in POOLED_METHODS:
+            draw = getattr(fake, method)
+            self.pools[method] = tuple(draw() for _ in range(pool_size))
+        self._today = date.today()
+        self._bind_samplers(rng or random.Random())
+
+    def bind(self, rng):
+        """Return a view sharing the same pools but sampling with `rng`"""
+        view = object.__new__(FakerPool)
+        view.pool_size = self.pool_size
+        view.pools = self.pools
+        view._today = self._today
+        view._bind_samplers(rng)
+        return view
+
+    def _bind_samplers(self, rng):
+        self._rng = rng
+        rand = rng.random
+        for method, values in self.pools.items():
+            setattr(self, method, self._sampler(values, rand))
+
+    @staticmethod
+    def _sampler(values, rand):
+        count = len(values)
+        return lambda: values[int(rand() * count)]
+
+    def date_between(self, start_date, end_date='today'):
+        """Random date between two relative dates, e.g. ('-60d', 'today')"""
+        start = _day_offset(start_date)
+        end = _day_offset(end_date)
+        return self._today + timedelta(days=self._rng.randint(start, end))
+
+    def date_of_birth(self, minimum_age=0, maximum_age=115):
+        """Random birth date for an age in [minimum_age, maximum_age], like Faker"""
+        start = _years_before(self._today, maximum_age + 1) + timedelta(days=1)
+        end = _years_before(self._today, minimum_age)
+        return start + timedelta(days=self._rng.randint(0, (end - start).days))
@@ -1,19 +1,38 @@
+import argparse
+import multiprocessing
 import os
-import csv
-import json
-import shutil
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
+from functools import partial
+
+from archive_sink import ARCHIVE_FORMATS, ArchiveWriter, archive_format, index_path
+from card_codec import CODECS, CardCodec
+from create import CARD_TEXT, FONTS, TEMPLATE, KtpRenderer, PhotoTileCache, card_text, get_ktp_renderer
+from dataset_store import count_rows, read_rows
+from output_layout import FANOUT_SCHEMES, OUTPUT_INDEX, OutputLayout
+from photo_pool import PhotoPool
+from process_pool import imap_bounded
+from render_manifest import RenderManifest, discard_manifest, file_version, row_hash
+from shared_image import SharedImage, attach_image
 
 # CONFIGURATION
 CSV_FILE = "./indonesian_job_applications.csv"  # Input CSV with e-KTP data
 STATIC_PHOTO = "src/assets/images.jpg"         # Path to static photo
 OUTPUT_DIR = "indonesian_ktp/"                 # Where to save generated images
-CREATE_SCRIPT = "src/create.py"            # The image generator script
+CREATE_SCRIPT = "src/create.py"            # The image generator module
 
-TEMPLATE_JSON = "./data.json"            # The temp data file for create.py
+# Everything a card is drawn from besides its row (see --incremental)
+RENDER_INPUTS = (CREATE_SCRIPT, TEMPLATE, *FONTS)
+# Row fields that end up on the card (ktp_data)
+KTP_FIELDS = ("application_id", "nik", "first_name", "middle_name", "last_name", "birth_place",
+              "date_of_birth", "gender", "blood_type", "address_street", "rt_rw", "address_city",
+              "religion", "marital_status", "current_position", "address_province")
 
-def make_data_json(row, photo_path, out_path):
-    data = {
+def ktp_data(row, photo_path):
+    """The card fields create.KtpRenderer draws, from one applicant row"""
+    return {
         "application_id": row["application_id"],
         "nik": row["nik"],
         "nama": row["first_name"] + " " + row["middle_name"] + " " + row["last_name"],
@@ -34,23 +53,289 @@ def make_data_json(row, photo_path, out_path):
         "terbuat": datetime.now().strftime('%d-%m-%Y'),
         "pas_photo": photo_path
     }
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
-def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    with open(CSV_FILE, newline='', encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        for idx, row in enumerate(reader):
-            make_data_json(row, STATIC_PHOTO, TEMPLATE_JSON)
-            # Run the image generator
-            os.system(f"python3 {CREATE_SCRIPT}")
-            # Move result to unique file
-            dest_img = os.path.join(OUTPUT_DIR, f"ktp_{row['application_id']}.png")
-            shutil.copy("src/result.png", dest_img)
-            print(f"✅ Generated {dest_img}")
-    print(f"\nAll KTP images generated in ./{OUTPUT_DIR}/")
+
+
+def card_filename(key, extension='.png'):
+    return f"ktp_{key}{extension}"
+
+class _CardTasks:
+    """Render tasks for one card per applicant: (index, key, data, path)
+
+    `index` is the row's 1-based position and `path` the card's destination
+    (None renders in memory for the archive). The (key, hash) of every task
+    in flight stays in `pending` until its result comes back. With a
+    manifest, rows whose card is up to date are skipped and go straight to
+    the output index. Every card gets STATIC_PHOTO unless a PhotoPool
+    assigns one per application_id.
+    """
+
+    def __init__(self, rows, layout=None, manifest=None, version=None, extension='.png', photos=None):
+        self.rows = rows
+        self.photos = photos
+        self.extension = extension
+        self.layout = layout
+        self.manifest = manifest
+        self.version = version
+        self.pending = {}
+        self.skipped = 0
+
+    def __iter__(self):
+        layout, manifest, pending, photos = self.layout, self.manifest, self.pending, self.photos
+        for i, row in enumerate(self.rows, 1):
+            key = row['application_id']
+            digest = None
+            if manifest is not None:
+                # The issue/expiry dates printed on the card are not part of the hash
+                digest = row_hash(row, KTP_FIELDS, self.version)
+                if manifest.up_to_date(key, digest):
+                    layout.record(key, manifest.output(key))
+                    self.skipped += 1
+                    continue
+            path = None if layout is None else os.path.join(layout.folder_for(key), card_filename(key, self.extension))
+            pending[i] = key, digest
+            photo_path = STATIC_PHOTO if photos is None else photos.photo_for(key)
+            yield i, key, ktp_data(row, photo_path), path
+
+# The renderer and codec of a worker process (see _init_worker); the main
+# process uses create.get_ktp_renderer()
+_worker_renderer = None
+_worker_codec = None
+_worker_shared = []
+
+def _draw_card(task):
+    """Render stage: the card image of a task"""
+    index, key, data, path = task
+    return (_worker_renderer or get_ktp_renderer()).render(data)
+
+def _encode_card(task, image, codec):
+    """Encode stage: returns (index, path or (member name, file bytes), error)
+    so one bad row never stops a run
+
+    `codec` is a CardCodec, or a CardTensorWriter for --tensor.
+    """
+    index, key, data, path = task
+    try:
+        if not isinstance(codec, CardCodec):
+            # card_tensor.CardTensorWriter: the pixels go straight into the
+            # card's slot and only the ground-truth strings come back
+            codec.store(index - 1, image)
+            return index, card_text(data), None
+        encoded = codec.encode(image)
+        if path is None:
+            return index, (card_filename(key, codec.extension), encoded), None
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(encoded)
+        return index, path, None
+    except Exception as e:
+        return index, None, f"{key}: {e}"
+
+def _render_card(task, codec=None):
+    """Both stages back to back, as _encode_card() returns them"""
+    try:
+        image = _draw_card(task)
+    except Exception as e:
+        return task[0], None, f"{task[1]}: {e}"
+    return _encode_card(task, image, codec or _worker_codec)
+
+def _render_pipelined(tasks, codec, threads):
+    """Draw cards on this thread while `threads` encoder threads compress the previous ones
+
+    Pillow releases the GIL while it encodes, so encoding overlaps with
+    drawing the next cards. Results come back in input order, with at most
+    two drawn cards per thread waiting to be encoded.
+    """
+    limit = threads * 2
+    with ThreadPoolExecutor(threads, thread_name_prefix='card-encoder') as pool:
+        in_flight = deque()
+        for task in tasks:
+            try:
+                image = _draw_card(task)
+            except Exception as e:
+                failed = Future()
+                failed.set_result((task[0], None, f"{task[1]}: {e}"))
+                in_flight.append(failed)
+            else:
+                in_flight.append(pool.submit(_encode_card, task, image, codec))
+            while in_flight and (len(in_flight) > limit or in_flight[0].done()):
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+def _init_worker(codec, mode, template_spec, base_cards, photo_cache):
+    """Pool initializer: draw on the template and base cards in shared memory"""
+    global _worker_renderer, _worker_codec
+    _worker_codec = codec
+    shm, template = attach_image(template_spec)
+    _worker_shared.append(shm)
+    _worker_renderer = KtpRenderer(template, mode=mode, photo_tiles=PhotoTileCache(*photo_cache))
+    for photo_path, spec in base_cards.items():
+        shm, card = attach_image(spec)
+        _worker_shared.append(shm)
+        _worker_renderer.add_base_card(photo_path, card)
+
+def _render_parallel(tasks, codec, workers, chunksize, photos=(STATIC_PHOTO,), photo_cache=(256, None)):
+    """Render and encode card tasks on a process pool, yielding results in input order
+
+    The decoded template and the base card of each of `photos` are placed
+    in shared memory once; workers attach to them instead of decoding their
+    own copies, so memory stays flat as workers are added. Other photos go
+    through each worker's PhotoTileCache(*photo_cache). One continuous imap
+    feeds the pool `chunksize` tasks per dispatch, with at most four chunks
+    per worker in flight (see process_pool.imap_bounded).
+    """
+    renderer = get_ktp_renderer()
+    shared = [SharedImage(renderer.template)]
+    try:
+        base_cards = {}
+        for photo_path in photos:
+            shared.append(SharedImage(renderer.base_card(photo_path)))
+            base_cards[photo_path] = shared[-1].spec
+        initargs = (codec, renderer.mode, shared[0].spec, base_cards, photo_cache)
+        with multiprocessing.Pool(workers, _init_worker, initargs) as pool:
+            yield from imap_bounded(pool, _render_card, tasks, chunksize, workers * chunksize * 4)
+    finally:
+        for image in shared:
+            image.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate e-KTP images for every applicant")
+    parser.add_argument('data_file', nargs='?', default=CSV_FILE, help="Applicant CSV or .ijad dataset")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Worker processes (0 = one per CPU); the template is shared between them")
+    parser.add_argument('--chunksize', type=int, default=8, help="Cards handed to a worker per dispatch")
+    parser.add_argument('--codec', default='png',
+                        help=f"Output encoding: {', '.join(CODECS)}, optionally with a setting "
+                             "(png:1 compress level, jpeg:85 / webp:80 quality, png-palette:64 colors)")
+    parser.add_argument('--encode-threads', type=int, default=2,
+                        help="Threads encoding cards while the next ones are drawn (0 = encode inline)")
+    parser.add_argument('--photo-pool', help="Directory of pas photos; each applicant gets one by a hash "
+                                             "of application_id instead of STATIC_PHOTO")
+    parser.add_argument('--photo-cache-size', type=int, default=256,
+                        help="Decoded, resized photo tiles kept in memory per process")
+    parser.add_argument('--photo-cache', help="Directory that keeps the resized photo tiles between runs")
+    parser.add_argument('--archive', help="Stream the images into this .zip/.tar/.tar.gz instead of OUTPUT_DIR")
+    parser.add_argument('--tensor',
+                        help="Write the cards into this .npy memmap (N×H×W×C uint8) plus a .labels.json "
+                             "sidecar with application_id and the text on each card, instead of image files")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only render rows that changed since the last run and delete cards of removed rows")
+    parser.add_argument('--fanout-depth', type=int, default=0,
+                        help=f"Spread the images over this many levels of subdirectories (index: {OUTPUT_INDEX})")
+    parser.add_argument('--fanout-scheme', choices=FANOUT_SCHEMES, default='suffix',
+                        help="Subdirectories from the last digits of application_id, or from its hash")
+    args = parser.parse_args(argv)
+    if args.archive and archive_format(args.archive) is None:
+        parser.error(f"--archive must end in one of {', '.join(ARCHIVE_FORMATS)}")
+    if (args.incremental or args.fanout_depth) and (args.archive or args.tensor):
+        parser.error("--incremental and --fanout-depth work on the images in OUTPUT_DIR, "
+                     "not with --archive or --tensor")
+    if args.tensor and (args.archive or args.codec != 'png'):
+        parser.error("--tensor stores raw pixels; it cannot be combined with --archive or --codec")
+    if args.fanout_depth < 0:
+        parser.error("--fanout-depth must not be negative")
+    if args.workers < 0 or args.chunksize < 1 or args.encode_threads < 0:
+        parser.error("--workers and --encode-threads must not be negative and --chunksize must be at least 1")
+    if args.photo_cache_size < 1:
+        parser.error("--photo-cache-size must be at least 1")
+    pool = None
+    if args.photo_pool:
+        try:
+            pool = PhotoPool(args.photo_pool)
+        except (OSError, ValueError) as e:
+            parser.error(f"--photo-pool: {e}")
+    try:
+        codec = CardCodec.parse(args.codec)
+    except ValueError as e:
+        parser.error(str(e))
+
+    photo_cache = (args.photo_cache_size, args.photo_cache)
+    renderer = get_ktp_renderer()
+    renderer.photo_tiles = PhotoTileCache(*photo_cache)
+    if pool is None:
+        # Every card shares one photo: composite it into the template once
+        renderer.base_card(STATIC_PHOTO)
+    layout = manifest = version = tensor = None
+    if args.tensor:
+        # Template.png resolution; one slot per row
+        from card_tensor import CardTensorWriter
+
+        width, height = renderer.template.size
+        tensor = codec = CardTensorWriter(args.tensor, count_rows(args.data_file), height, width,
+                                          len(renderer.mode), [entry[0] for entry in CARD_TEXT])
+    elif not args.archive:
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        layout = OutputLayout(OUTPUT_DIR, args.fanout_depth, args.fanout_scheme)
+        if not args.incremental and discard_manifest(OUTPUT_DIR):
+            print(f"♻️  Overwriting {OUTPUT_DIR}: the next --incremental run re-renders every card")
+    if args.incremental:
+        # The fan-out is part of the version, since a different one moves every file
+        manifest = RenderManifest(OUTPUT_DIR)
+        photos = pool.photos if pool is not None else (STATIC_PHOTO,)
+        version = file_version(*RENDER_INPUTS, *photos, os.path.abspath(__file__),
+                               extra=(args.fanout_depth, args.fanout_scheme, codec))
+    # Rows are copied to plain dicts so they can be sent to worker processes
+    # Tensor slots have no file, hence no extension
+    tasks = _CardTasks((dict(row) for row in read_rows(args.data_file)), layout, manifest, version,
+                       codec.extension if tensor is None else None, pool)
+    workers = args.workers or os.cpu_count() or 1
+    if pool is not None:
+        print(f"🧑 Assigning {len(pool)} photos from {args.photo_pool} by application_id")
+    if tensor is not None:
+        print(f"🧮 Writing cards into {args.tensor} ({' × '.join(map(str, tensor.shape))} uint8)")
+    else:
+        print(f"🖼️  Encoding cards as {codec}")
+    if workers > 1:
+        # Each worker draws and encodes; the processes already overlap the two stages
+        print(f"⚙️  Rendering on {workers} worker processes ({args.chunksize} cards per dispatch)")
+        shared_photos = (STATIC_PHOTO,) if pool is None else ()
+        results = _render_parallel(tasks, codec, workers, args.chunksize, shared_photos, photo_cache)
+    elif args.encode_threads:
+        results = _render_pipelined(tasks, codec, args.encode_threads)
+    else:
+        results = map(partial(_render_card, codec=codec), tasks)
+
+    generated = failed = 0
+    sink = ArchiveWriter(args.archive) if args.archive else tensor or nullcontext()
+    with sink as writer, (layout or nullcontext()):
+        for i, result, error in results:
+            key, digest = tasks.pending.pop(i)
+            if error:
+                failed += 1
+                print(f"❌ Error generating e-KTP for {error}")
+                if manifest is not None:
+                    manifest.forget(key)
+                if tensor is not None:
+                    tensor.record(i - 1, key, None)
+                continue
+            generated += 1
+            if tensor is not None:
+                tensor.record(i - 1, key, result)
+                print(f"✅ Generated card {i - 1} ({key})")
+            elif writer is not None:
+                # The archive is written on a background thread while the next cards render
+                name, data = result
+                writer.add(name, data, key=key)
+                print(f"✅ Generated {name}")
+            else:
+                layout.record(key, result)
+                if manifest is not None:
+                    manifest.record(key, digest, result)
+                print(f"✅ Generated {result}")
+            if generated % 100 == 0:
+                print(f"📊 Progress: {generated} cards completed (row {i})...")
+    if manifest is not None:
+        removed = manifest.prune()
+        manifest.save()
+        print(f"♻️  {tasks.skipped} unchanged cards skipped, {removed} cards of removed rows deleted")
+    if failed:
+        print(f"⚠️  {failed} cards failed (see errors above)")
+    if tensor is not None:
+        print(f"\nAll KTP images written to {args.tensor} (labels: {tensor.labels_path})")
+    elif args.archive:
+        print(f"\nAll KTP images written to {args.archive} (member index: {index_path(args.archive)})")
+    else:
+        print(f"\nAll KTP images generated in ./{OUTPUT_DIR}/ (index: {layout.index_path})")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
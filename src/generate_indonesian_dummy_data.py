@@ -1,393 +1,787 @@
+import argparse
 import csv
-from faker import Faker
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import shutil
 import random
 from datetime import datetime
 
-# Initialize Faker with Indonesian locale
-fake = Faker('id_ID')  # Indonesian locale
-fake_en = Faker('en_US')  # Keep English for some fields like company names
+from applicant_batch import ApplicantBatch
+from faker_pool import DEFAULT_POOL_SIZE, FakerPool, FastRandom, LazyFaker
+from id_allocator import IdAllocator
 
-def generate_indonesian_job_application_data(num_records=50):
-    """Generate comprehensive and realistic Indonesian job application data"""
-    data = []
-    
-    # Indonesian job categories with local context
-    job_categories = {
-        "Teknologi": {
-            "positions": ["Senior Software Engineer", "Full Stack Developer", "DevOps Engineer", 
-                         "Data Scientist", "Machine Learning Engineer", "Cybersecurity Analyst",
-                         "Cloud Solutions Architect", "Product Manager - Tech", "QA Engineer",
-                         "Frontend Developer", "Backend Developer", "Mobile App Developer",
-                         "IT Support Specialist", "Database Administrator", "System Administrator"],
-            "skills": ["Python", "JavaScript", "React", "Node.js", "AWS", "Docker", "Kubernetes",
-                      "SQL", "MongoDB", "Git", "Agile", "Scrum", "REST APIs", "GraphQL", "Laravel", "PHP"]
-        },
-        "Bisnis": {
-            "positions": ["Business Analyst", "Project Manager", "Operations Manager",
-                         "Strategic Consultant", "Business Development Manager", "Process Improvement Specialist",
-                         "Account Manager", "Sales Manager", "Customer Success Manager"],
-            "skills": ["Project Management", "Data Analysis", "Strategic Planning", "Stakeholder Management",
-                      "Process Optimization", "Budget Management", "Risk Assessment", "Excel", "PowerBI",
-                      "CRM", "Salesforce", "Negotiation"]
-        },
-        "Pemasaran": {
-            "positions": ["Digital Marketing Manager", "Content Marketing Specialist", "SEO Specialist",
-                         "Social Media Manager", "Brand Manager", "Marketing Analytics Manager",
-                         "E-commerce Manager", "Growth Hacker", "Influencer Marketing Specialist"],
-            "skills": ["Google Analytics", "SEO/SEM", "Content Creation", "Social Media Marketing",
-                      "Email Marketing", "Adobe Creative Suite", "Marketing Automation", "A/B Testing",
-                      "Instagram Marketing", "TikTok Marketing", "Facebook Ads", "Google Ads"]
-        },
-        "Keuangan": {
-            "positions": ["Financial Analyst", "Senior Accountant", "Investment Analyst",
-                         "Risk Manager", "Treasury Analyst", "Internal Auditor", "Tax Specialist",
-                         "Budget Analyst", "Credit Analyst"],
-            "skills": ["Financial Modeling", "Excel", "SAP", "QuickBooks", "Risk Analysis",
-                      "Financial Reporting", "Budgeting", "Forecasting", "Compliance", "PSAK",
-                      "Tax Regulation", "Banking"]
-        },
-        "Kesehatan": {
-            "positions": ["Perawat", "Asisten Medis", "Healthcare Administrator",
-                         "Physical Therapist", "Medical Technologist", "Clinical Research Coordinator",
-                         "Dokter Umum", "Apoteker", "Radiographer"],
-            "skills": ["Patient Care", "Medical Records", "Privacy Compliance", "Electronic Health Records",
-                      "Clinical Documentation", "Medical Terminology", "Patient Safety", "Emergency Care"]
-        },
-        "Pendidikan": {
-            "positions": ["Guru SD", "Guru SMP", "Guru SMA", "Dosen", "Academic Coordinator",
-                         "Education Consultant", "Curriculum Developer", "Training Specialist"],
-            "skills": ["Teaching", "Curriculum Development", "Student Assessment", "Classroom Management",
-                      "Educational Technology", "Learning Management Systems", "Academic Research"]
-        }
+# Indonesian-locale Faker, created on first use so importing this module stays cheap
+fake = LazyFaker('id_ID')
+
+# Unseeded runs draw a random NIK permutation key
+default_ids = IdAllocator()
+
+# Indonesian job categories with local context
+JOB_CATEGORIES = {
+    "Teknologi": {
+        "positions": ["Senior Software Engineer", "Full Stack Developer", "DevOps Engineer", 
+                     "Data Scientist", "Machine Learning Engineer", "Cybersecurity Analyst",
+                     "Cloud Solutions Architect", "Product Manager - Tech", "QA Engineer",
+                     "Frontend Developer", "Backend Developer", "Mobile App Developer",
+                     "IT Support Specialist", "Database Administrator", "System Administrator"],
+        "skills": ["Python", "JavaScript", "React", "Node.js", "AWS", "Docker", "Kubernetes",
+                  "SQL", "MongoDB", "Git", "Agile", "Scrum", "REST APIs", "GraphQL", "Laravel", "PHP"]
+    },
+    "Bisnis": {
+        "positions": ["Business Analyst", "Project Manager", "Operations Manager",
+                     "Strategic Consultant", "Business Development Manager", "Process Improvement Specialist",
+                     "Account Manager", "Sales Manager", "Customer Success Manager"],
+        "skills": ["Project Management", "Data Analysis", "Strategic Planning", "Stakeholder Management",
+                  "Process Optimization", "Budget Management", "Risk Assessment", "Excel", "PowerBI",
+                  "CRM", "Salesforce", "Negotiation"]
+    },
+    "Pemasaran": {
+        "positions": ["Digital Marketing Manager", "Content Marketing Specialist", "SEO Specialist",
+                     "Social Media Manager", "Brand Manager", "Marketing Analytics Manager",
+                     "E-commerce Manager", "Growth Hacker", "Influencer Marketing Specialist"],
+        "skills": ["Google Analytics", "SEO/SEM", "Content Creation", "Social Media Marketing",
+                  "Email Marketing", "Adobe Creative Suite", "Marketing Automation", "A/B Testing",
+                  "Instagram Marketing", "TikTok Marketing", "Facebook Ads", "Google Ads"]
+    },
+    "Keuangan": {
+        "positions": ["Financial Analyst", "Senior Accountant", "Investment Analyst",
+                     "Risk Manager", "Treasury Analyst", "Internal Auditor", "Tax Specialist",
+                     "Budget Analyst", "Credit Analyst"],
+        "skills": ["Financial Modeling", "Excel", "SAP", "QuickBooks", "Risk Analysis",
+                  "Financial Reporting", "Budgeting", "Forecasting", "Compliance", "PSAK",
+                  "Tax Regulation", "Banking"]
+    },
+    "Kesehatan": {
+        "positions": ["Perawat", "Asisten Medis", "Healthcare Administrator",
+                     "Physical Therapist", "Medical Technologist", "Clinical Research Coordinator",
+                     "Dokter Umum", "Apoteker", "Radiographer"],
+        "skills": ["Patient Care", "Medical Records", "Privacy Compliance", "Electronic Health Records",
+                  "Clinical Documentation", "Medical Terminology", "Patient Safety", "Emergency Care"]
+    },
+    "Pendidikan": {
+        "positions": ["Guru SD", "Guru SMP", "Guru SMA", "Dosen", "Academic Coordinator",
+                     "Education Consultant", "Curriculum Developer", "Training Specialist"],
+        "skills": ["Teaching", "Curriculum Development", "Student Assessment", "Classroom Management",
+                  "Educational Technology", "Learning Management Systems", "Academic Research"]
     }
+}
+
+JOB_CATEGORY_NAMES = tuple(JOB_CATEGORIES)
+
+# Indonesian universities and institutions
+INDONESIAN_UNIVERSITIES = [
+    "Universitas Indonesia", "Institut Teknologi Bandung", "Universitas Gadjah Mada",
+    "Institut Teknologi Sepuluh Nopember", "Universitas Airlangga", "Universitas Padjadjaran",
+    "Universitas Diponegoro", "Universitas Brawijaya", "Universitas Sebelas Maret",
+    "Universitas Udayana", "Institut Pertanian Bogor", "Universitas Andalas",
+    "Universitas Hasanuddin", "Universitas Sriwijaya", "Universitas Lampung",
+    "Universitas Negeri Jakarta", "Universitas Pendidikan Indonesia", "Universitas Negeri Surabaya",
+    "Universitas Bina Nusantara", "Universitas Pelita Harapan", "Universitas Trisakti",
+    "Universitas Atmajaya", "Universitas Tarumanagara", "Universitas Katolik Indonesia"
+]
+
+# Indonesian companies by industry
+INDONESIAN_COMPANIES = {
+    "Teknologi": ["Gojek", "Tokopedia", "Bukalapak", "Traveloka", "OVO", "DANA", "Blibli",
+                 "Shopee Indonesia", "Grab Indonesia", "Ruangguru", "Zenius", "Kitabisa",
+                 "Akulaku", "Kredivo", "Amartha", "PT Telkom Indonesia", "XL Axiata"],
+    "Bisnis": ["PT Unilever Indonesia", "PT Astra International", "PT Gudang Garam",
+              "PT Bank Central Asia", "PT Bank Mandiri", "PT Bank Rakyat Indonesia",
+              "PT Indofood Sukses Makmur", "PT Semen Indonesia", "PT Pertamina"],
+    "Pemasaran": ["PT Dentsu Indonesia", "PT Ogilvy Indonesia", "PT BBDO Indonesia",
+                 "PT Grey Indonesia", "PT DDB Indonesia", "PT Leo Burnett Indonesia"],
+    "Keuangan": ["PT Bank Central Asia", "PT Bank Mandiri", "PT Bank Rakyat Indonesia",
+                "PT Bank Negara Indonesia", "PT Bank CIMB Niaga", "PT Bank Danamon",
+                "PT Asuransi Jiwasraya", "PT Prudential Indonesia"],
+    "Kesehatan": ["RS Cipto Mangunkusumo", "RS Fatmawati", "RS Persahabatan",
+                 "Siloam Hospitals", "RS Pondok Indah", "Mayapada Healthcare",
+                 "PT Kalbe Farma", "PT Kimia Farma", "PT Bio Farma"],
+    "Pendidikan": ["Universitas Indonesia", "Institut Teknologi Bandung", "Universitas Gadjah Mada",
+                  "Ruangguru", "Zenius", "Skill Academy", "Hacktiv8", "Binar Academy"]
+}
+
+# Indonesian-specific majors and fields
+MAJORS_BY_CATEGORY = {
+    "Teknologi": ["Teknik Informatika", "Sistem Informasi", "Teknik Komputer",
+                 "Teknik Elektro", "Teknik Industri", "Matematika"],
+    "Bisnis": ["Manajemen", "Akuntansi", "Ekonomi", "Bisnis Internasional",
+              "Administrasi Bisnis", "Kewirausahaan"],
+    "Pemasaran": ["Ilmu Komunikasi", "Public Relations", "Advertising",
+                 "Desain Komunikasi Visual", "Digital Marketing", "Jurnalistik"],
+    "Keuangan": ["Akuntansi", "Keuangan", "Ekonomi", "Manajemen Keuangan",
+                "Perbankan", "Asuransi"],
+    "Kesehatan": ["Kedokteran", "Keperawatan", "Farmasi", "Kesehatan Masyarakat",
+                 "Gizi", "Fisioterapi", "Radiologi"],
+    "Pendidikan": ["Pendidikan Guru Sekolah Dasar", "Pendidikan Bahasa Indonesia",
+                  "Pendidikan Matematika", "Pendidikan Fisika", "Pendidikan Kimia"]
+}
+
+# Indonesian certifications
+INDONESIAN_CERTIFICATIONS = {
+    "Teknologi": ["AWS Certified Solutions Architect", "Google Cloud Professional",
+                 "Microsoft Azure Certified", "Oracle Certified", "Cisco Certified",
+                 "Certified Ethical Hacker", "ITIL Foundation"],
+    "Bisnis": ["Project Management Professional (PMP)", "Six Sigma Black Belt",
+              "Certified Business Analyst", "Certified Scrum Master"],
+    "Pemasaran": ["Google Ads Certified", "Facebook Blueprint Certified",
+                 "HubSpot Content Marketing", "Google Analytics Certified"],
+    "Keuangan": ["Certified Public Accountant (CPA)", "Certified Internal Auditor (CIA)",
+                "Financial Risk Manager (FRM)", "Certified Management Accountant (CMA)"],
+    "Kesehatan": ["STR (Surat Tanda Registrasi)", "SIP (Surat Ijin Praktik)",
+                 "BLS Certification", "ACLS Certification"],
+    "Pendidikan": ["Sertifikat Pendidik", "TOEFL/IELTS Certificate", "Microsoft Office Specialist"]
+}
+
+# Indonesian cities for realistic addresses
+INDONESIAN_CITIES = [
+    "Jakarta", "Surabaya", "Bandung", "Bekasi", "Medan", "Tangerang", "Depok",
+    "Semarang", "Palembang", "Makassar", "Batam", "Bogor", "Pekanbaru", "Bandar Lampung",
+    "Malang", "Padang", "Denpasar", "Yogyakarta", "Samarinda", "Banjarmasin"
+]
+
+# Salary ranges in Indonesian Rupiah by experience
+SALARY_RANGES_IDR = {
+    "Entry Level": (5000000, 8000000),      # 5-8 million IDR
+    "1-3 tahun": (7000000, 12000000),      # 7-12 million IDR
+    "3-5 tahun": (10000000, 18000000),     # 10-18 million IDR
+    "5-8 tahun": (15000000, 25000000),     # 15-25 million IDR
+    "8-12 tahun": (20000000, 35000000),    # 20-35 million IDR
+    "12+ tahun": (30000000, 60000000)      # 30-60 million IDR
+}
+
+# Indonesian languages
+INDONESIAN_LANGUAGES = [
+    "Bahasa Indonesia (Native)", "Bahasa Jawa", "Bahasa Sunda", "Bahasa Batak",
+    "Bahasa Minang", "Bahasa Bali", "English", "Mandarin", "Arabic", "Japanese"
+]
+
+# Experience levels (keys of SALARY_RANGES_IDR, in order)
+EXPERIENCE_LEVELS = ("Entry Level", "1-3 tahun", "3-5 tahun", "5-8 tahun", "8-12 tahun", "12+ tahun")
+
+# Skills shared by every job category
+GENERAL_SKILLS = ["Kepemimpinan", "Komunikasi", "Problem Solving", "Kerja Tim",
+                  "Manajemen Waktu", "Analytical Thinking", "Adaptability", "Bahasa Inggris"]
+
+# Indonesian mobile number prefixes
+PHONE_PREFIXES = ("08", "081", "082", "085", "087", "088", "089")
+
+# Column order of the CSV, identical to the keys of the dicts built by _build_record()
+FIELDNAMES = (
+    'application_id', 'application_date', 'application_status',
+    'first_name', 'middle_name', 'last_name', 'preferred_name', 'gender', 'date_of_birth', 'nik',
+    'full_name', 'birth_place', 'birth_date', 'blood_type', 'address', 'rt_rw',
+    'village_kelurahan', 'district_kecamatan', 'religion', 'marital_status', 'occupation',
+    'nationality', 'valid_until', 'province', 'regency_city',
+    'email', 'phone_primary', 'phone_secondary', 'address_street', 'address_city',
+    'address_province', 'address_postal_code', 'address_country', 'linkedin_profile',
+    'personal_website',
+    'position_applied', 'department', 'employment_type', 'desired_salary', 'salary_negotiable',
+    'start_date_available', 'notice_period',
+    'work_authorization', 'visa_status', 'willing_to_relocate', 'remote_work_preference',
+    'travel_willingness',
+    'education_level', 'university_name', 'degree_major', 'degree_minor', 'graduation_year',
+    'gpa', 'academic_honors',
+    'total_experience', 'current_employer', 'current_position', 'current_salary',
+    'previous_employer_1', 'previous_position_1', 'previous_employer_2', 'previous_position_2',
+    'reason_for_leaving',
+    'technical_skills', 'soft_skills', 'programming_languages', 'certifications',
+    'languages_spoken',
+    'cover_letter_submitted', 'portfolio_url', 'github_profile',
+    'criminal_background', 'drug_test_consent', 'reference_check_consent',
+    'reference_1', 'reference_2', 'reference_3', 'emergency_contact_name',
+    'emergency_contact_relationship', 'emergency_contact_phone',
+    'preferred_work_schedule', 'overtime_availability', 'weekend_availability',
+    'how_found_position', 'referral_source',
+    'why_interested', 'career_goals', 'greatest_strength', 'biggest_weakness',
+    'bpjs_number', 'npwp_number',
+    'electronic_signature', 'signature_date', 'terms_accepted', 'privacy_policy_accepted',
+)
+
+def _build_record(i, fake=fake, rng=random, ids=default_ids):
+    """Build a single Indonesian job application record for row index i
+
+    `fake` and `rng` default to the module-level Faker and `random`; sharded
+    workers pass their own seeded instances so output is reproducible. `ids`
+    derives application_id and NIK from the global index i, so they are
+    unique across shards.
+    """
+    # Choose random category and related data
+    category = rng.choice(JOB_CATEGORY_NAMES)
+    position = rng.choice(JOB_CATEGORIES[category]["positions"])
     
-    # Indonesian universities and institutions
-    indonesian_universities = [
-        "Universitas Indonesia", "Institut Teknologi Bandung", "Universitas Gadjah Mada",
-        "Institut Teknologi Sepuluh Nopember", "Universitas Airlangga", "Universitas Padjadjaran",
-        "Universitas Diponegoro", "Universitas Brawijaya", "Universitas Sebelas Maret",
-        "Universitas Udayana", "Institut Pertanian Bogor", "Universitas Andalas",
-        "Universitas Hasanuddin", "Universitas Sriwijaya", "Universitas Lampung",
-        "Universitas Negeri Jakarta", "Universitas Pendidikan Indonesia", "Universitas Negeri Surabaya",
-        "Universitas Bina Nusantara", "Universitas Pelita Harapan", "Universitas Trisakti",
-        "Universitas Atmajaya", "Universitas Tarumanagara", "Universitas Katolik Indonesia"
-    ]
+    # Generate Indonesian names
+    gender = rng.choice(('Male', 'Female'))
+    if gender == 'Male':
+        first_name = fake.first_name_male()
+    else:
+        first_name = fake.first_name_female()
+        
+    last_name = fake.last_name()
     
-    # Indonesian companies by industry
-    indonesian_companies = {
-        "Teknologi": ["Gojek", "Tokopedia", "Bukalapak", "Traveloka", "OVO", "DANA", "Blibli",
-                     "Shopee Indonesia", "Grab Indonesia", "Ruangguru", "Zenius", "Kitabisa",
-                     "Akulaku", "Kredivo", "Amartha", "PT Telkom Indonesia", "XL Axiata"],
-        "Bisnis": ["PT Unilever Indonesia", "PT Astra International", "PT Gudang Garam",
-                  "PT Bank Central Asia", "PT Bank Mandiri", "PT Bank Rakyat Indonesia",
-                  "PT Indofood Sukses Makmur", "PT Semen Indonesia", "PT Pertamina"],
-        "Pemasaran": ["PT Dentsu Indonesia", "PT Ogilvy Indonesia", "PT BBDO Indonesia",
-                     "PT Grey Indonesia", "PT DDB Indonesia", "PT Leo Burnett Indonesia"],
-        "Keuangan": ["PT Bank Central Asia", "PT Bank Mandiri", "PT Bank Rakyat Indonesia",
-                    "PT Bank Negara Indonesia", "PT Bank CIMB Niaga", "PT Bank Danamon",
-                    "PT Asuransi Jiwasraya", "PT Prudential Indonesia"],
-        "Kesehatan": ["RS Cipto Mangunkusumo", "RS Fatmawati", "RS Persahabatan",
-                     "Siloam Hospitals", "RS Pondok Indah", "Mayapada Healthcare",
-                     "PT Kalbe Farma", "PT Kimia Farma", "PT Bio Farma"],
-        "Pendidikan": ["Universitas Indonesia", "Institut Teknologi Bandung", "Universitas Gadjah Mada",
-                      "Ruangguru", "Zenius", "Skill Academy", "Hacktiv8", "Binar Academy"]
-    }
+    # Generate experience level and related salary
+    experience = rng.choice(EXPERIENCE_LEVELS)
+    salary_min, salary_max = SALARY_RANGES_IDR[experience]
+    desired_salary = rng.randint(salary_min, salary_max)
     
-    # Indonesian-specific majors and fields
-    majors_by_category = {
-        "Teknologi": ["Teknik Informatika", "Sistem Informasi", "Teknik Komputer",
-                     "Teknik Elektro", "Teknik Industri", "Matematika"],
-        "Bisnis": ["Manajemen", "Akuntansi", "Ekonomi", "Bisnis Internasional",
-                  "Administrasi Bisnis", "Kewirausahaan"],
-        "Pemasaran": ["Ilmu Komunikasi", "Public Relations", "Advertising",
-                     "Desain Komunikasi Visual", "Digital Marketing", "Jurnalistik"],
-        "Keuangan": ["Akuntansi", "Keuangan", "Ekonomi", "Manajemen Keuangan",
-                    "Perbankan", "Asuransi"],
-        "Kesehatan": ["Kedokteran", "Keperawatan", "Farmasi", "Kesehatan Masyarakat",
-                     "Gizi", "Fisioterapi", "Radiologi"],
-        "Pendidikan": ["Pendidikan Guru Sekolah Dasar", "Pendidikan Bahasa Indonesia",
-                      "Pendidikan Matematika", "Pendidikan Fisika", "Pendidikan Kimia"]
-    }
+    # Education level based on experience
+    if experience in ["Entry Level", "1-3 tahun"]:
+        education_level = rng.choice(("S1 (Sarjana)", "D3 (Diploma)"))
+    elif experience in ["3-5 tahun", "5-8 tahun"]:
+        education_level = rng.choice(("S1 (Sarjana)", "S2 (Magister)"))
+    else:
+        education_level = rng.choice(("S2 (Magister)", "S3 (Doktor)", "S1 (Sarjana)"))
     
-    # Indonesian certifications
-    indonesian_certifications = {
-        "Teknologi": ["AWS Certified Solutions Architect", "Google Cloud Professional",
-                     "Microsoft Azure Certified", "Oracle Certified", "Cisco Certified",
-                     "Certified Ethical Hacker", "ITIL Foundation"],
-        "Bisnis": ["Project Management Professional (PMP)", "Six Sigma Black Belt",
-                  "Certified Business Analyst", "Certified Scrum Master"],
-        "Pemasaran": ["Google Ads Certified", "Facebook Blueprint Certified",
-                     "HubSpot Content Marketing", "Google Analytics Certified"],
-        "Keuangan": ["Certified Public Accountant (CPA)", "Certified Internal Auditor (CIA)",
-                    "Financial Risk Manager (FRM)", "Certified Management Accountant (CMA)"],
-        "Kesehatan": ["STR (Surat Tanda Registrasi)", "SIP (Surat Ijin Praktik)",
-                     "BLS Certification", "ACLS Certification"],
-        "Pendidikan": ["Sertifikat Pendidik", "TOEFL/IELTS Certificate", "Microsoft Office Specialist"]
-    }
+    # Generate work history with Indonesian companies
+    category_companies = INDONESIAN_COMPANIES.get(category, ["PT Generic Indonesia"])
+    previous_companies = rng.sample(category_companies, min(3, len(category_companies)))
     
-    # Indonesian cities for realistic addresses
-    indonesian_cities = [
-        "Jakarta", "Surabaya", "Bandung", "Bekasi", "Medan", "Tangerang", "Depok",
-        "Semarang", "Palembang", "Makassar", "Batam", "Bogor", "Pekanbaru", "Bandar Lampung",
-        "Malang", "Padang", "Denpasar", "Yogyakarta", "Samarinda", "Banjarmasin"
-    ]
+    # Generate skills
+    category_skills = JOB_CATEGORIES[category]["skills"]
+    all_skills = category_skills + GENERAL_SKILLS
+    selected_skills = rng.sample(all_skills, rng.randint(5, 8))
     
-    # Salary ranges in Indonesian Rupiah by experience
-    salary_ranges_idr = {
-        "Entry Level": (5000000, 8000000),      # 5-8 million IDR
-        "1-3 tahun": (7000000, 12000000),      # 7-12 million IDR
-        "3-5 tahun": (10000000, 18000000),     # 10-18 million IDR
-        "5-8 tahun": (15000000, 25000000),     # 15-25 million IDR
-        "8-12 tahun": (20000000, 35000000),    # 20-35 million IDR
-        "12+ tahun": (30000000, 60000000)      # 30-60 million IDR
-    }
+    # Generate certifications
+    certifications = INDONESIAN_CERTIFICATIONS.get(category, [])
+    num_certs = rng.randint(0, min(3, len(certifications)))
+    selected_certs = rng.sample(certifications, num_certs) if certifications else []
     
-    # Indonesian languages
-    indonesian_languages = [
-        "Bahasa Indonesia (Native)", "Bahasa Jawa", "Bahasa Sunda", "Bahasa Batak",
-        "Bahasa Minang", "Bahasa Bali", "English", "Mandarin", "Arabic", "Japanese"
-    ]
+    # Generate references with Indonesian names
+    references = []
+    for _ in range(rng.randint(2, 4)):
+        ref_name = f"{fake.first_name()} {fake.last_name()}"
+        ref_title = fake.job()
+        ref_company = rng.choice(previous_companies) if previous_companies else fake.company()
+        ref_phone = fake.phone_number()
+        ref_email = fake.email()
+        references.append(f"{ref_name}, {ref_title} di {ref_company}, {ref_phone}, {ref_email}")
+    
+    # Indonesian-specific preferences
+    work_authorization = rng.choice(("WNI (Warga Negara Indonesia)", "WNA dengan Work Permit", "Permanent Resident"))
+    willing_to_relocate = rng.choice(("Ya", "Tidak", "Dalam Pulau Jawa saja", "Dalam kota saja"))
+    remote_work_preference = rng.choice(("Fully Remote", "Hybrid", "Work from Office", "Fleksibel"))
     
-    for i in range(num_records):
-        # Choose random category and related data
-        category = random.choice(list(job_categories.keys()))
-        position = random.choice(job_categories[category]["positions"])
+    # Indonesian city for address
+    city = rng.choice(INDONESIAN_CITIES)
+    
+    # Generate Indonesian ID number format (NIK) - unique per record index
+    nik = ids.nik(i)
+    
+    # Indonesian phone number format
+    phone_primary = f"+62 {rng.choice(PHONE_PREFIXES)[1:]}-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}"
+    
+    # Languages with Indonesian context
+    num_languages = rng.randint(2, 4)
+    selected_languages = rng.sample(INDONESIAN_LANGUAGES, num_languages)
+    languages_str = ", ".join(selected_languages)
+    
+    record = {
+        # Application Info
+        'application_id': ids.application_id(i),
+        'application_date': fake.date_between(start_date='-60d', end_date='today').strftime('%d/%m/%Y'),
+        'application_status': rng.choice(('Pending', 'Under Review', 'Interview Scheduled')),
         
-        # Generate Indonesian names
-        gender = random.choice(['Male', 'Female'])
-        if gender == 'Male':
-            first_name = fake.first_name_male()
-        else:
-            first_name = fake.first_name_female()
-            
-        last_name = fake.last_name()
+        # Personal Information (Indonesian format)
+        'first_name': first_name,
+        'middle_name': fake.first_name() if rng.choice((True, False)) else '',
+        'last_name': last_name,
+        'preferred_name': first_name if rng.choice((True, False, False)) else '',
+        'gender': gender,
+        'date_of_birth': fake.date_of_birth(minimum_age=22, maximum_age=65).strftime('%d/%m/%Y'),
+        'nik': nik,  # Indonesian ID number
         
-        # Generate experience level and related salary
-        experience_levels = ["Entry Level", "1-3 tahun", "3-5 tahun", "5-8 tahun", "8-12 tahun", "12+ tahun"]
-        experience = random.choice(experience_levels)
-        salary_min, salary_max = salary_ranges_idr[experience]
-        desired_salary = random.randint(salary_min, salary_max)
+        # e-KTP specific fields (new additions)
+        'full_name': f"{first_name} {last_name}",
+        'birth_place': fake.city(),
+        'birth_date': fake.date_of_birth(minimum_age=22, maximum_age=65).strftime('%d-%m-%Y'),
+        'blood_type': rng.choice(('A', 'B', 'AB', 'O', '-')),
+        'address': fake.street_address(),
+        'rt_rw': f"{rng.randint(1, 20):03d}/{rng.randint(1, 15):03d}",
+        'village_kelurahan': fake.city_suffix() + " " + fake.city(),
+        'district_kecamatan': "Kecamatan " + fake.city(),
+        'religion': rng.choice(('Islam', 'Kristen', 'Katolik', 'Hindu', 'Buddha', 'Konghucu', 'Lainnya')),
+        'marital_status': rng.choice(('Belum Menikah', 'Menikah', 'Duda/Janda')),
+        'occupation': fake.job(),
+        'nationality': 'WNI',
+        'valid_until': 'SEUMUR HIDUP',
+        'province': fake.state(),
+        'regency_city': city,
         
-        # Education level based on experience
-        if experience in ["Entry Level", "1-3 tahun"]:
-            education_level = random.choice(["S1 (Sarjana)", "D3 (Diploma)"])
-        elif experience in ["3-5 tahun", "5-8 tahun"]:
-            education_level = random.choice(["S1 (Sarjana)", "S2 (Magister)"])
-        else:
-            education_level = random.choice(["S2 (Magister)", "S3 (Doktor)", "S1 (Sarjana)"])
+        # Contact Information (Indonesian format)
+        'email': f"{first_name.lower()}.{last_name.lower()}@{fake.domain_name()}",
+        'phone_primary': phone_primary,
+        'phone_secondary': f"+62 {rng.choice(PHONE_PREFIXES)[1:]}-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}" if rng.choice((True, False, False)) else '',
+        'address_street': fake.street_address(),
+        'address_city': city,
+        'address_province': fake.state(),
+        'address_postal_code': fake.postcode(),
+        'address_country': 'Indonesia',
+        'linkedin_profile': f"https://linkedin.com/in/{first_name.lower()}-{last_name.lower()}-{rng.randint(100, 999)}",
+        'personal_website': f"https://{first_name.lower()}{last_name.lower()}.com" if rng.choice((True, False, False, False)) else '',
         
-        # Generate work history with Indonesian companies
-        category_companies = indonesian_companies.get(category, ["PT Generic Indonesia"])
-        previous_companies = random.sample(category_companies, min(3, len(category_companies)))
+        # Position Information
+        'position_applied': position,
+        'department': category,
+        'employment_type': rng.choice(('Full-time', 'Part-time', 'Contract', 'Magang')),
+        'desired_salary': f"Rp {desired_salary:,}",
+        'salary_negotiable': rng.choice(('Ya', 'Tidak')),
+        'start_date_available': fake.date_between(start_date='today', end_date='+90d').strftime('%d/%m/%Y'),
+        'notice_period': rng.choice(('Segera', '2 minggu', '1 bulan', '2 bulan')),
         
-        # Generate skills
-        category_skills = job_categories[category]["skills"]
-        general_skills = ["Kepemimpinan", "Komunikasi", "Problem Solving", "Kerja Tim",
-                         "Manajemen Waktu", "Analytical Thinking", "Adaptability", "Bahasa Inggris"]
-        all_skills = category_skills + general_skills
-        selected_skills = random.sample(all_skills, random.randint(5, 8))
+        # Work Authorization
+        'work_authorization': work_authorization,
+        'visa_status': 'Work Permit' if work_authorization == 'WNA dengan Work Permit' else 'N/A',
+        'willing_to_relocate': willing_to_relocate,
+        'remote_work_preference': remote_work_preference,
+        'travel_willingness': f"{rng.randint(0, 50)}%",
         
-        # Generate certifications
-        certifications = indonesian_certifications.get(category, [])
-        num_certs = random.randint(0, min(3, len(certifications)))
-        selected_certs = random.sample(certifications, num_certs) if certifications else []
+        # Education
+        'education_level': education_level,
+        'university_name': rng.choice(INDONESIAN_UNIVERSITIES),
+        'degree_major': rng.choice(MAJORS_BY_CATEGORY.get(category, ["Umum"])),
+        'degree_minor': rng.choice(MAJORS_BY_CATEGORY.get(category, [""])) if rng.choice((True, False, False)) else '',
+        'graduation_year': rng.randint(2010, 2024),
+        'gpa': round(rng.uniform(3.0, 4.0), 2) if rng.choice((True, False)) else '',
+        'academic_honors': rng.choice(('Magna Cum Laude', 'Cum Laude', 'Dean\'s List', 'Wisudawan Terbaik', '')) if rng.choice((True, False, False)) else '',
         
-        # Generate references with Indonesian names
-        references = []
-        for _ in range(random.randint(2, 4)):
-            ref_name = f"{fake.first_name()} {fake.last_name()}"
-            ref_title = fake.job()
-            ref_company = random.choice(previous_companies) if previous_companies else fake.company()
-            ref_phone = fake.phone_number()
-            ref_email = fake.email()
-            references.append(f"{ref_name}, {ref_title} di {ref_company}, {ref_phone}, {ref_email}")
+        # Professional Experience
+        'total_experience': experience,
+        'current_employer': rng.choice(category_companies),
+        'current_position': fake.job(),
+        'current_salary': f"Rp {rng.randint(int(desired_salary * 0.8), int(desired_salary * 1.1)):,}",
+        'previous_employer_1': previous_companies[0] if len(previous_companies) > 0 else '',
+        'previous_position_1': fake.job() if len(previous_companies) > 0 else '',
+        'previous_employer_2': previous_companies[1] if len(previous_companies) > 1 else '',
+        'previous_position_2': fake.job() if len(previous_companies) > 1 else '',
+        'reason_for_leaving': rng.choice(('Pengembangan Karir', 'Peluang Lebih Baik', 'Relokasi', 'Restrukturisasi Perusahaan', 'Mencari Tantangan Baru')),
         
-        # Indonesian-specific preferences
-        work_authorization = random.choice(["WNI (Warga Negara Indonesia)", "WNA dengan Work Permit", "Permanent Resident"])
-        willing_to_relocate = random.choice(["Ya", "Tidak", "Dalam Pulau Jawa saja", "Dalam kota saja"])
-        remote_work_preference = random.choice(["Fully Remote", "Hybrid", "Work from Office", "Fleksibel"])
+        # Skills & Qualifications
+        'technical_skills': ', '.join(selected_skills[:4]),
+        'soft_skills': ', '.join(selected_skills[4:]),
+        'programming_languages': ', '.join(rng.sample(['Python', 'Java', 'JavaScript', 'PHP', 'SQL', 'R'], rng.randint(2, 4))) if category == 'Teknologi' else '',
+        'certifications': ', '.join(selected_certs) if selected_certs else 'Tidak ada',
+        'languages_spoken': languages_str,
         
-        # Indonesian city for address
-        city = random.choice(indonesian_cities)
+        # Additional Information
+        'cover_letter_submitted': rng.choice(('Ya', 'Tidak')),
+        'portfolio_url': f"https://portfolio.{first_name.lower()}{last_name.lower()}.com" if category in ['Teknologi', 'Pemasaran'] and rng.choice((True, False)) else '',
+        'github_profile': f"https://github.com/{first_name.lower()}{last_name.lower()}{rng.randint(10, 99)}" if category == 'Teknologi' and rng.choice((True, False)) else '',
         
-        # Generate Indonesian ID number format (NIK) - make it more realistic
-        province_codes = ["11", "12", "13", "14", "15", "16", "17", "18", "19", "21", "31", "32", "33", "34", "35", "36"]
-        selected_province_code = random.choice(province_codes)
-        nik = f"{selected_province_code}{random.randint(10, 99)}{random.randint(10, 99)}{random.randint(100000, 999999)}"
+        # Background Check
+        'criminal_background': rng.choice(('Tidak', 'Tidak', 'Tidak', 'Ya')),  # Weighted towards No
+        'drug_test_consent': rng.choice(('Ya', 'Tidak')),
+        'reference_check_consent': 'Ya',
         
-        # Indonesian phone number format
-        phone_prefixes = ["08", "081", "082", "085", "087", "088", "089"]
-        phone_primary = f"+62 {random.choice(phone_prefixes)[1:]}-{random.randint(1000, 9999)}-{random.randint(1000, 9999)}"
+        # References
+        'reference_1': references[0] if len(references) > 0 else '',
+        'reference_2': references[1] if len(references) > 1 else '',
+        'reference_3': references[2] if len(references) > 2 else '',
+        'emergency_contact_name': f"{fake.first_name()} {fake.last_name()}",
+        'emergency_contact_relationship': rng.choice(('Suami/Istri', 'Orang Tua', 'Saudara', 'Teman')),
+        'emergency_contact_phone': f"+62 {rng.choice(PHONE_PREFIXES)[1:]}-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
         
-        # Languages with Indonesian context
-        num_languages = random.randint(2, 4)
-        selected_languages = random.sample(indonesian_languages, num_languages)
-        languages_str = ", ".join(selected_languages)
+        # Preferences
+        'preferred_work_schedule': rng.choice(('Standar (9-17)', 'Jam Fleksibel', 'Mulai Pagi', 'Mulai Siang')),
+        'overtime_availability': rng.choice(('Ya', 'Terbatas', 'Tidak')),
+        'weekend_availability': rng.choice(('Ya', 'Kadang-kadang', 'Tidak')),
         
-        record = {
-            # Application Info
-            'application_id': f"APP{datetime.now().year}{str(i+1).zfill(4)}",
-            'application_date': fake.date_between(start_date='-60d', end_date='today').strftime('%d/%m/%Y'),
-            'application_status': random.choice(['Pending', 'Under Review', 'Interview Scheduled']),
-            
-            # Personal Information (Indonesian format)
-            'first_name': first_name,
-            'middle_name': fake.first_name() if random.choice([True, False]) else '',
-            'last_name': last_name,
-            'preferred_name': first_name if random.choice([True, False, False]) else '',
-            'gender': gender,
-            'date_of_birth': fake.date_of_birth(minimum_age=22, maximum_age=65).strftime('%d/%m/%Y'),
-            'nik': nik,  # Indonesian ID number
-            
-            # e-KTP specific fields (new additions)
-            'full_name': f"{first_name} {last_name}",
-            'birth_place': fake.city(),
-            'birth_date': fake.date_of_birth(minimum_age=22, maximum_age=65).strftime('%d-%m-%Y'),
-            'blood_type': random.choice(['A', 'B', 'AB', 'O', '-']),
-            'address': fake.street_address(),
-            'rt_rw': f"{random.randint(1, 20):03d}/{random.randint(1, 15):03d}",
-            'village_kelurahan': fake.city_suffix() + " " + fake.city(),
-            'district_kecamatan': "Kecamatan " + fake.city(),
-            'religion': random.choice(['Islam', 'Kristen', 'Katolik', 'Hindu', 'Buddha', 'Konghucu', 'Lainnya']),
-            'marital_status': random.choice(['Belum Menikah', 'Menikah', 'Duda/Janda']),
-            'occupation': fake.job(),
-            'nationality': 'WNI',
-            'valid_until': 'SEUMUR HIDUP',
-            'province': fake.state(),
-            'regency_city': city,
-            
-            # Contact Information (Indonesian format)
-            'email': f"{first_name.lower()}.{last_name.lower()}@{fake.domain_name()}",
-            'phone_primary': phone_primary,
-            'phone_secondary': f"+62 {random.choice(phone_prefixes)[1:]}-{random.randint(1000, 9999)}-{random.randint(1000, 9999)}" if random.choice([True, False, False]) else '',
-            'address_street': fake.street_address(),
-            'address_city': city,
-            'address_province': fake.state(),
-            'address_postal_code': fake.postcode(),
-            'address_country': 'Indonesia',
-            'linkedin_profile': f"https://linkedin.com/in/{first_name.lower()}-{last_name.lower()}-{random.randint(100, 999)}",
-            'personal_website': f"https://{first_name.lower()}{last_name.lower()}.com" if random.choice([True, False, False, False]) else '',
-            
-            # Position Information
-            'position_applied': position,
-            'department': category,
-            'employment_type': random.choice(['Full-time', 'Part-time', 'Contract', 'Magang']),
-            'desired_salary': f"Rp {desired_salary:,}",
-            'salary_negotiable': random.choice(['Ya', 'Tidak']),
-            'start_date_available': fake.date_between(start_date='today', end_date='+90d').strftime('%d/%m/%Y'),
-            'notice_period': random.choice(['Segera', '2 minggu', '1 bulan', '2 bulan']),
-            
-            # Work Authorization
-            'work_authorization': work_authorization,
-            'visa_status': 'Work Permit' if work_authorization == 'WNA dengan Work Permit' else 'N/A',
-            'willing_to_relocate': willing_to_relocate,
-            'remote_work_preference': remote_work_preference,
-            'travel_willingness': f"{random.randint(0, 50)}%",
-            
-            # Education
-            'education_level': education_level,
-            'university_name': random.choice(indonesian_universities),
-            'degree_major': random.choice(majors_by_category.get(category, ["Umum"])),
-            'degree_minor': random.choice(majors_by_category.get(category, [""])) if random.choice([True, False, False]) else '',
-            'graduation_year': random.randint(2010, 2024),
-            'gpa': round(random.uniform(3.0, 4.0), 2) if random.choice([True, False]) else '',
-            'academic_honors': random.choice(['Magna Cum Laude', 'Cum Laude', 'Dean\'s List', 'Wisudawan Terbaik', '']) if random.choice([True, False, False]) else '',
-            
-            # Professional Experience
-            'total_experience': experience,
-            'current_employer': random.choice(category_companies),
-            'current_position': fake.job(),
-            'current_salary': f"Rp {random.randint(int(desired_salary * 0.8), int(desired_salary * 1.1)):,}",
-            'previous_employer_1': previous_companies[0] if len(previous_companies) > 0 else '',
-            'previous_position_1': fake.job() if len(previous_companies) > 0 else '',
-            'previous_employer_2': previous_companies[1] if len(previous_companies) > 1 else '',
-            'previous_position_2': fake.job() if len(previous_companies) > 1 else '',
-            'reason_for_leaving': random.choice(['Pengembangan Karir', 'Peluang Lebih Baik', 'Relokasi', 'Restrukturisasi Perusahaan', 'Mencari Tantangan Baru']),
-            
-            # Skills & Qualifications
-            'technical_skills': ', '.join(selected_skills[:4]),
-            'soft_skills': ', '.join(selected_skills[4:]),
-            'programming_languages': ', '.join(random.sample(['Python', 'Java', 'JavaScript', 'PHP', 'SQL', 'R'], random.randint(2, 4))) if category == 'Teknologi' else '',
-            'certifications': ', '.join(selected_certs) if selected_certs else 'Tidak ada',
-            'languages_spoken': languages_str,
-            
-            # Additional Information
-            'cover_letter_submitted': random.choice(['Ya', 'Tidak']),
-            'portfolio_url': f"https://portfolio.{first_name.lower()}{last_name.lower()}.com" if category in ['Teknologi', 'Pemasaran'] and random.choice([True, False]) else '',
-            'github_profile': f"https://github.com/{first_name.lower()}{last_name.lower()}{random.randint(10, 99)}" if category == 'Teknologi' and random.choice([True, False]) else '',
-            
-            # Background Check
-            'criminal_background': random.choice(['Tidak', 'Tidak', 'Tidak', 'Ya']),  # Weighted towards No
-            'drug_test_consent': random.choice(['Ya', 'Tidak']),
-            'reference_check_consent': 'Ya',
-            
-            # References
-            'reference_1': references[0] if len(references) > 0 else '',
-            'reference_2': references[1] if len(references) > 1 else '',
-            'reference_3': references[2] if len(references) > 2 else '',
-            'emergency_contact_name': f"{fake.first_name()} {fake.last_name()}",
-            'emergency_contact_relationship': random.choice(['Suami/Istri', 'Orang Tua', 'Saudara', 'Teman']),
-            'emergency_contact_phone': f"+62 {random.choice(phone_prefixes)[1:]}-{random.randint(1000, 9999)}-{random.randint(1000, 9999)}",
-            
-            # Preferences
-            'preferred_work_schedule': random.choice(['Standar (9-17)', 'Jam Fleksibel', 'Mulai Pagi', 'Mulai Siang']),
-            'overtime_availability': random.choice(['Ya', 'Terbatas', 'Tidak']),
-            'weekend_availability': random.choice(['Ya', 'Kadang-kadang', 'Tidak']),
-            
-            # How they found the job
-            'how_found_position': random.choice(['Website Perusahaan', 'LinkedIn', 'JobStreet', 'Karir.com', 'Referensi', 'Job Fair', 'Recruiter']),
-            'referral_source': f"{fake.first_name()} {fake.last_name()}" if random.choice([True, False, False]) else '',
-            
-            # Additional Questions (in Indonesian)
-            'why_interested': f"Saya tertarik dengan posisi ini karena {fake.sentence()} dan ingin berkontribusi untuk kemajuan perusahaan.",
-            'career_goals': f"Tujuan karir saya adalah {fake.sentence()} dan mengembangkan keahlian dalam {random.choice(selected_skills)}.",
-            'greatest_strength': random.choice(['Problem Solving', 'Kepemimpinan', 'Komunikasi', 'Keahlian Teknis', 'Kerja Tim']),
-            'biggest_weakness': random.choice(['Perfeksionis', 'Public Speaking', 'Delegasi', 'Manajemen Waktu']),
-            
-            # Indonesian specific fields
-            'bpjs_number': f"BPJS-{random.randint(10000000, 99999999)}" if random.choice([True, False]) else '',
-            'npwp_number': f"{random.randint(10, 99)}.{random.randint(100, 999)}.{random.randint(100, 999)}.{random.randint(1, 9)}-{random.randint(100, 999)}.{random.randint(100, 999)}" if random.choice([True, False]) else '',
-            
-            # Signature and Consent
-            'electronic_signature': f"{first_name} {last_name}",
-            'signature_date': datetime.now().strftime('%d/%m/%Y'),
-            'terms_accepted': 'Ya',
-            'privacy_policy_accepted': 'Ya'
-        }
+        # How they found the job
+        'how_found_position': rng.choice(('Website Perusahaan', 'LinkedIn', 'JobStreet', 'Karir.com', 'Referensi', 'Job Fair', 'Recruiter')),
+        'referral_source': f"{fake.first_name()} {fake.last_name()}" if rng.choice((True, False, False)) else '',
+        
+        # Additional Questions (in Indonesian)
+        'why_interested': f"Saya tertarik dengan posisi ini karena {fake.sentence()} dan ingin berkontribusi untuk kemajuan perusahaan.",
+        'career_goals': f"Tujuan karir saya adalah {fake.sentence()} dan mengembangkan keahlian dalam {rng.choice(selected_skills)}.",
+        'greatest_strength': rng.choice(('Problem Solving', 'Kepemimpinan', 'Komunikasi', 'Keahlian Teknis', 'Kerja Tim')),
+        'biggest_weakness': rng.choice(('Perfeksionis', 'Public Speaking', 'Delegasi', 'Manajemen Waktu')),
+        
+        # Indonesian specific fields
+        'bpjs_number': f"BPJS-{rng.randint(10000000, 99999999)}" if rng.choice((True, False)) else '',
+        'npwp_number': f"{rng.randint(10, 99)}.{rng.randint(100, 999)}.{rng.randint(100, 999)}.{rng.randint(1, 9)}-{rng.randint(100, 999)}.{rng.randint(100, 999)}" if rng.choice((True, False)) else '',
         
-        data.append(record)
+        # Signature and Consent
+        'electronic_signature': f"{first_name} {last_name}",
+        'signature_date': datetime.now().strftime('%d/%m/%Y'),
+        'terms_accepted': 'Ya',
+        'privacy_policy_accepted': 'Ya'
+    }
     
-    return data
+    return record
 
-def save_to_csv(data, filename='indonesian_job_applications.csv'):
-    """Save data to CSV file"""
-    if not data:
-        print("No data to save!")
+def derive_seed(seed, *keys):
+    """Derive a stable 64-bit seed from a global seed and extra keys (e.g. record index)"""
+    material = ":".join(str(part) for part in (seed,) + keys).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(material, digest_size=8).digest(), 'big')
+
+def _seeded_generators(seed):
+    """Create an independent Faker/random pair seeded with `seed`"""
+    from faker import Faker
+    seeded_fake = Faker('id_ID')
+    seeded_fake.seed_instance(seed)
+    return seeded_fake, random.Random(seed)
+
+def _build_pool(seed, pool_size):
+    """Pre-draw a FakerPool; seeded pools only depend on (seed, pool_size)"""
+    if seed is None:
+        return FakerPool(fake, pool_size)
+    pool_seed = derive_seed(seed, 'pool')
+    pool_fake, pool_rng = _seeded_generators(pool_seed)
+    return FakerPool(pool_fake, pool_size, pool_rng)
+
+class RecordBuilder:
+    """Rebuilds any record from (seed, index) without generating the ones before it
+
+    The Faker source and RNG are reseeded from derive_seed(seed, index) before
+    every record, so record k is the same whether it is produced on its own,
+    in a streamed run or inside any shard. The pool (pooled mode) and the
+    IdAllocator only depend on the seed and are built once.
+    """
+
+    def __init__(self, seed=0, pooled=False, pool_size=DEFAULT_POOL_SIZE, year=None):
+        self.seed = seed
+        self.pooled = pooled
+        self.ids = IdAllocator(seed, year)
+        if pooled:
+            self.rng = FastRandom()
+            self.fake = _build_pool(seed, pool_size).bind(self.rng)
+        else:
+            from faker import Faker
+            self.rng = random.Random()
+            self.fake = Faker('id_ID')
+
+    def build(self, index):
+        record_seed = derive_seed(self.seed, index)
+        self.rng.seed(record_seed)
+        if not self.pooled:
+            self.fake.seed_instance(record_seed)
+        return _build_record(index, self.fake, self.rng, self.ids)
+
+# RecordBuilder cache for generate_record(), keyed by (seed, pooled, pool_size, year)
+_record_builders = {}
+
+def _get_record_builder(seed, pooled=False, pool_size=DEFAULT_POOL_SIZE, year=None):
+    key = (seed, pooled, pool_size if pooled else None, year)
+    if key not in _record_builders:
+        _record_builders[key] = RecordBuilder(seed, pooled, pool_size, year)
+    return _record_builders[key]
+
+def generate_record(index, seed=0, pooled=False, pool_size=DEFAULT_POOL_SIZE):
+    """Deterministically rebuild record #index of the dataset generated with `seed`"""
+    return _get_record_builder(seed, pooled, pool_size).build(index)
+
+def iter_indonesian_job_application_data(num_records=50, start_index=0, seed=None,
+                                         pooled=False, pool_size=DEFAULT_POOL_SIZE):
+    """Yield Indonesian job application records one at a time (constant memory)
+    
+    With pooled=True, Faker values are sampled from pre-drawn pools of
+    `pool_size` entries with a FastRandom instead of calling the Faker
+    providers per record. Seeded runs reseed per record (see RecordBuilder),
+    so any row can later be rebuilt with generate_record().
+    """
+    if seed is not None:
+        builder = _get_record_builder(seed, pooled, pool_size)
+        for i in range(start_index, start_index + num_records):
+            yield builder.build(i)
         return
     
-    fieldnames = data[0].keys()
+    if pooled:
+        rng = FastRandom()
+        record_fake = _build_pool(None, pool_size).bind(rng)
+    else:
+        record_fake, rng = fake, random
+    ids = IdAllocator()
+    for i in range(start_index, start_index + num_records):
+        yield _build_record(i, record_fake, rng, ids)
+
+def generate_indonesian_job_application_data(num_records=50, seed=None, pooled=False,
+                                             pool_size=DEFAULT_POOL_SIZE):
+    """Generate comprehensive and realistic Indonesian job application data"""
+    return list(iter_indonesian_job_application_data(num_records, seed=seed, pooled=pooled,
+                                                     pool_size=pool_size))
+
+def generate_applicant_batch(num_records=50, seed=None, pooled=False, pool_size=DEFAULT_POOL_SIZE):
+    """Same records as generate_indonesian_job_application_data(), held in a compact ApplicantBatch
+    
+    Records are appended as they are built, so the full list of dicts never
+    exists; indexing the batch gives read-only dict-like rows.
+    """
+    return ApplicantBatch.from_records(
+        iter_indonesian_job_application_data(num_records, seed=seed, pooled=pooled,
+                                             pool_size=pool_size),
+        fieldnames=FIELDNAMES)
+
+def _write_csv(records, filename, batch_size=1000, write_header=True):
+    """Write an iterable of records to CSV in batches; returns (count, fieldnames)"""
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        return 0, []
+    
+    fieldnames = list(first.keys())
+    total = 0
     
     with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+        if write_header:
+            writer.writeheader()
+        
+        # Only one batch of records is held in memory at any time
+        batch = [first]
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                writer.writerows(batch)
+                total += len(batch)
+                batch.clear()
+        writer.writerows(batch)
+        total += len(batch)
     
-    print(f"✅ Generated {len(data)} realistic Indonesian records and saved to {filename}")
+    return total, fieldnames
+
+def save_to_csv(data, filename='indonesian_job_applications.csv', batch_size=1000):
+    """Stream records (list or iterator) to a CSV file in buffered batches"""
+    total, fieldnames = _write_csv(data, filename, batch_size)
+    if not total:
+        print("No data to save!")
+        return 0
+    
+    print(f"✅ Generated {total} realistic Indonesian records and saved to {filename}")
     print(f"📊 Total columns: {len(fieldnames)}")
+    return total
 
-if __name__ == "__main__":
+def checkpoint_path(filename):
+    """Sidecar file holding the generation checkpoint for `filename`"""
+    return f"{filename}.checkpoint.json"
+
+def load_checkpoint(filename):
+    """Return the checkpoint state for `filename`, or None if there is none"""
+    path = checkpoint_path(filename)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def _save_checkpoint(filename, state):
+    # Write-then-rename so a crash never leaves a half-written checkpoint
+    path = checkpoint_path(filename)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    os.replace(path + '.tmp', path)
+
+def generate_with_checkpoints(filename='indonesian_job_applications.csv', num_records=50, seed=None,
+                              pooled=False, pool_size=DEFAULT_POOL_SIZE, checkpoint_every=100000,
+                              resume=False, append=0, batch_size=1000):
+    """Stream records to CSV, checkpointing progress so the job can resume or be extended
+    
+    Every `checkpoint_every` records the CSV is flushed to disk and the
+    checkpoint records the next record index and the byte size of the file.
+    Records are rebuilt from (seed, index), so that index plus the seed is the
+    whole RNG state. resume=True truncates any rows written after the last
+    checkpoint and continues to the original target; append=N extends a
+    finished (or resumed) dataset by N records. Neither re-reads existing rows,
+    and IDs continue from the next index so they stay contiguous and unique.
+    checkpoint_every=0 writes no checkpoint for a new file; a resumed or
+    appended run still updates its checkpoint once it completes.
+    """
+    state = load_checkpoint(filename) if (resume or append) else None
+    if resume or append:
+        if state is None or not os.path.exists(filename):
+            raise FileNotFoundError(f"No checkpoint for {filename}; it must be generated with checkpoints enabled")
+        state['target'] += append
+    else:
+        state = {
+            # Unseeded runs still need a seed to be resumable
+            'seed': seed if seed is not None else random.getrandbits(63),
+            'pooled': pooled,
+            'pool_size': pool_size,
+            'year': datetime.now().year,
+            'next_index': 0,
+            'target': num_records,
+            'bytes': 0,
+        }
+    
+    builder = _get_record_builder(state['seed'], state['pooled'], state['pool_size'], state['year'])
+    continuing = state['bytes'] > 0
+    start_index = state['next_index']
+    step = checkpoint_every if checkpoint_every > 0 else max(state['target'] - start_index, 1)
+    checkpointing = checkpoint_every > 0 or resume or append
+    
+    with open(filename, 'r+' if continuing else 'w', newline='', encoding='utf-8') as csvfile:
+        if continuing:
+            # Drop any partial rows written after the last checkpoint
+            csvfile.truncate(state['bytes'])
+            csvfile.seek(0, os.SEEK_END)
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
+        if not continuing:
+            writer.writeheader()
+            if checkpoint_every > 0:
+                # Initial checkpoint, so even a run that dies early can be resumed
+                csvfile.flush()
+                state['bytes'] = os.fstat(csvfile.fileno()).st_size
+                _save_checkpoint(filename, state)
+        
+        for chunk_start in range(start_index, state['target'], step):
+            chunk_end = min(chunk_start + step, state['target'])
+            records = (builder.build(i) for i in range(chunk_start, chunk_end))
+            while True:
+                batch = list(itertools.islice(records, batch_size))
+                if not batch:
+                    break
+                writer.writerows(batch)
+            
+            if checkpointing:
+                csvfile.flush()
+                os.fsync(csvfile.fileno())
+                state['next_index'] = chunk_end
+                state['bytes'] = os.fstat(csvfile.fileno()).st_size
+                _save_checkpoint(filename, state)
+                print(f"💾 Checkpoint: {chunk_end}/{state['target']} records")
+    
+    written = state['target'] - start_index
+    print(f"✅ Generated {written} realistic Indonesian records and saved to {filename}")
+    print(f"📊 Total columns: {len(FIELDNAMES)}")
+    return written
+
+def _shard_ranges(num_records, shards):
+    """Split [0, num_records) into `shards` contiguous (start, count) ranges"""
+    base, extra = divmod(num_records, shards)
+    ranges = []
+    start = 0
+    for shard in range(shards):
+        count = base + (1 if shard < extra else 0)
+        ranges.append((start, count))
+        start += count
+    return ranges
+
+def _generate_shard(task):
+    """Pool worker: generate one shard into its own part file"""
+    shard, start, count, seed, part_path, batch_size, pooled, pool_size = task
+    # Records are reseeded by index, so a shard only needs its index range;
+    # the builder (and its pool) is cached per worker process
+    builder = _get_record_builder(seed, pooled, pool_size)
+    records = (builder.build(i) for i in range(start, start + count))
+    # Only the first shard carries the header so parts can be concatenated as-is
+    total, _ = _write_csv(records, part_path, batch_size, write_header=(shard == 0))
+    return shard, total, part_path
+
+def generate_sharded_csv(num_records, filename='indonesian_job_applications.csv', seed=0,
+                         shards=None, workers=None, merge=True, batch_size=1000,
+                         pooled=False, pool_size=DEFAULT_POOL_SIZE, checkpoint=False):
+    """Generate records in parallel shards across a process pool
+    
+    Every record is reseeded from (seed, record index), so the output is
+    byte-identical for a given seed whatever the shard or worker count. Parts
+    are concatenated into `filename` unless merge is False. In pooled mode every
+    worker builds the same seeded FakerPool once and reuses it for its shards.
+    With `checkpoint` the merged file gets a completed checkpoint, so
+    generate_with_checkpoints(append=N) can extend it.
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = shards or workers
+    base, ext = os.path.splitext(filename)
+    tasks = [
+        (shard, start, count, seed, f"{base}.part{shard:04d}{ext}", batch_size,
+         pooled, pool_size)
+        for shard, (start, count) in enumerate(_shard_ranges(num_records, shards))
+        if count
+    ]
+    
+    part_paths = []
+    total = 0
+    with multiprocessing.Pool(min(workers, len(tasks)) or 1) as pool:
+        for shard, count, part_path in pool.imap(_generate_shard, tasks):
+            part_paths.append(part_path)
+            total += count
+            print(f"📦 Shard {shard + 1}/{len(tasks)} done: {count} records -> {part_path}")
+    
+    if not merge:
+        print(f"✅ Generated {total} records in {len(part_paths)} part files")
+        return part_paths
+    
+    with open(filename, 'wb') as merged:
+        for part_path in part_paths:
+            with open(part_path, 'rb') as part:
+                shutil.copyfileobj(part, merged, 1 << 20)
+            os.remove(part_path)
+    
+    if checkpoint:
+        _save_checkpoint(filename, {
+            'seed': seed, 'pooled': pooled, 'pool_size': pool_size, 'year': datetime.now().year,
+            'next_index': num_records, 'target': num_records, 'bytes': os.path.getsize(filename),
+        })
+    
+    print(f"✅ Generated {total} realistic Indonesian records and saved to {filename}")
+    return [filename]
+
+def main(argv=None):
+    """Command-line entry point (also used by `cli.py data`)"""
+    parser = argparse.ArgumentParser(description="Generate Indonesian job application dummy data")
+    parser.add_argument('-n', '--num-records', type=int, default=50, help="Number of records to generate")
+    parser.add_argument('-o', '--output', default='indonesian_job_applications.csv', help="Output CSV file")
+    parser.add_argument('--batch-size', type=int, default=1000, help="Records buffered per CSV write")
+    parser.add_argument('--seed', type=int, default=None, help="Seed for reproducible output")
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes (>1 enables sharded mode)")
+    parser.add_argument('--shards', type=int, default=None, help="Number of shards (defaults to --workers)")
+    parser.add_argument('--pooled', action='store_true', help="Sample Faker values from pre-drawn pools (much faster)")
+    parser.add_argument('--pool-size', type=int, default=DEFAULT_POOL_SIZE, help="Values per Faker pool (bigger = more realistic, slower start)")
+    parser.add_argument('--columnar', action='store_true', help="Use the NumPy columnar batch engine (implies pooled values)")
+    parser.add_argument('--keep-parts', action='store_true', help="Keep shard part files instead of merging")
+    parser.add_argument('--checkpoint-every', type=int, default=0, metavar='N',
+                        help="Flush and checkpoint every N records, so the run can be resumed or "
+                             "appended to (default: no checkpoint file)")
+    parser.add_argument('--resume', action='store_true', help="Resume an interrupted run from its checkpoint")
+    parser.add_argument('--append', type=int, default=0, metavar='N',
+                        help="Append N more records to an existing checkpointed CSV")
+    parser.add_argument('--show-record', type=int, metavar='INDEX', default=None,
+                        help="Print record INDEX of the seeded dataset as JSON and exit")
+    args = parser.parse_args(argv)
+    continuing = args.resume or args.append
+    if continuing and args.columnar:
+        parser.error("--resume/--append are not supported with --columnar")
+    if continuing and (args.workers > 1 or args.shards):
+        parser.error("--resume/--append are not supported with --workers/--shards")
+    
+    if args.show_record is not None:
+        record = generate_record(args.show_record, seed=args.seed or 0, pooled=args.pooled, pool_size=args.pool_size)
+        print(json.dumps(record, ensure_ascii=False, indent=2))
+        return
+    
     # Generate Indonesian dummy data
     print("🇮🇩 Generating comprehensive Indonesian job application data...")
     print("📋 This includes Indonesian names, addresses, companies, and cultural context...")
     
-    dummy_data = generate_indonesian_job_application_data(50)  # Generate 50 records
+    if args.columnar:
+        from columnar_generator import iter_columnar_batches, save_columnar_to_csv
+        save_columnar_to_csv(iter_columnar_batches(args.num_records, seed=args.seed, pool_size=args.pool_size),
+                             args.output)
+        preview_file = args.output
+    elif args.workers > 1 or args.shards:
+        # Unseeded sharded runs still need one seed shared by all shards
+        seed = args.seed if args.seed is not None else random.getrandbits(63)
+        outputs = generate_sharded_csv(args.num_records, args.output, seed=seed,
+                                       shards=args.shards, workers=args.workers,
+                                       merge=not args.keep_parts, batch_size=args.batch_size,
+                                       pooled=args.pooled, pool_size=args.pool_size,
+                                       checkpoint=args.checkpoint_every > 0)
+        preview_file = outputs[0]
+    else:
+        # Records are streamed straight to disk, with periodic checkpoints if asked for
+        generate_with_checkpoints(args.output, args.num_records, seed=args.seed,
+                                  pooled=args.pooled, pool_size=args.pool_size,
+                                  checkpoint_every=args.checkpoint_every, resume=args.resume,
+                                  append=args.append, batch_size=args.batch_size)
+        preview_file = args.output
     
-    # Save to CSV
-    save_to_csv(dummy_data)
+    with open(preview_file, newline='', encoding='utf-8') as csvfile:
+        sample_record = next(csv.DictReader(csvfile), None)
+    if sample_record is None:
+        print("No data to save!")
+        return
     
     # Display sample data structure
     print("\n📋 Indonesian data structure overview:")
-    sample_record = dummy_data[0]
     categories = {
         'Info Aplikasi': ['application_id', 'application_date', 'application_status'],
         'Info Personal': ['first_name', 'last_name', 'gender', 'date_of_birth', 'nik'],
@@ -413,4 +807,7 @@ if __name__ == "__main__":
     print(f"Universitas: {sample_record['university_name']}")
     print(f"Kota: {sample_record['address_city']}")
     print(f"Gaji yang diinginkan: {sample_record['desired_salary']}")
-    print(f"Bahasa: {sample_record['languages_spoken']}")
\ No newline at end of file
+    print(f"Bahasa: {sample_record['languages_spoken']}")
+
+if __name__ == "__main__":
+    main()
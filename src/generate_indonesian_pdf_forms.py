@@ -1,4 +1,3 @@
-import csv
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -6,18 +5,83 @@ from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER
 from reportlab.pdfgen import canvas
+from reportlab.pdfbase.pdfdoc import PDFZCompress
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.lib.utils import simpleSplit
+import argparse
+import csv
+import io
+import itertools
+import multiprocessing
 import os
+from collections import namedtuple
+from contextlib import nullcontext
+from copy import copy
 from datetime import datetime
 
+from archive_sink import ARCHIVE_FORMATS, ArchiveWriter, archive_format, index_path
+from dataset_store import read_rows
+from output_layout import FANOUT_SCHEMES, OUTPUT_INDEX, OutputLayout
+from process_pool import imap_bounded
+from render_manifest import RenderManifest, discard_manifest, file_version, row_hash
+
 class IndonesianApplicationFormCanvas(canvas.Canvas):
-    """Custom canvas for Indonesian job application forms with headers and footers"""
+    """Custom canvas for Indonesian job application forms with headers and footers
+    
+    One canvas can hold several applicants' forms: start_form() switches the
+    header to the next applicant and restarts the page numbering.
+    stream_filters replaces reportlab's page and form stream filters for
+    this document only (rl_config.useA85 is left alone).
+    """
     
     def __init__(self, *args, **kwargs):
         self.applicant_name = kwargs.pop('applicant_name', '')
         self.app_id = kwargs.pop('app_id', '')
+        stream_filters = kwargs.pop('stream_filters', None)
+        if stream_filters is not None:
+            # Uncompressed pages and forms fall back to the document's filters
+            kwargs['pageCompression'] = 0
         canvas.Canvas.__init__(self, *args, **kwargs)
+        if stream_filters is not None:
+            self._doc.defaultStreamFilters = stream_filters
+        # Document page on which the current applicant's form starts
+        self.form_first_page = 1
+        # Form XObject with the header/footer rules, once define_rules_form() ran
+        self.rules_form = None
+        self._font_resources = {}
+    
+    def start_form(self, applicant_name, app_id):
+        """Begin the next applicant's form on the current (empty) page"""
+        self.applicant_name = applicant_name
+        self.app_id = app_id
+        self.form_first_page = self.getPageNumber()
+    
+    def define_rules_form(self, name='PageRules'):
+        """Draw the header/footer rules once as a Form XObject referenced by every page"""
+        self.beginForm(name)
+        self._draw_header_rule()
+        self._draw_footer_rule()
+        self.endForm()
+        self.rules_form = name
+    
+    def font_resource(self, name):
+        """PDF resource name (/F1, /F2...) of a font, registering it with the document
+        
+        Together with stream_filters in __init__, the only use of reportlab
+        internals in this module: literal text operators need the resource
+        name and the Canvas API has no public accessor for it (nor for the
+        document's default filters). PDFDocument.getInternalFontName and
+        defaultStreamFilters have been stable across reportlab 3.x and 4.x;
+        requirements.txt pins the version.
+        """
+        resource = self._font_resources.get(name)
+        if resource is None:
+            resource = self._font_resources[name] = self._doc.getInternalFontName(name)
+        return resource
     
     def showPage(self):
+        if self.rules_form:
+            self.doForm(self.rules_form)
         self._draw_header()
         self._draw_footer()
         canvas.Canvas.showPage(self)
@@ -28,8 +92,13 @@ class IndonesianApplicationFormCanvas(canvas.Canvas):
         self.setFillColor(colors.darkred)
         self.drawString(50, A4[1] - 30, f"FORMULIR LAMARAN KERJA - {self.applicant_name}")
         self.drawRightString(A4[0] - 50, A4[1] - 30, f"ID Aplikasi: {self.app_id}")
-        
+        self.restoreState()
+        if not self.rules_form:
+            self._draw_header_rule()
+    
+    def _draw_header_rule(self):
         # Draw Indonesian flag colors line under header
+        self.saveState()
         self.setStrokeColor(colors.red)
         self.setLineWidth(2)
         self.line(50, A4[1] - 35, A4[0]/2 - 10, A4[1] - 35)
@@ -45,411 +114,1066 @@ class IndonesianApplicationFormCanvas(canvas.Canvas):
         self.saveState()
         self.setFont("Helvetica", 8)
         self.setFillColor(colors.grey)
-        footer_text = f"Dibuat pada {datetime.now().strftime('%d %B %Y')} | Halaman {self._pageNumber} | diwahsap@2025"
-        self.drawCentredText(A4[0]/2, 30, footer_text)
-        
+        page = self.getPageNumber() - self.form_first_page + 1
+        footer_text = f"Dibuat pada {datetime.now().strftime('%d %B %Y')} | Halaman {page} | diwahsap@2025"
+        self.drawCentredString(A4[0]/2, 30, footer_text)
+        self.restoreState()
+        if not self.rules_form:
+            self._draw_footer_rule()
+    
+    def _draw_footer_rule(self):
         # Draw line above footer
+        self.saveState()
         self.setStrokeColor(colors.lightgrey)
         self.setLineWidth(0.5)
         self.line(50, 40, A4[0] - 50, 40)
         self.restoreState()
 
-def create_indonesian_pdf(applicant_data, output_folder='indonesian_pdf_forms'):
-    """Create a comprehensive Indonesian PDF job application form"""
+# Label/value grid looks; each TableStyle / canvas drawing is derived from one of these
+GridSpec = namedtuple('GridSpec', 'background font_size label_columns valign spans')
+
+def _grid(background, font_size=9, label_columns=(0, 2), valign='MIDDLE', spans=()):
+    return GridSpec(background, font_size, label_columns, valign, spans)
+
+def _grid_style(grid):
+    """TableStyle for a GridSpec"""
+    commands = [('BACKGROUND', (col, 0), (col, -1), grid.background) for col in grid.label_columns]
+    commands += [
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), grid.font_size),
+    ]
+    commands += [('FONTNAME', (col, 0), (col, -1), 'Helvetica-Bold') for col in grid.label_columns]
+    commands += [
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('VALIGN', (0, 0), (-1, -1), grid.valign),
+    ]
+    commands += [('SPAN', start, end) for start, end in grid.spans]
+    return TableStyle(commands)
+
+class FormTemplate:
+    """Everything in the application form that does not depend on the applicant
     
-    # Create output folder if it doesn't exist
-    if not os.path.exists(output_folder):
-        os.makedirs(output_folder)
+    Style sheets, grid styles, column widths and the static paragraphs are
+    built once. blocks() lays one applicant's values out as engine-neutral
+    blocks and table_cells() wraps a table's long values to its columns;
+    build_story() turns them into platypus flowables and CanvasFormRenderer
+    draws them directly, so both engines break lines and pages alike. Use
+    get_form_template() to share one instance per process.
+    """
     
-    # Generate filename
-    safe_name = "".join(c for c in f"{applicant_data['last_name']}_{applicant_data['first_name']}" if c.isalnum() or c in (' ', '-', '_')).rstrip()
-    filename = f"{applicant_data['application_id']}_{safe_name}.pdf"
-    filepath = os.path.join(output_folder, filename)
+    # Platypus Table cell defaults
+    CELL_PADDING_X = 6
+    CELL_PADDING_Y = 3
+    CELL_LEADING = 12
     
-    # Create custom canvas with A4 size (more common in Indonesia)
-    doc = SimpleDocTemplate(
-        filepath, 
-        pagesize=A4, 
-        topMargin=0.8*inch, 
-        bottomMargin=0.8*inch,
-        leftMargin=0.6*inch,
-        rightMargin=0.6*inch
+    DECLARATION = """Saya menyatakan bahwa informasi yang saya berikan dalam formulir aplikasi ini adalah benar dan lengkap. 
+    Saya memahami bahwa informasi yang salah dapat menyebabkan penolakan atau pemutusan hubungan kerja jika saya diterima. 
+    Saya mengizinkan perusahaan untuk menghubungi referensi dan memverifikasi informasi yang saya berikan."""
+    FOOTER_NOTE = "Terima kasih telah melamar di perusahaan kami. Kami akan menghubungi Anda dalam waktu 2-3 minggu."
+    SECTIONS = (
+        "1. DATA PRIBADI (PERSONAL INFORMATION)",
+        "2. INFORMASI POSISI (POSITION DETAILS)",
+        "3. RIWAYAT PENDIDIKAN (EDUCATION BACKGROUND)",
+        "4. PENGALAMAN KERJA (PROFESSIONAL EXPERIENCE)",
+        "5. KEAHLIAN & KUALIFIKASI (SKILLS & QUALIFICATIONS)",
+        "6. REFERENSI PROFESIONAL (PROFESSIONAL REFERENCES)",
+        "7. INFORMASI TAMBAHAN (ADDITIONAL INFORMATION)",
+        "8. PERNYATAAN DAN TANDA TANGAN (DECLARATION & SIGNATURE)",
     )
     
-    # Override the canvas class
-    doc.canvasmaker = lambda *args, **kwargs: IndonesianApplicationFormCanvas(
-        *args, 
-        applicant_name=f"{applicant_data['first_name']} {applicant_data['last_name']}",
-        app_id=applicant_data['application_id'],
-        **kwargs
-    )
+    def __init__(self):
+        styles = getSampleStyleSheet()
+        
+        # Custom Indonesian styles
+        title_style = ParagraphStyle(
+            'IndonesianTitle',
+            parent=styles['Heading1'],
+            fontSize=22,
+            spaceAfter=15,
+            alignment=TA_CENTER,
+            textColor=colors.darkred,
+            fontName='Helvetica-Bold'
+        )
+        section_style = ParagraphStyle(
+            'IndonesianSection',
+            parent=styles['Heading2'],
+            fontSize=13,
+            spaceAfter=6,
+            spaceBefore=12,
+            textColor=colors.darkred,
+            fontName='Helvetica-Bold',
+            borderWidth=1,
+            borderColor=colors.darkred,
+            borderPadding=4,
+            backColor=colors.lightcoral
+        )
+        subsection_style = ParagraphStyle(
+            'IndonesianSubsection',
+            parent=styles['Heading3'],
+            fontSize=11,
+            spaceAfter=4,
+            spaceBefore=8,
+            textColor=colors.darkblue,
+            fontName='Helvetica-Bold'
+        )
+        self.paragraph_styles = {
+            'title': title_style,
+            'normal': styles['Normal'],
+            'section': section_style,
+            'subsection': subsection_style,
+        }
+        
+        # Grid looks (identical grids share one entry)
+        self.grids = {
+            'app': _grid(colors.lightcoral),
+            'detail': _grid(colors.lightgrey),
+            'contact': _grid(colors.lightgrey, font_size=8, spans=(((1, 2), (3, 2)),)),  # Span address across columns
+            'experience': _grid(colors.lightgrey, spans=(((1, 4), (3, 4)),)),  # Span reason for leaving
+            'skills': _grid(colors.lightgrey, label_columns=(0,), valign='TOP'),
+            'references': _grid(colors.lightgrey, font_size=8),
+            'emergency': _grid(colors.lightyellow, spans=(((1, 1), (3, 1)),)),
+            'additional': _grid(colors.lightgrey, label_columns=(0,)),
+        }
+        self.table_styles = {name: _grid_style(grid) for name, grid in self.grids.items()}
+        
+        # Column widths
+        self.app_widths = (1.4*inch, 2*inch, 1.4*inch, 2*inch)
+        self.personal_widths = (1.5*inch, 2.4*inch, 1.4*inch, 1.5*inch)
+        self.detail_widths = (1.7*inch, 2.2*inch, 1.5*inch, 1.4*inch)
+        self.skills_widths = (2*inch, 4.8*inch)
+        self.ref_widths = (1.4*inch, 2.4*inch, 1.2*inch, 1.8*inch)
+        self.additional_widths = (2.2*inch, 4.6*inch)
+        self.signature_widths = (1.8*inch, 2.5*inch, 1.2*inch, 1.3*inch)
+        
+        # Parsed static paragraphs, filled on first use by _paragraph()
+        self._paragraphs = {}
     
-    # Get styles
-    styles = getSampleStyleSheet()
-    
-    # Custom Indonesian styles
-    title_style = ParagraphStyle(
-        'IndonesianTitle',
-        parent=styles['Heading1'],
-        fontSize=22,
-        spaceAfter=15,
-        alignment=TA_CENTER,
-        textColor=colors.darkred,
-        fontName='Helvetica-Bold'
-    )
+    def _paragraph(self, style, text):
+        paragraph = self._paragraphs.get((style, text))
+        if paragraph is None:
+            paragraph = self._paragraphs[(style, text)] = Paragraph(text, self.paragraph_styles[style])
+        # Layout mutates flowables, so every form gets a shallow clone of the parsed one
+        return copy(paragraph)
     
-    section_style = ParagraphStyle(
-        'IndonesianSection',
-        parent=styles['Heading2'],
-        fontSize=13,
-        spaceAfter=6,
-        spaceBefore=12,
-        textColor=colors.darkred,
-        fontName='Helvetica-Bold',
-        borderWidth=1,
-        borderColor=colors.darkred,
-        borderPadding=4,
-        backColor=colors.lightcoral
-    )
+    def build_story(self, applicant_data):
+        """Platypus flowables for one applicant"""
+        content = []
+        for block in self.blocks(applicant_data):
+            kind = block[0]
+            if kind == 'table':
+                _, rows, widths, grid = block
+                # Plain-string cells break at newlines, so wrapped values go in as lines
+                wrapped = []
+                for row, cells in zip(rows, self.table_cells(rows, widths, grid)):
+                    row = list(row)
+                    for c, _, _, _, lines in cells:
+                        row[c] = '\n'.join(lines)
+                    wrapped.append(row)
+                table = Table(wrapped, colWidths=widths)
+                table.setStyle(self.table_styles[grid])
+                content.append(table)
+            elif kind == 'gap':
+                content.append(Spacer(1, block[1]))
+            else:
+                content.append(self._paragraph(block[1], block[2]))
+        return content
     
-    subsection_style = ParagraphStyle(
-        'IndonesianSubsection',
-        parent=styles['Heading3'],
-        fontSize=11,
-        spaceAfter=4,
-        spaceBefore=8,
-        textColor=colors.darkblue,
-        fontName='Helvetica-Bold'
-    )
+    def table_cells(self, rows, widths, grid_name):
+        """The cells of a table block, one list per row: (first col, last col, is_label, font, lines)
+        
+        Labels are fixed and stay on one line; values wider than their
+        (possibly spanned) cell are wrapped with simpleSplit, and the row
+        grows to fit them.
+        """
+        grid = self.grids[grid_name]
+        size = grid.font_size
+        col_x = [0]
+        for width in widths:
+            col_x.append(col_x[-1] + width)
+        # Only horizontal spans occur on this form: (first col, row) -> last col
+        span_end = {(start[0], start[1]): end[0] for start, end in grid.spans}
+        table = []
+        for r, row in enumerate(rows):
+            cells = []
+            c = 0
+            while c < len(row):
+                last = span_end.get((c, r), c)
+                is_label = c in grid.label_columns
+                font = 'Helvetica-Bold' if is_label else 'Helvetica'
+                text = str(row[c])
+                inner = col_x[last + 1] - col_x[c] - 2 * self.CELL_PADDING_X
+                if is_label or stringWidth(text, font, size) <= inner:
+                    lines = text.split('\n')
+                else:
+                    lines = simpleSplit(text, font, size, inner) or ['']
+                cells.append((c, last, is_label, font, lines))
+                c = last + 1
+            table.append(cells)
+        return table
     
-    # Build content
-    content = []
+    def blocks(self, applicant_data):
+        """The form for one applicant, top to bottom
+        
+        Blocks are ('paragraph', style, text), ('gap', height) and
+        ('table', rows, col_widths, grid), where style and grid are keys of
+        paragraph_styles and grids.
+        """
+        sections = self.SECTIONS
+        small_gap = ('gap', 0.15*inch)
+        gap = ('gap', 0.2*inch)
+        
+        # Build content
+        content = []
+        
+        # Title with Indonesian flag motif
+        content.append(('paragraph', 'title', "FORMULIR LAMARAN KERJA"))
+        content.append(('paragraph', 'normal', "(JOB APPLICATION FORM)"))
+        content.append(small_gap)
+        
+        # Company info and application details
+        app_info_data = [
+            ['ID Aplikasi:', applicant_data['application_id'], 'Tanggal Submit:', applicant_data['application_date']],
+            ['Status:', applicant_data.get('application_status', 'Pending'), 'Posisi:', applicant_data['position_applied']],
+            ['Departemen:', applicant_data.get('department', 'N/A'), 'Tipe Kerja:', applicant_data.get('employment_type', 'Full-time')]
+        ]
+        content.append(('table', app_info_data, self.app_widths, 'app'))
+        content.append(gap)
+        
+        # Personal Information Section
+        content.append(('paragraph', 'section', sections[0]))
+        
+        personal_data = [
+            ['Nama Lengkap:', f"{applicant_data['first_name']} {applicant_data.get('middle_name', '')} {applicant_data['last_name']}".replace('  ', ' '),
+             'Nama Panggilan:', applicant_data.get('preferred_name', 'Sama dengan nama lengkap')],
+            ['Tanggal Lahir:', applicant_data['date_of_birth'], 'Jenis Kelamin:', applicant_data.get('gender', 'Tidak disebutkan')],
+            ['NIK:', applicant_data.get('nik', 'XXXXXXXXXXXX'), 'Status Kewarganegaraan:', applicant_data.get('work_authorization', 'WNI')],
+            ['Agama:', applicant_data.get('religion', 'N/A'), 'Status Pernikahan:', applicant_data.get('marital_status', 'Belum Menikah')]
+        ]
+        content.append(('table', personal_data, self.personal_widths, 'detail'))
+        content.append(small_gap)
+        
+        # Contact Information
+        content.append(('paragraph', 'subsection', "Informasi Kontak (Contact Information)"))
+        
+        contact_data = [
+            ['Email Utama:', applicant_data['email'], 'Telepon Utama:', applicant_data['phone_primary']],
+            ['Telepon Kedua:', applicant_data.get('phone_secondary', 'Tidak ada'), 'LinkedIn:', applicant_data.get('linkedin_profile', 'Tidak ada')],
+            ['Alamat Lengkap:', f"{applicant_data['address_street']}, {applicant_data['address_city']}, {applicant_data['address_province']} {applicant_data['address_postal_code']}", '', ''],
+            ['Website/Portfolio:', applicant_data.get('personal_website', 'Tidak ada'), 'GitHub:', applicant_data.get('github_profile', 'Tidak ada')]
+        ]
+        content.append(('table', contact_data, self.personal_widths, 'contact'))
+        content.append(gap)
+        
+        # Position Information
+        content.append(('paragraph', 'section', sections[1]))
+        
+        position_data = [
+            ['Gaji yang Diinginkan:', applicant_data['desired_salary'], 'Dapat Dinegosiasi:', applicant_data.get('salary_negotiable', 'Ya')],
+            ['Tanggal Mulai Kerja:', applicant_data.get('start_date_available', 'Segera'), 'Notice Period:', applicant_data.get('notice_period', '2 minggu')],
+            ['Preferensi Remote:', applicant_data.get('remote_work_preference', 'Fleksibel'), 'Kesediaan Travel:', applicant_data.get('travel_willingness', '0%')],
+            ['Bersedia Relokasi:', applicant_data.get('willing_to_relocate', 'Tidak'), 'Kesediaan Lembur:', applicant_data.get('overtime_availability', 'Ya')]
+        ]
+        content.append(('table', position_data, self.detail_widths, 'detail'))
+        content.append(gap)
+        
+        # Education Section
+        content.append(('paragraph', 'section', sections[2]))
+        
+        education_data = [
+            ['Jenjang Pendidikan:', applicant_data['education_level'], 'Tahun Lulus:', str(applicant_data['graduation_year'])],
+            ['Universitas/Institusi:', applicant_data['university_name'], 'IPK/GPA:', applicant_data.get('gpa', 'Tidak disebutkan')],
+            ['Jurusan Utama:', applicant_data['degree_major'], 'Jurusan Sampingan:', applicant_data.get('degree_minor', 'Tidak ada')],
+            ['Penghargaan Akademik:', applicant_data.get('academic_honors', 'Tidak ada'), 'Bahasa yang Dikuasai:', applicant_data.get('languages_spoken', 'Bahasa Indonesia')]
+        ]
+        content.append(('table', education_data, self.detail_widths, 'detail'))
+        content.append(gap)
+        
+        # Professional Experience
+        content.append(('paragraph', 'section', sections[3]))
+        
+        experience_data = [
+            ['Total Pengalaman:', applicant_data['total_experience'], 'Gaji Saat Ini:', applicant_data.get('current_salary', 'Tidak disebutkan')],
+            ['Perusahaan Saat Ini:', applicant_data['current_employer'], 'Posisi Saat Ini:', applicant_data['current_position']],
+            ['Perusahaan Sebelumnya 1:', applicant_data.get('previous_employer_1', 'Tidak ada'), 'Posisi:', applicant_data.get('previous_position_1', 'Tidak ada')],
+            ['Perusahaan Sebelumnya 2:', applicant_data.get('previous_employer_2', 'Tidak ada'), 'Posisi:', applicant_data.get('previous_position_2', 'Tidak ada')],
+            ['Alasan Keluar:', applicant_data.get('reason_for_leaving', 'Pengembangan Karir'), '', '']
+        ]
+        content.append(('table', experience_data, self.detail_widths, 'experience'))
+        content.append(gap)
+        
+        # Skills and Certifications
+        content.append(('paragraph', 'section', sections[4]))
+        
+        skills_data = [
+            ['Keahlian Teknis:', applicant_data.get('technical_skills', 'Tidak disebutkan')],
+            ['Soft Skills:', applicant_data.get('soft_skills', 'Tidak disebutkan')],
+            ['Bahasa Pemrograman:', applicant_data.get('programming_languages', 'Tidak ada')],
+            ['Sertifikasi:', applicant_data.get('certifications', 'Tidak ada')],
+            ['Kelebihan Utama:', applicant_data.get('greatest_strength', 'Tidak disebutkan')],
+            ['Area Pengembangan:', applicant_data.get('biggest_weakness', 'Tidak disebutkan')]
+        ]
+        content.append(('table', skills_data, self.skills_widths, 'skills'))
+        content.append(gap)
+        
+        # References
+        content.append(('paragraph', 'section', sections[5]))
+        
+        ref_data = []
+        for i in range(1, 4):
+            ref_key = f'reference_{i}'
+            if applicant_data.get(ref_key):
+                ref_info = applicant_data[ref_key].split(', ')
+                if len(ref_info) >= 4:
+                    ref_data.append([f'Referensi {i}:', ref_info[0], 'Jabatan:', ref_info[1].replace(' di ', ' - ')])
+                    ref_data.append(['Perusahaan:', ref_info[2], 'Kontak:', f"{ref_info[3]} / {ref_info[4] if len(ref_info) > 4 else 'N/A'}"])
+                else:
+                    ref_data.append([f'Referensi {i}:', applicant_data[ref_key], '', ''])
+            else:
+                ref_data.append([f'Referensi {i}:', 'Tersedia bila diminta', '', ''])
+        
+        if ref_data:
+            content.append(('table', ref_data, self.ref_widths, 'references'))
+        content.append(small_gap)
+        
+        # Emergency Contact
+        emergency_data = [
+            ['Kontak Darurat:', applicant_data.get('emergency_contact_name', 'Tidak disebutkan'), 
+             'Hubungan:', applicant_data.get('emergency_contact_relationship', 'Tidak disebutkan')],
+            ['Telepon Darurat:', applicant_data.get('emergency_contact_phone', 'Tidak disebutkan'), '', '']
+        ]
+        content.append(('table', emergency_data, self.detail_widths, 'emergency'))
+        content.append(gap)
+        
+        # Additional Information
+        content.append(('paragraph', 'section', sections[6]))
+        
+        additional_data = [
+            ['Bagaimana mengetahui lowongan ini?', applicant_data.get('how_found_position', 'Tidak disebutkan')],
+            ['Sumber Referensi:', applicant_data.get('referral_source', 'Tidak ada')],
+            ['Cover Letter Dilampirkan:', applicant_data.get('cover_letter_submitted', 'Tidak')],
+            ['Nomor BPJS:', applicant_data.get('bpjs_number', 'Tidak disebutkan')],
+            ['Nomor NPWP:', applicant_data.get('npwp_number', 'Tidak disebutkan')],
+            ['Persetujuan Background Check:', applicant_data.get('reference_check_consent', 'Ya')],
+            ['Persetujuan Drug Test:', applicant_data.get('drug_test_consent', 'Ya')]
+        ]
+        content.append(('table', additional_data, self.additional_widths, 'additional'))
+        content.append(gap)
+        
+        # Signature section
+        content.append(('paragraph', 'section', sections[7]))
+        content.append(('paragraph', 'normal', self.DECLARATION))
+        content.append(small_gap)
+        
+        signature_data = [
+            ['Tanda Tangan Elektronik:', applicant_data.get('electronic_signature', ''), 'Tanggal:', applicant_data.get('signature_date', '')],
+            ['Nama Lengkap:', f"{applicant_data['first_name']} {applicant_data['last_name']}", 'Syarat & Ketentuan:', applicant_data.get('terms_accepted', 'Ya')]
+        ]
+        content.append(('table', signature_data, self.signature_widths, 'detail'))
+        
+        # Footer note
+        content.append(small_gap)
+        content.append(('paragraph', 'normal', self.FOOTER_NOTE))
+        return content
+
+def _pdf_text(text):
+    """Escape a printable ASCII string for a PDF literal"""
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def _rgb(color):
+    return "%.4f %.4f %.4f" % color.rgb()
+
+class _Page:
+    """Pending drawing operations of one page, split into layout and applicant values
     
-    # Title with Indonesian flag motif
-    content.append(Paragraph("FORMULIR LAMARAN KERJA", title_style))
-    content.append(Paragraph("(JOB APPLICATION FORM)", styles['Normal']))
-    content.append(Spacer(1, 0.15*inch))
+    `blocks` holds what only depends on the layout (banners, paragraphs,
+    label cells, grid rows) as (group, content, bottom) entries drawn
+    relative to the block's bottom edge, where the rows of one table share a
+    group, `values` the applicant's values and `fallback` the
+    strings that need the canvas' font encoding (non-ASCII).
+    """
     
-    # Company info and application details
-    app_info_data = [
-        ['ID Aplikasi:', applicant_data['application_id'], 'Tanggal Submit:', applicant_data['application_date']],
-        ['Status:', applicant_data.get('application_status', 'Pending'), 'Posisi:', applicant_data['position_applied']],
-        ['Departemen:', applicant_data.get('department', 'N/A'), 'Tipe Kerja:', applicant_data.get('employment_type', 'Full-time')]
-    ]
+    def __init__(self, canv, top, bottom, forms):
+        self.canv = canv
+        self.top = top
+        self.bottom = bottom
+        self.forms = forms
+        self.y = top
+        self.space_after = 0
+        self.at_top = True
+        self.blocks = []
+        self.values = []
+        self.fallback = []
+        self._groups = itertools.count()
     
-    app_table = Table(app_info_data, colWidths=[1.4*inch, 2*inch, 1.4*inch, 2*inch])
-    app_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightcoral),
-        ('BACKGROUND', (2, 0), (2, -1), colors.lightcoral),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    content.append(app_table)
-    content.append(Spacer(1, 0.2*inch))
-    
-    # Personal Information Section
-    content.append(Paragraph("1. DATA PRIBADI (PERSONAL INFORMATION)", section_style))
-    
-    personal_data = [
-        ['Nama Lengkap:', f"{applicant_data['first_name']} {applicant_data.get('middle_name', '')} {applicant_data['last_name']}".replace('  ', ' '),
-         'Nama Panggilan:', applicant_data.get('preferred_name', 'Sama dengan nama lengkap')],
-        ['Tanggal Lahir:', applicant_data['date_of_birth'], 'Jenis Kelamin:', applicant_data.get('gender', 'Tidak disebutkan')],
-        ['NIK:', applicant_data.get('nik', 'XXXXXXXXXXXX'), 'Status Kewarganegaraan:', applicant_data.get('work_authorization', 'WNI')],
-        ['Agama:', applicant_data.get('religion', 'N/A'), 'Status Pernikahan:', applicant_data.get('marital_status', 'Belum Menikah')]
-    ]
+    def group(self):
+        """New block group id (one per paragraph or table)"""
+        return next(self._groups)
     
-    personal_table = Table(personal_data, colWidths=[1.5*inch, 2.4*inch, 1.4*inch, 1.5*inch])
-    personal_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-        ('BACKGROUND', (2, 0), (2, -1), colors.lightgrey),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    content.append(personal_table)
-    content.append(Spacer(1, 0.15*inch))
-    
-    # Contact Information
-    content.append(Paragraph("Informasi Kontak (Contact Information)", subsection_style))
-    
-    contact_data = [
-        ['Email Utama:', applicant_data['email'], 'Telepon Utama:', applicant_data['phone_primary']],
-        ['Telepon Kedua:', applicant_data.get('phone_secondary', 'Tidak ada'), 'LinkedIn:', applicant_data.get('linkedin_profile', 'Tidak ada')],
-        ['Alamat Lengkap:', f"{applicant_data['address_street']}, {applicant_data['address_city']}, {applicant_data['address_province']} {applicant_data['address_postal_code']}", '', ''],
-        ['Website/Portfolio:', applicant_data.get('personal_website', 'Tidak ada'), 'GitHub:', applicant_data.get('github_profile', 'Tidak ada')]
-    ]
+    def text(self, ops, font, size, x, y, text, color=colors.black):
+        """Append a positioned string to `ops` (inside BT/ET), or defer it to the canvas"""
+        if text.isascii() and text.isprintable():
+            if text:
+                ops.append(f"{self.canv.font_resource(font)} {size} Tf 1 0 0 1 {x:.2f} {y:.2f} Tm ({_pdf_text(text)}) Tj")
+        else:
+            self.fallback.append((font, size, x, y, text, color))
     
-    contact_table = Table(contact_data, colWidths=[1.5*inch, 2.4*inch, 1.4*inch, 1.5*inch])
-    contact_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-        ('BACKGROUND', (2, 0), (2, -1), colors.lightgrey),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('SPAN', (1, 2), (3, 2)),  # Span address across columns
-    ]))
-    content.append(contact_table)
-    content.append(Spacer(1, 0.2*inch))
-    
-    # Position Information
-    content.append(Paragraph("2. INFORMASI POSISI (POSITION DETAILS)", section_style))
-    
-    position_data = [
-        ['Gaji yang Diinginkan:', applicant_data['desired_salary'], 'Dapat Dinegosiasi:', applicant_data.get('salary_negotiable', 'Ya')],
-        ['Tanggal Mulai Kerja:', applicant_data.get('start_date_available', 'Segera'), 'Notice Period:', applicant_data.get('notice_period', '2 minggu')],
-        ['Preferensi Remote:', applicant_data.get('remote_work_preference', 'Fleksibel'), 'Kesediaan Travel:', applicant_data.get('travel_willingness', '0%')],
-        ['Bersedia Relokasi:', applicant_data.get('willing_to_relocate', 'Tidak'), 'Kesediaan Lembur:', applicant_data.get('overtime_availability', 'Ya')]
-    ]
+    def room(self, space_before=0):
+        """Height left on the page for a block with `space_before`, or None on an empty page"""
+        if self.at_top:
+            return None
+        return self.y - max(self.space_after, space_before) - self.bottom
     
-    position_table = Table(position_data, colWidths=[1.7*inch, 2.2*inch, 1.5*inch, 1.4*inch])
-    position_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-        ('BACKGROUND', (2, 0), (2, -1), colors.lightgrey),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    content.append(position_table)
-    content.append(Spacer(1, 0.2*inch))
-    
-    # Education Section
-    content.append(Paragraph("3. RIWAYAT PENDIDIKAN (EDUCATION BACKGROUND)", section_style))
-    
-    education_data = [
-        ['Jenjang Pendidikan:', applicant_data['education_level'], 'Tahun Lulus:', str(applicant_data['graduation_year'])],
-        ['Universitas/Institusi:', applicant_data['university_name'], 'IPK/GPA:', applicant_data.get('gpa', 'Tidak disebutkan')],
-        ['Jurusan Utama:', applicant_data['degree_major'], 'Jurusan Sampingan:', applicant_data.get('degree_minor', 'Tidak ada')],
-        ['Penghargaan Akademik:', applicant_data.get('academic_honors', 'Tidak ada'), 'Bahasa yang Dikuasai:', applicant_data.get('languages_spoken', 'Bahasa Indonesia')]
-    ]
+    def take(self, height, space_before=0, space_after=0):
+        """Reserve `height` points below the previous block and return the new block's top"""
+        gap = 0 if self.at_top else max(self.space_after, space_before)
+        if not self.at_top and self.y - gap - height < self.bottom:
+            self.finish()
+            self.y, gap = self.top, 0
+        top = self.y - gap
+        self.y = top - height
+        self.space_after = space_after
+        self.at_top = False
+        return top
     
-    education_table = Table(education_data, colWidths=[1.7*inch, 2.2*inch, 1.5*inch, 1.4*inch])
-    education_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-        ('BACKGROUND', (2, 0), (2, -1), colors.lightgrey),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    content.append(education_table)
-    content.append(Spacer(1, 0.2*inch))
-    
-    # Professional Experience
-    content.append(Paragraph("4. PENGALAMAN KERJA (PROFESSIONAL EXPERIENCE)", section_style))
-    
-    experience_data = [
-        ['Total Pengalaman:', applicant_data['total_experience'], 'Gaji Saat Ini:', applicant_data.get('current_salary', 'Tidak disebutkan')],
-        ['Perusahaan Saat Ini:', applicant_data['current_employer'], 'Posisi Saat Ini:', applicant_data['current_position']],
-        ['Perusahaan Sebelumnya 1:', applicant_data.get('previous_employer_1', 'Tidak ada'), 'Posisi:', applicant_data.get('previous_position_1', 'Tidak ada')],
-        ['Perusahaan Sebelumnya 2:', applicant_data.get('previous_employer_2', 'Tidak ada'), 'Posisi:', applicant_data.get('previous_position_2', 'Tidak ada')],
-        ['Alasan Keluar:', applicant_data.get('reason_for_leaving', 'Pengembangan Karir'), '', '']
-    ]
+    def _emit_blocks(self):
+        """Place the page's layout blocks, inline or as shared Form XObjects"""
+        canv, forms = self.canv, self.forms
+        if forms is None:
+            canv.addLiteral("\n".join(f"q 1 0 0 1 0 {bottom:.2f} cm\n{block}\nQ"
+                                       for _, block, bottom in self.blocks))
+            return
+        # The rows of a table that landed on this page form one XObject; tables
+        # with the same labels and row heights share it (blocks are cached
+        # strings, so the key hashes cheaply)
+        placed = []
+        for _, rows in itertools.groupby(self.blocks, key=lambda block: block[0]):
+            rows = list(rows)
+            base = rows[-1][2]
+            key = tuple((block, round(bottom - base, 2)) for _, block, bottom in rows)
+            name = forms.get(key)
+            if name is None:
+                # Defined before anything is drawn on the page: endForm()
+                # restarts the page's resources when the page is still empty
+                name = forms[key] = f"FormBlock{len(forms)}"
+                canv.beginForm(name)
+                canv.addLiteral("\n".join(f"q 1 0 0 1 0 {offset:.2f} cm\n{block}\nQ" for block, offset in key))
+                canv.endForm()
+            placed.append((name, base))
+        for name, base in placed:
+            canv.addLiteral(f"q 1 0 0 1 0 {base:.2f} cm")
+            canv.doForm(name)
+            canv.addLiteral("Q")
     
-    experience_table = Table(experience_data, colWidths=[1.7*inch, 2.2*inch, 1.5*inch, 1.4*inch])
-    experience_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-        ('BACKGROUND', (2, 0), (2, -1), colors.lightgrey),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('SPAN', (1, 4), (3, 4)),  # Span reason for leaving
-    ]))
-    content.append(experience_table)
-    content.append(Spacer(1, 0.2*inch))
-    
-    # Skills and Certifications
-    content.append(Paragraph("5. KEAHLIAN & KUALIFIKASI (SKILLS & QUALIFICATIONS)", section_style))
-    
-    skills_data = [
-        ['Keahlian Teknis:', applicant_data.get('technical_skills', 'Tidak disebutkan')],
-        ['Soft Skills:', applicant_data.get('soft_skills', 'Tidak disebutkan')],
-        ['Bahasa Pemrograman:', applicant_data.get('programming_languages', 'Tidak ada')],
-        ['Sertifikasi:', applicant_data.get('certifications', 'Tidak ada')],
-        ['Kelebihan Utama:', applicant_data.get('greatest_strength', 'Tidak disebutkan')],
-        ['Area Pengembangan:', applicant_data.get('biggest_weakness', 'Tidak disebutkan')]
-    ]
+    def finish(self):
+        """Emit the pending operations and close the page"""
+        canv = self.canv
+        self._emit_blocks()
+        canv.addLiteral("\n".join(self.values))
+        for font, size, x, y, text, color in self.fallback:
+            canv.setFillColor(color)
+            canv.setFont(font, size)
+            canv.drawString(x, y, text)
+        canv.showPage()
+        self.blocks, self.values, self.fallback = [], [], []
+
+class CanvasFormRenderer:
+    """Fixed-layout engine: draws FormTemplate blocks straight onto the canvas
     
-    skills_table = Table(skills_data, colWidths=[2*inch, 4.8*inch])
-    skills_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-    content.append(skills_table)
-    content.append(Spacer(1, 0.2*inch))
-    
-    # References
-    content.append(Paragraph("6. REFERENSI PROFESIONAL (PROFESSIONAL REFERENCES)", section_style))
-    
-    ref_data = []
-    for i in range(1, 4):
-        ref_key = f'reference_{i}'
-        if applicant_data.get(ref_key):
-            ref_info = applicant_data[ref_key].split(', ')
-            if len(ref_info) >= 4:
-                ref_data.append([f'Referensi {i}:', ref_info[0], 'Jabatan:', ref_info[1].replace(' di ', ' - ')])
-                ref_data.append(['Perusahaan:', ref_info[2], 'Kontak:', f"{ref_info[3]} / {ref_info[4] if len(ref_info) > 4 else 'N/A'}"])
-            else:
-                ref_data.append([f'Referensi {i}:', applicant_data[ref_key], '', ''])
-        else:
-            ref_data.append([f'Referensi {i}:', 'Tersedia bila diminta', '', ''])
-    
-    if ref_data:
-        ref_table = Table(ref_data, colWidths=[1.4*inch, 2.4*inch, 1.2*inch, 1.8*inch])
-        ref_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('BACKGROUND', (2, 0), (2, -1), colors.lightgrey),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        content.append(ref_table)
-    content.append(Spacer(1, 0.15*inch))
-    
-    # Emergency Contact
-    emergency_data = [
-        ['Kontak Darurat:', applicant_data.get('emergency_contact_name', 'Tidak disebutkan'), 
-         'Hubungan:', applicant_data.get('emergency_contact_relationship', 'Tidak disebutkan')],
-        ['Telepon Darurat:', applicant_data.get('emergency_contact_phone', 'Tidak disebutkan'), '', '']
-    ]
+    Skips platypus flow layout and table splitting. Grid rows are placed at
+    computed coordinates with the same paddings, fonts and colours as the
+    platypus tables, and values wider than their cell (addresses, skills,
+    references...) are wrapped onto extra lines exactly as
+    FormTemplate.table_cells() hands them to platypus. Operators are emitted as
+    literal PDF: going through the canvas API formats every coordinate with
+    reportlab's fp_str, which dominates the render time without its C
+    accelerator.
+    """
     
-    emergency_table = Table(emergency_data, colWidths=[1.7*inch, 2.2*inch, 1.5*inch, 1.4*inch])
-    emergency_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightyellow),
-        ('BACKGROUND', (2, 0), (2, -1), colors.lightyellow),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('SPAN', (1, 1), (3, 1)),
-    ]))
-    content.append(emergency_table)
-    content.append(Spacer(1, 0.2*inch))
-    
-    # Additional Information
-    content.append(Paragraph("7. INFORMASI TAMBAHAN (ADDITIONAL INFORMATION)", section_style))
-    
-    additional_data = [
-        ['Bagaimana mengetahui lowongan ini?', applicant_data.get('how_found_position', 'Tidak disebutkan')],
-        ['Sumber Referensi:', applicant_data.get('referral_source', 'Tidak ada')],
-        ['Cover Letter Dilampirkan:', applicant_data.get('cover_letter_submitted', 'Tidak')],
-        ['Nomor BPJS:', applicant_data.get('bpjs_number', 'Tidak disebutkan')],
-        ['Nomor NPWP:', applicant_data.get('npwp_number', 'Tidak disebutkan')],
-        ['Persetujuan Background Check:', applicant_data.get('reference_check_consent', 'Ya')],
-        ['Persetujuan Drug Test:', applicant_data.get('drug_test_consent', 'Ya')]
-    ]
+    CELL_PADDING_X = FormTemplate.CELL_PADDING_X
+    CELL_PADDING_Y = FormTemplate.CELL_PADDING_Y
+    CELL_LEADING = FormTemplate.CELL_LEADING
     
-    additional_table = Table(additional_data, colWidths=[2.2*inch, 4.6*inch])
-    additional_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    content.append(additional_table)
-    content.append(Spacer(1, 0.2*inch))
+    def __init__(self, template):
+        self.template = template
+        # SimpleDocTemplate frame used by create_indonesian_pdf (6pt frame padding)
+        self.left = 0.6*inch + 6
+        self.width = A4[0] - 1.2*inch - 12
+        self.top = A4[1] - 0.8*inch - 6
+        self.bottom = 0.8*inch + 6
+        # Block layouts, laid out once per renderer: every paragraph on the
+        # form is static, and grid rows only vary in height when values wrap
+        self._paragraph_lines = {}
+        self._paragraph_blocks = {}
+        self._row_blocks = {}
     
-    # Signature section
-    content.append(Paragraph("8. PERNYATAAN DAN TANDA TANGAN (DECLARATION & SIGNATURE)", section_style))
+    def _canvas(self, filepath):
+        # Plain Flate streams: without reportlab's C accelerator the ASCII85
+        # pass costs as much as drawing the whole form
+        canv = IndonesianApplicationFormCanvas(filepath, pagesize=A4, stream_filters=[PDFZCompress])
+        # Cached blocks refer to fonts by resource name (/F1, /F2...), which
+        # the document hands out in order of first use: fix that order
+        fonts = {'Helvetica', 'Helvetica-Bold'}
+        fonts.update(style.fontName for style in self.template.paragraph_styles.values())
+        for font in sorted(fonts):
+            canv.font_resource(font)
+        return canv
     
-    declaration_text = """Saya menyatakan bahwa informasi yang saya berikan dalam formulir aplikasi ini adalah benar dan lengkap. 
-    Saya memahami bahwa informasi yang salah dapat menyebabkan penolakan atau pemutusan hubungan kerja jika saya diterima. 
-    Saya mengizinkan perusahaan untuk menghubungi referensi dan memverifikasi informasi yang saya berikan."""
+    def render(self, applicant_data, filepath):
+        canv = self._canvas(filepath)
+        self.draw(canv, applicant_data)
+        canv.save()
+        return filepath
     
-    content.append(Paragraph(declaration_text, styles['Normal']))
-    content.append(Spacer(1, 0.15*inch))
+    def render_document(self, applicants, filepath, use_forms=True, bookmarks=True):
+        """Render several applicants into one PDF; returns [(applicant, first_page, last_page)]
+        
+        With use_forms the page rules and every distinct block layout (banners,
+        paragraphs, label cells and grid of a row) are stored once as Form
+        XObjects; pages only place them and draw the applicant's values.
+        With bookmarks every form gets an outline entry keyed by its
+        application_id.
+        """
+        canv = self._canvas(filepath)
+        forms = None
+        if use_forms:
+            canv.define_rules_form()
+            forms = {}
+        pages = []
+        for applicant_data in applicants:
+            first = canv.getPageNumber()
+            if bookmarks:
+                app_id = applicant_data['application_id']
+                canv.bookmarkPage(app_id)
+                canv.addOutlineEntry(f"{app_id} - {applicant_data['first_name']} {applicant_data['last_name']}",
+                                     app_id, level=0)
+            self.draw(canv, applicant_data, forms)
+            pages.append((applicant_data, first, canv.getPageNumber() - 1))
+        if bookmarks and pages:
+            canv.showOutline()
+        canv.save()
+        return pages
     
-    signature_data = [
-        ['Tanda Tangan Elektronik:', applicant_data.get('electronic_signature', ''), 'Tanggal:', applicant_data.get('signature_date', '')],
-        ['Nama Lengkap:', f"{applicant_data['first_name']} {applicant_data['last_name']}", 'Syarat & Ketentuan:', applicant_data.get('terms_accepted', 'Ya')]
-    ]
+    def draw(self, canv, applicant_data, forms=None):
+        """Draw one applicant's form onto `canv`, starting on the current empty page
+        
+        `forms` maps static page content to Form XObject names and is shared
+        across a document; None draws everything inline.
+        """
+        canv.start_form(f"{applicant_data['first_name']} {applicant_data['last_name']}",
+                        applicant_data['application_id'])
+        page = _Page(canv, self.top, self.bottom, forms)
+        for block in self.template.blocks(applicant_data):
+            kind = block[0]
+            if kind == 'table':
+                self._draw_table(page, *block[1:])
+            elif kind == 'gap':
+                page.take(block[1])
+            else:
+                self._draw_paragraph(page, block[1], block[2])
+        page.finish()
     
-    signature_table = Table(signature_data, colWidths=[1.8*inch, 2.5*inch, 1.2*inch, 1.3*inch])
-    signature_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-        ('BACKGROUND', (2, 0), (2, -1), colors.lightgrey),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    content.append(signature_table)
+    def _draw_paragraph(self, page, style_name, text):
+        style = self.template.paragraph_styles[style_name]
+        lines = self._paragraph_lines.get((style_name, text))
+        if lines is None:
+            lines = self._paragraph_lines[(style_name, text)] = tuple(
+                simpleSplit(" ".join(text.split()), style.fontName, style.fontSize, self.width))
+        # Like a platypus Paragraph, one that does not fit is split at the end
+        # of the page, unless that would leave an orphan line behind
+        min_lines = 1 if getattr(style, 'allowOrphans', 0) else 2
+        while lines:
+            count = len(lines)
+            room = page.room(style.spaceBefore)
+            if room is not None and count * style.leading > room:
+                fit = int(room / style.leading)
+                if fit >= min_lines:
+                    count = fit
+            self._place_paragraph(page, style_name, lines[:count])
+            lines = lines[count:]
+    
+    def _place_paragraph(self, page, style_name, lines):
+        paragraph = self._paragraph_blocks.get((style_name, lines))
+        if paragraph is None:
+            paragraph = self._paragraph_blocks[(style_name, lines)] = self._paragraph_block(page, style_name, lines)
+        block, height, fallback = paragraph
+        style = self.template.paragraph_styles[style_name]
+        bottom = page.take(height, style.spaceBefore, style.spaceAfter) - height
+        page.blocks.append((page.group(), block, bottom))
+        for font, size, x, y, line, color in fallback:
+            page.fallback.append((font, size, x, bottom + y, line, color))
     
-    # Footer note
-    content.append(Spacer(1, 0.15*inch))
-    footer_note = "Terima kasih telah melamar di perusahaan kami. Kami akan menghubungi Anda dalam waktu 2-3 minggu."
-    content.append(Paragraph(footer_note, styles['Normal']))
+    def _paragraph_block(self, page, style_name, lines):
+        """Layout of a paragraph's lines relative to its bottom edge: (content, height, non-ASCII lines)"""
+        style = self.template.paragraph_styles[style_name]
+        height = len(lines) * style.leading
+        ops, fallback = [], []
+        
+        if style.backColor:
+            # Like platypus, the padded background spills outside the
+            # paragraph's own height instead of taking space on the page
+            padding = style.borderPadding
+            border = style.borderColor or style.backColor
+            ops.append(f"{_rgb(style.backColor)} rg {_rgb(border)} RG {style.borderWidth} w "
+                       f"{self.left - padding:.2f} {-padding:.2f} {self.width + 2 * padding:.2f} "
+                       f"{height + 2 * padding:.2f} re {'B' if style.borderWidth else 'f'}")
+        ops.append(f"BT {_rgb(style.textColor)} rg")
+        y = height - style.fontSize
+        for line in lines:
+            x = self.left
+            if style.alignment == TA_CENTER:
+                x += (self.width - stringWidth(line, style.fontName, style.fontSize)) / 2
+            if line.isascii() and line.isprintable():
+                page.text(ops, style.fontName, style.fontSize, x, y, line)
+            else:
+                fallback.append((style.fontName, style.fontSize, x, y, line, style.textColor))
+            y -= style.leading
+        ops.append("ET")
+        return "\n".join(ops), height, fallback
     
-    # Build PDF
-    doc.build(content)
+    def _draw_table(self, page, rows, widths, grid_name):
+        grid = self.template.grids[grid_name]
+        pad_x, pad_y, leading = self.CELL_PADDING_X, self.CELL_PADDING_Y, self.CELL_LEADING
+        size = grid.font_size
+        x0 = self.left + (self.width - sum(widths)) / 2
+        col_x = [x0]
+        for width in widths:
+            col_x.append(col_x[-1] + width)
+        table_key = (grid_name, tuple(widths))
+        group = page.group()
+        
+        for cells in self.template.table_cells(rows, widths, grid_name):
+            height = max(len(cell[-1]) for cell in cells) * leading + 2 * pad_y
+            bottom = page.take(height) - height
+            
+            # Rows with the same labels, spans and height share their layout
+            key = (table_key, height, tuple((c, last, lines[0] if is_label else None)
+                                            for c, last, is_label, _, lines in cells))
+            block = self._row_blocks.get(key)
+            if block is None:
+                block = self._row_blocks[key] = self._row_block(page, grid, col_x, height, cells)
+            page.blocks.append((group, block, bottom))
+            
+            values = page.values
+            values.append("BT 0 g")
+            for c, last, is_label, font, lines in cells:
+                if is_label and lines[0].isascii() and lines[0].isprintable():
+                    continue
+                if grid.valign == 'TOP':
+                    y = bottom + height - pad_y - size
+                else:
+                    y = bottom + (height + len(lines) * leading) / 2 - size
+                for line in lines:
+                    page.text(values, font, size, col_x[c] + pad_x, y, line)
+                    y -= leading
+            values.append("ET")
+    
+    def _row_block(self, page, grid, col_x, height, cells):
+        """Layout of a grid row (label cells, labels, grid lines) relative to its bottom edge"""
+        pad_x, pad_y, size = self.CELL_PADDING_X, self.CELL_PADDING_Y, grid.font_size
+        ops = [f"{_rgb(grid.background)} rg"]
+        for c, last, is_label, _, _ in cells:
+            if is_label:
+                ops.append(f"{col_x[c]:.2f} 0 {col_x[last + 1] - col_x[c]:.2f} {height:.2f} re f")
+        ops.append("BT 0 g")
+        for c, last, is_label, font, lines in cells:
+            if is_label and lines[0].isascii() and lines[0].isprintable():
+                y = height - pad_y - size if grid.valign == 'TOP' else (height + self.CELL_LEADING) / 2 - size
+                page.text(ops, font, size, col_x[c] + pad_x, y, lines[0])
+        ops.append("ET")
+        
+        # Grid: row edges plus the vertical edges of each (possibly spanned) cell
+        ops.append("0 G 1 w")
+        ops.append(f"{col_x[0]:.2f} {height:.2f} m {col_x[-1]:.2f} {height:.2f} l")
+        ops.append(f"{col_x[0]:.2f} 0 m {col_x[-1]:.2f} 0 l")
+        for c, *_ in cells:
+            ops.append(f"{col_x[c]:.2f} 0 m {col_x[c]:.2f} {height:.2f} l")
+        ops.append(f"{col_x[-1]:.2f} 0 m {col_x[-1]:.2f} {height:.2f} l S")
+        return "\n".join(ops)
+
+# Rendering engines: platypus flow layout, or the fixed-layout CanvasFormRenderer
+ENGINES = ('platypus', 'canvas')
+
+# Per-process FormTemplate/CanvasFormRenderer (each pool worker compiles its own on first use)
+_form_template = None
+_canvas_renderers = {}
+
+def get_form_template():
+    global _form_template
+    if _form_template is None:
+        _form_template = FormTemplate()
+    return _form_template
+
+def get_canvas_renderer(template=None):
+    template = template or get_form_template()
+    renderer = _canvas_renderers.get(id(template))
+    if renderer is None or renderer.template is not template:
+        renderer = _canvas_renderers[id(template)] = CanvasFormRenderer(template)
+    return renderer
+
+def pdf_filename(applicant_data):
+    """File name of an applicant's form: <application_id>_<last>_<first>.pdf"""
+    safe_name = "".join(c for c in f"{applicant_data['last_name']}_{applicant_data['first_name']}" if c.isalnum() or c in (' ', '-', '_')).rstrip()
+    return f"{applicant_data['application_id']}_{safe_name}.pdf"
+
+def create_indonesian_pdf(applicant_data, output_folder='indonesian_pdf_forms', template=None, engine='platypus'):
+    """Create a comprehensive Indonesian PDF job application form
+    
+    `template` defaults to the per-process FormTemplate from get_form_template().
+    engine='canvas' draws the form at fixed coordinates instead of running
+    platypus layout; it looks the same and is several times faster.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown PDF engine {engine!r}; expected one of {', '.join(ENGINES)}")
+    
+    # Create output folder if it doesn't exist (pool workers may race on fan-out folders)
+    os.makedirs(output_folder, exist_ok=True)
+    
+    filepath = os.path.join(output_folder, pdf_filename(applicant_data))
+    _render_pdf(applicant_data, filepath, template, engine)
     return filepath
 
-def process_csv_and_generate_indonesian_pdfs(csv_filename='indonesian_job_applications.csv'):
-    """Read CSV data and generate Indonesian PDF forms for each applicant"""
+def render_indonesian_pdf(applicant_data, template=None, engine='platypus'):
+    """Render a form in memory; returns (filename, pdf bytes) for archive output"""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown PDF engine {engine!r}; expected one of {', '.join(ENGINES)}")
+    buffer = io.BytesIO()
+    _render_pdf(applicant_data, buffer, template, engine)
+    return pdf_filename(applicant_data), buffer.getvalue()
+
+def _render_pdf(applicant_data, target, template, engine):
+    """Draw one form into `target`, a file path or a binary file object"""
+    template = template or get_form_template()
+    if engine == 'canvas':
+        get_canvas_renderer(template).render(applicant_data, target)
+        return
+    
+    # Create custom canvas with A4 size (more common in Indonesia)
+    doc = SimpleDocTemplate(
+        target, 
+        pagesize=A4, 
+        topMargin=0.8*inch, 
+        bottomMargin=0.8*inch,
+        leftMargin=0.6*inch,
+        rightMargin=0.6*inch
+    )
+    
+    # Override the canvas class
+    doc.canvasmaker = lambda *args, **kwargs: IndonesianApplicationFormCanvas(
+        *args, 
+        applicant_name=f"{applicant_data['first_name']} {applicant_data['last_name']}",
+        app_id=applicant_data['application_id'],
+        **kwargs
+    )
+    
+    # Build PDF (SimpleDocTemplate.build() ignores doc.canvasmaker unless it is passed in)
+    doc.build(template.build_story(applicant_data), canvasmaker=doc.canvasmaker)
+
+# Sidecar index written next to bundled PDFs: application_id -> file and page range
+BUNDLE_INDEX = 'bundle_index.csv'
+BUNDLE_INDEX_FIELDS = ('application_id', 'file', 'first_page', 'last_page')
+
+def bundle_filename(applicants):
+    """File name of a bundle: <first application_id>_<last application_id>.pdf"""
+    first_id, last_id = applicants[0]['application_id'], applicants[-1]['application_id']
+    return f"{first_id}.pdf" if len(applicants) == 1 else f"{first_id}_{last_id}.pdf"
+
+def create_indonesian_pdf_bundle(applicants, output_folder='indonesian_pdf_forms', template=None):
+    """Render several applicants into one PDF with the canvas engine
+    
+    Each applicant's form starts on a new page and gets a bookmark keyed by
+    its application_id. The file is named after the first and last ID.
+    Returns (pdf_path, [(application_id, first_page, last_page)]).
+    """
+    applicants = list(applicants)
+    if not applicants:
+        raise ValueError("A bundle needs at least one applicant")
+    if not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+    
+    filepath = os.path.join(output_folder, bundle_filename(applicants))
+    pages = get_canvas_renderer(template).render_document(applicants, filepath)
+    return filepath, [(applicant['application_id'], first, last) for applicant, first, last in pages]
+
+def render_indonesian_pdf_bundle(applicants, template=None):
+    """In-memory create_indonesian_pdf_bundle(); returns (filename, pdf bytes, pages)"""
+    applicants = list(applicants)
+    if not applicants:
+        raise ValueError("A bundle needs at least one applicant")
+    buffer = io.BytesIO()
+    pages = get_canvas_renderer(template).render_document(applicants, buffer)
+    return (bundle_filename(applicants), buffer.getvalue(),
+            [(applicant['application_id'], first, last) for applicant, first, last in pages])
+
+def _render_row(task):
+    """Render one applicant; returns (index, pdf_path, error) so one bad row never stops a run
+    
+    Without an output folder the form is rendered in memory and pdf_path is
+    replaced by (application_id, filename, pdf bytes).
+    """
+    index, row, output_folder, engine = task
+    try:
+        if output_folder is None:
+            return index, (row['application_id'],) + render_indonesian_pdf(row, engine=engine), None
+        return index, create_indonesian_pdf(row, output_folder, engine=engine), None
+    except Exception as e:
+        return index, None, f"{row.get('first_name', 'Unknown')} {row.get('last_name', '')}: {e}"
+
+def _render_bundle(task):
+    """Render one bundle; returns (index, pdf_path, pages, error) like _render_row()"""
+    index, rows, output_folder = task
+    try:
+        if output_folder is None:
+            filename, data, pages = render_indonesian_pdf_bundle(rows)
+            return index, (rows[0]['application_id'], filename, data), pages, None
+        return (index,) + create_indonesian_pdf_bundle(rows, output_folder) + (None,)
+    except Exception as e:
+        return index, None, [], f"bundle {index} ({rows[0].get('application_id', '?')}...): {e}"
+
+def _bundles(rows, bundle_size):
+    """Group rows into numbered lists of `bundle_size`"""
+    rows = iter(rows)
+    for index in itertools.count(1):
+        bundle = list(itertools.islice(rows, bundle_size))
+        if not bundle:
+            return
+        yield index, bundle
+
+def _render_parallel(render, tasks, workers, chunksize):
+    """Render tasks on a process pool, yielding results in input order
+    
+    One continuous imap keeps every worker busy; at most four chunks per
+    worker are in flight (see process_pool.imap_bounded), so memory stays
+    bounded however large the input is.
+    """
+    with multiprocessing.Pool(workers) as pool:
+        yield from imap_bounded(pool, render, tasks, chunksize, workers * chunksize * 4)
+
+def process_csv_and_generate_indonesian_pdfs(csv_filename='indonesian_job_applications.csv', workers=1,
+                                             chunksize=16, output_folder='indonesian_pdf_forms', engine=None,
+                                             bundle_size=1, archive=None, incremental=False,
+                                             fanout_depth=0, fanout_scheme='suffix'):
+    """Read CSV data and generate Indonesian PDF forms for each applicant
+    
+    With workers > 1 the forms are rendered on a process pool (workers=0 uses
+    every CPU); progress and errors are still reported in input order.
+    `engine` selects platypus layout (the default) or the faster fixed-layout
+    canvas engine. With bundle_size > 1 every `bundle_size` applicants share
+    one bookmarked PDF (canvas engine only) and BUNDLE_INDEX in the output
+    folder maps each application_id to its file and page range.
+    With `archive` (.zip, .tar, .tar.gz) the PDFs are rendered in memory and
+    streamed into that archive instead of the output folder; see
+    archive_sink.ArchiveWriter.
+    With `incremental` a manifest in the output folder remembers what each
+    form was rendered from: unchanged rows are skipped, changed rows are
+    re-rendered and forms of rows that left the data are deleted. Other runs
+    into the output folder delete that manifest.
+    One-form-per-applicant output is fanned out `fanout_depth` directories
+    deep (see output_layout.OutputLayout), and OUTPUT_INDEX in the output
+    folder maps every application_id to its PDF.
+    """
+    bundled = bundle_size > 1
+    engine = engine or ('canvas' if bundled else 'platypus')
+    if bundled and engine != 'canvas':
+        raise ValueError("Bundled PDFs are rendered by the canvas engine")
+    if (incremental or fanout_depth) and (bundled or archive):
+        raise ValueError("Incremental rendering and fan-out work on one PDF per applicant in the output folder")
     
     if not os.path.exists(csv_filename):
         print(f"❌ Error: {csv_filename} not found! Please run generate_indonesian_dummy_data.py first.")
         return
     
     generated_files = []
+    failed = 0
+    workers = workers or os.cpu_count() or 1
+    # Workers render in memory when there is no folder to write to
+    target = None if archive else output_folder
     
     try:
-        with open(csv_filename, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            
-            print("🇮🇩 Generating Indonesian PDF job application forms...")
-            print("📋 Each form includes Indonesian formatting, language, and cultural context...")
-            
-            for i, row in enumerate(reader, 1):
-                try:
-                    pdf_path = create_indonesian_pdf(row)
-                    generated_files.append(pdf_path)
-                    print(f"✅ Generated: {os.path.basename(pdf_path)}")
+        # Accepts the CSV or its binary .ijad equivalent (see dataset_store.py);
+        # rows are copied to plain dicts so they can be sent to worker processes
+        rows = (dict(row) for row in read_rows(csv_filename))
+        layout = manifest = None
+        if not (bundled or archive):
+            layout = OutputLayout(output_folder, fanout_depth, fanout_scheme)
+        if incremental:
+            manifest = RenderManifest(output_folder)
+        elif not archive and discard_manifest(output_folder):
+            # This run overwrites forms the manifest describes
+            print(f"♻️  Overwriting {output_folder}: the next incremental run re-renders every form")
+        if bundled:
+            render = _render_bundle
+            tasks = ((i, bundle, target) for i, bundle in _bundles(rows, bundle_size))
+            chunksize = max(1, chunksize // bundle_size)
+        else:
+            render = _render_row
+            version = pdf_render_version(engine, (fanout_depth, fanout_scheme)) if manifest is not None else None
+            tasks = _RowTasks(rows, engine, layout, manifest, version)
+        
+        print("🇮🇩 Generating Indonesian PDF job application forms...")
+        print("📋 Each form includes Indonesian formatting, language, and cultural context...")
+        if bundled:
+            print(f"📚 Bundling {bundle_size} forms per PDF (index: {BUNDLE_INDEX})")
+        if archive:
+            print(f"🗜️  Streaming PDFs into {archive}")
+        if fanout_depth:
+            print(f"🗂️  Fanning forms out {fanout_depth} directories deep ({fanout_scheme} of application_id)")
+        if workers > 1:
+            unit = "bundles" if bundled else "forms"
+            print(f"⚙️  Rendering on {workers} worker processes ({chunksize} {unit} per dispatch)")
+            results = _render_parallel(render, tasks, workers, chunksize)
+        else:
+            results = map(render, tasks)
+        
+        with (ArchiveWriter(archive) if archive else nullcontext()) as writer, (layout or nullcontext()):
+            if bundled:
+                bundle_index = f"{archive}.{BUNDLE_INDEX}" if archive else os.path.join(output_folder, BUNDLE_INDEX)
+                generated_files, failed = _collect_bundles(results, bundle_index, writer)
+            else:
+                for i, result, error in results:
+                    key, digest = tasks.pending.pop(i)
+                    if error:
+                        failed += 1
+                        print(f"❌ Error generating PDF for {error}")
+                        if manifest is not None:
+                            manifest.forget(key)
+                        continue
+                    generated_files.append(_store(result, writer))
+                    if layout is not None:
+                        layout.record(key, result)
+                    if manifest is not None:
+                        manifest.record(key, digest, result)
+                    print(f"✅ Generated: {os.path.basename(generated_files[-1])}")
                     
                     # Progress indicator
                     if i % 10 == 0:
                         print(f"📊 Progress: {i} forms completed...")
-                        
-                except Exception as e:
-                    print(f"❌ Error generating PDF for {row.get('first_name', 'Unknown')} {row.get('last_name', '')}: {e}")
-            
-        print(f"\n🎉 Successfully generated {len(generated_files)} Indonesian PDF job application forms!")
-        print("📁 Files saved in 'indonesian_pdf_forms' folder")
+        
+        if manifest is not None:
+            removed = manifest.prune()
+            manifest.save()
+            print(f"♻️  {tasks.skipped} unchanged forms skipped, {removed} forms of removed rows deleted")
+        
+        kind = "bundled PDF files" if bundled else "Indonesian PDF job application forms"
+        print(f"\n🎉 Successfully generated {len(generated_files)} {kind}!")
+        if failed:
+            print(f"⚠️  {failed} {'bundles' if bundled else 'forms'} failed (see errors above)")
+        if archive:
+            print(f"📁 Files saved in '{archive}' (member index: {index_path(archive)})")
+        else:
+            print(f"📁 Files saved in '{output_folder}' folder")
+        if layout is not None:
+            print(f"🗂️  Index of application_id -> PDF: {layout.index_path}")
         print("📄 Each PDF contains Indonesian formatting with cultural context")
         print("🇮🇩 Features: Indonesian names, addresses, companies, and terminology")
         
     except Exception as e:
-        print(f"❌ Error reading CSV file: {e}")
+        print(f"❌ Error reading data file: {e}")
+    return generated_files
+
+def pdf_render_version(engine, layout=()):
+    """Version of everything a form is rendered from besides its row: this module's
+    code (FormTemplate, engines), the engine, the reportlab release and the
+    output layout (a different fan-out moves every file)"""
+    import reportlab
+    return file_version(os.path.abspath(__file__), extra=(engine, reportlab.Version) + tuple(layout))
+
+class _RowTasks:
+    """Render tasks for one PDF per applicant: (index, row, folder, engine)
+    
+    `index` is the row's 1-based position and `folder` its fan-out folder
+    (None renders in memory). The (application_id, hash) of every task in
+    flight stays in `pending` until its result comes back. With a manifest,
+    rows whose form is up to date are skipped and go straight to the output
+    index; the generation date printed on the forms is not part of the hash.
+    """
+    
+    def __init__(self, rows, engine, layout=None, manifest=None, version=None):
+        self.rows = rows
+        self.engine = engine
+        self.layout = layout
+        self.manifest = manifest
+        self.version = version
+        self.pending = {}
+        self.skipped = 0
+    
+    def __iter__(self):
+        engine, layout, manifest, pending = self.engine, self.layout, self.manifest, self.pending
+        for i, row in enumerate(self.rows, 1):
+            key = row['application_id']
+            digest = None
+            if manifest is not None:
+                digest = row_hash(row, row.keys(), self.version)
+                if manifest.up_to_date(key, digest):
+                    self.skipped += 1
+                    layout.record(key, manifest.output(key))
+                    continue
+            pending[i] = (key, digest)
+            yield i, row, layout.folder_for(key) if layout is not None else None, engine
+
+def _store(result, writer):
+    """Hand an in-memory result to the archive writer; returns the file path or member name"""
+    if writer is None:
+        return result
+    key, filename, data = result
+    writer.add(filename, data, key=key)
+    return filename
+
+def _collect_bundles(results, index_path, writer=None):
+    """Report bundle results in order and write the sidecar index; returns (files, failed)"""
+    generated_files = []
+    failed = forms = 0
+    os.makedirs(os.path.dirname(index_path) or '.', exist_ok=True)
+    with open(index_path, 'w', newline='', encoding='utf-8') as index_file:
+        index = csv.writer(index_file)
+        index.writerow(BUNDLE_INDEX_FIELDS)
+        for i, result, pages, error in results:
+            if error:
+                failed += 1
+                print(f"❌ Error generating PDF for {error}")
+                continue
+            generated_files.append(_store(result, writer))
+            filename = os.path.basename(generated_files[-1])
+            index.writerows((app_id, filename, first, last) for app_id, first, last in pages)
+            forms += len(pages)
+            print(f"✅ Generated: {filename} ({len(pages)} forms, {pages[-1][2]} pages)")
+            print(f"📊 Progress: {forms} forms completed...")
+    return generated_files, failed
+
+def main(argv=None):
+    """Command-line entry point (also used by `cli.py pdf`)"""
+    parser = argparse.ArgumentParser(description="Generate Indonesian PDF job application forms")
+    parser.add_argument('data_file', nargs='?', default='indonesian_job_applications.csv',
+                        help="Applicant CSV or .ijad dataset")
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes (0 = one per CPU)")
+    parser.add_argument('--chunksize', type=int, default=16, help="Forms sent to a worker per dispatch")
+    parser.add_argument('-o', '--output-folder', default='indonesian_pdf_forms', help="Folder for the PDFs")
+    parser.add_argument('--engine', choices=ENGINES,
+                        help="platypus flow layout (default), or direct fixed-layout canvas drawing (faster)")
+    parser.add_argument('--bundle-size', type=int, default=1,
+                        help=f"Applicants per PDF; above 1 writes bookmarked bundles and {BUNDLE_INDEX} (canvas engine)")
+    parser.add_argument('--archive', help="Stream the PDFs into this .zip/.tar/.tar.gz instead of the output folder")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only render rows that changed since the last run and delete forms of removed rows")
+    parser.add_argument('--fanout-depth', type=int, default=0,
+                        help=f"Spread the PDFs over this many levels of subdirectories (index: {OUTPUT_INDEX})")
+    parser.add_argument('--fanout-scheme', choices=FANOUT_SCHEMES, default='suffix',
+                        help="Subdirectories from the last digits of application_id, or from its hash")
+    args = parser.parse_args(argv)
+    if args.archive and archive_format(args.archive) is None:
+        parser.error(f"--archive must end in one of {', '.join(ARCHIVE_FORMATS)}")
+    if args.bundle_size < 1:
+        parser.error("--bundle-size must be at least 1")
+    if args.bundle_size > 1 and args.engine == 'platypus':
+        parser.error("--bundle-size above 1 needs the canvas engine")
+    if (args.incremental or args.fanout_depth) and (args.bundle_size > 1 or args.archive):
+        parser.error("--incremental and --fanout-depth work on one PDF per applicant, not with --bundle-size or --archive")
+    if args.fanout_depth < 0:
+        parser.error("--fanout-depth must not be negative")
+    process_csv_and_generate_indonesian_pdfs(args.data_file, workers=args.workers, chunksize=args.chunksize,
+                                             output_folder=args.output_folder, engine=args.engine,
+                                             bundle_size=args.bundle_size, archive=args.archive,
+                                             incremental=args.incremental, fanout_depth=args.fanout_depth,
+                                             fanout_scheme=args.fanout_scheme)
 
 if __name__ == "__main__":
-    process_csv_and_generate_indonesian_pdfs()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,112 @@
+import hashlib
+import random
+from datetime import datetime
+
+# NIK layout: province code + regency (10-99) + district (10-99) + serial (100000-999999)
+NIK_PROVINCE_CODES = ("11", "12", "13", "14", "15", "16", "17", "18", "19", "21", "31", "32", "33", "34", "35", "36")
+NIK_SPACE = len(NIK_PROVINCE_CODES) * 90 * 90 * 900000
+
+APPLICATION_ID_WIDTH = 8
+APPLICATION_ID_SPACE = 10 ** APPLICATION_ID_WIDTH - 1
+# Hex digits of the per-seed run tag in application_id
+RUN_TAG_WIDTH = 6
+
+_FEISTEL_ROUNDS = 4
+_HALF_BITS = 19  # 2 * 19 bits = 2**38 >= NIK_SPACE, cycle-walked down to NIK_SPACE
+_HALF_MASK = (1 << _HALF_BITS) - 1
+_M64 = (1 << 64) - 1
+
+def _round_keys(seed):
+    """Per-round 64-bit keys derived from the allocator seed"""
+    return tuple(
+        int.from_bytes(hashlib.blake2b(f"nik:{seed}:{r}".encode('utf-8'), digest_size=8).digest(), 'big')
+        for r in range(_FEISTEL_ROUNDS)
+    )
+
+def run_tag(seed):
+    """Short uppercase hex tag identifying the run (dataset) generated with `seed`"""
+    return hashlib.blake2b(f"app:{seed}".encode('utf-8'), digest_size=8).hexdigest()[:RUN_TAG_WIDTH].upper()
+
+# Round function: top bits of a Fibonacci-hashing multiply of (half ^ round key)
+_ROUND_MULTIPLIER = 0x9E3779B97F4A7C15
+_ROUND_SHIFT = 40
+
+class IdAllocator:
+    """Unique application_id and NIK values derived from a global record index
+
+    application_id is APP{year}{tag}{index+1:08d}, e.g. APP20263F9A0C00000123,
+    where tag is run_tag(seed): the sequential part stays contiguous across
+    shards and appended runs that continue the index (they share the seed).
+    Uniqueness across runs is only probabilistic: the tag is 24 bits of a
+    hash of the seed, so two different seeds clash with probability 2**-24,
+    and two runs with the same seed produce the same dataset, IDs included.
+    The index field is fixed-width, so indices stop at 10**8 - 1. NIK
+    is a keyed Feistel permutation of the index over the whole NIK space, so
+    it looks random but can never repeat for distinct indices under the same
+    seed. No state beyond the round keys is kept, whatever the dataset size.
+    """
+
+    def __init__(self, seed=None, year=None):
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.year = year or datetime.now().year
+        self.tag = run_tag(seed)
+        self._keys = _round_keys(seed)
+
+    def application_id(self, index):
+        if not 0 <= index < APPLICATION_ID_SPACE:
+            raise ValueError(f"Record index {index} does not fit the {APPLICATION_ID_WIDTH}-digit application_id "
+                             f"({APPLICATION_ID_SPACE:,} values)")
+        return f"APP{self.year}{self.tag}{index + 1:0{APPLICATION_ID_WIDTH}d}"
+
+    def _feistel(self, value):
+        left, right = value >> _HALF_BITS, value & _HALF_MASK
+        for key in self._keys:
+            mixed = (((right ^ key) * _ROUND_MULTIPLIER) & _M64) >> _ROUND_SHIFT
+            left, right = right, left ^ (mixed & _HALF_MASK)
+        return (left << _HALF_BITS) | right
+
+    def nik_number(self, index):
+        """Position of record `index` in the NIK space (a bijection on [0, NIK_SPACE))"""
+        if not 0 <= index < NIK_SPACE:
+            raise ValueError(f"Record index {index} is outside the NIK space ({NIK_SPACE:,} values)")
+        value = self._feistel(index)
+        # Cycle-walk until the permuted value lands inside the NIK space
+        while value >= NIK_SPACE:
+            value = self._feistel(value)
+        return value
+
+    def nik(self, index):
+        return format_nik(self.nik_number(index))
+
+    def nik_numbers(self, indices):
+        """Vectorised nik_number() over a NumPy integer array"""
+        import numpy as np
+        values = np.asarray(indices, dtype=np.uint64)
+        if values.size and int(values.max()) >= NIK_SPACE:
+            raise ValueError(f"Record index {int(values.max())} is outside the NIK space ({NIK_SPACE:,} values)")
+        values = self._feistel_array(values)
+        pending = values >= NIK_SPACE
+        while pending.any():
+            values[pending] = self._feistel_array(values[pending])
+            pending = values >= NIK_SPACE
+        return values
+
+    def _feistel_array(self, values):
+        """_feistel() for uint64 NumPy arrays (multiplication wraps modulo 2**64)"""
+        import numpy as np
+        half_bits, half_mask = np.uint64(_HALF_BITS), np.uint64(_HALF_MASK)
+        multiplier, shift = np.uint64(_ROUND_MULTIPLIER), np.uint64(_ROUND_SHIFT)
+        left, right = values >> half_bits, values & half_mask
+        for key in self._keys:
+            mixed = ((right ^ np.uint64(key)) * multiplier) >> shift
+            left, right = right, left ^ (mixed & half_mask)
+        return (left << half_bits) | right
+
+def format_nik(value):
+    """Render a position in the NIK space as the 12-digit NIK string"""
+    value, serial = divmod(value, 900000)
+    value, district = divmod(value, 90)
+    province, regency = divmod(value, 90)
+    return f"{NIK_PROVINCE_CODES[province]}{regency + 10}{district + 10}{serial + 100000}"
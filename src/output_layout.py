@@ -0,0 +1,76 @@
+import csv
+import hashlib
+import os
+
+FANOUT_SCHEMES = ('suffix', 'hash')
+# Written into the output folder: application_id -> path relative to that folder
+OUTPUT_INDEX = 'output_index.csv'
+OUTPUT_INDEX_FIELDS = ('application_id', 'path')
+
+def fanout_dirs(key, depth, scheme='suffix', width=2):
+    """Subdirectory names for `key`, outermost first
+
+    'suffix' takes the last digits of the key, last pair outermost, so
+    sequential application IDs spread evenly over the directories; 'hash'
+    takes the leading hex digits of a hash of the key.
+    """
+    if depth <= 0:
+        return ()
+    if scheme == 'suffix':
+        digits = key.rjust(depth * width, '0')
+        end = len(digits)
+        return tuple(digits[end - (level + 1) * width:end - level * width] for level in range(depth))
+    if scheme == 'hash':
+        digits = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return tuple(digits[level * width:(level + 1) * width] for level in range(depth))
+    raise ValueError(f"Unknown fan-out scheme {scheme!r}; expected one of {', '.join(FANOUT_SCHEMES)}")
+
+class OutputLayout:
+    """Where per-applicant outputs go, plus the index that finds them again
+
+    With depth 0 everything stays flat in `folder`. Otherwise each output
+    lands `depth` directories down (e.g. indonesian_ktp/23/01/ for
+    APP20263F9A0C00000123 with the suffix scheme), keeping every directory small
+    however many files there are. record() appends to OUTPUT_INDEX, so
+    looking up an application_id never needs a directory scan.
+    """
+
+    def __init__(self, folder, depth=0, scheme='suffix', width=2):
+        if scheme not in FANOUT_SCHEMES:
+            raise ValueError(f"Unknown fan-out scheme {scheme!r}; expected one of {', '.join(FANOUT_SCHEMES)}")
+        self.folder = folder
+        self.depth = depth
+        self.scheme = scheme
+        self.width = width
+        self.index_path = os.path.join(folder, OUTPUT_INDEX)
+        self._index_file = None
+        self._index = None
+
+    def folder_for(self, key):
+        """Directory for the output of `key` (not created here)"""
+        return os.path.join(self.folder, *fanout_dirs(key, self.depth, self.scheme, self.width))
+
+    def record(self, key, path):
+        """Add `key` -> `path` to the index"""
+        if self._index is None:
+            os.makedirs(self.folder, exist_ok=True)
+            self._index_file = open(self.index_path, 'w', newline='', encoding='utf-8')
+            self._index = csv.writer(self._index_file)
+            self._index.writerow(OUTPUT_INDEX_FIELDS)
+        self._index.writerow((key, os.path.relpath(path, self.folder)))
+
+    def close(self):
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = self._index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_output_index(folder):
+    """{application_id: path} from a folder's OUTPUT_INDEX"""
+    with open(os.path.join(folder, OUTPUT_INDEX), newline='', encoding='utf-8') as f:
+        return {row['application_id']: os.path.join(folder, row['path']) for row in csv.DictReader(f)}
@@ -0,0 +1,27 @@
+import hashlib
+import os
+
+PHOTO_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.bmp')
+
+class PhotoPool:
+    """The source photos of one directory, assigned to records by a hash of their key
+
+    The assignment depends only on the application_id and the sorted file
+    names, so every rerun (and --incremental) gives an applicant the same
+    face; adding or removing photos reshuffles it.
+    """
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.photos = sorted(os.path.join(folder, name) for name in os.listdir(folder)
+                             if name.lower().endswith(PHOTO_EXTENSIONS))
+        if not self.photos:
+            raise ValueError(f"No photos ({', '.join(PHOTO_EXTENSIONS)}) in {folder}")
+
+    def __len__(self):
+        return len(self.photos)
+
+    def photo_for(self, key):
+        """Path of the photo assigned to `key`"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+        return self.photos[int.from_bytes(digest, 'little') % len(self.photos)]
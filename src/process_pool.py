@@ -0,0 +1,44 @@
+import queue
+
+_DONE = object()
+
+def imap_bounded(pool, func, tasks, chunksize, backlog):
+    """pool.imap(func, tasks, chunksize) with at most `backlog` tasks in flight
+
+    One imap runs for the whole input, fed through a queue that is topped up
+    each time a result is consumed, so the workers never wait for the next
+    window to be submitted while a lazy input of any size is still read only
+    as fast as results are used. `tasks` is iterated on the calling thread,
+    never on the pool's handler thread, so it may share state with the code
+    consuming the results. Results come back in input order. `backlog` is
+    raised to at least one chunk, since the pool only dispatches whole chunks.
+    """
+    backlog = max(backlog, chunksize)
+    feed = queue.SimpleQueue()
+    tasks = iter(tasks)
+    in_flight = 0
+
+    def top_up():
+        nonlocal in_flight, tasks
+        while tasks is not None and in_flight < backlog:
+            task = next(tasks, _DONE)
+            if task is _DONE:
+                tasks = None
+                feed.put(_DONE)
+                return
+            feed.put(task)
+            in_flight += 1
+
+    top_up()
+    try:
+        results = pool.imap(func, iter(feed.get, _DONE), chunksize)
+        while in_flight:
+            result = next(results)
+            in_flight -= 1
+            top_up()
+            yield result
+    finally:
+        # Ends the feed if the caller stopped early; otherwise the pool's
+        # handler thread stays blocked on it and terminating the pool hangs
+        if tasks is not None:
+            feed.put(_DONE)
@@ -0,0 +1,116 @@
+import csv
+import hashlib
+import os
+
+# Kept inside the output folder it describes
+MANIFEST_NAME = '.render_manifest.csv'
+MANIFEST_FIELDS = ('key', 'hash', 'output')
+
+def file_version(*paths, extra=()):
+    """Content hash of the files an artifact is rendered from (templates, assets, fonts, code)
+
+    Missing files hash as absent rather than failing, so the version still
+    changes when one appears or disappears.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        digest.update(os.fsencode(os.path.basename(path)) + b'\0')
+        try:
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+        except FileNotFoundError:
+            digest.update(b'<missing>')
+        digest.update(b'\0')
+    for value in extra:
+        digest.update(str(value).encode('utf-8') + b'\0')
+    return digest.hexdigest()
+
+def row_hash(row, fields, version):
+    """Hash of the fields an artifact is rendered from, salted with the renderer version"""
+    digest = hashlib.blake2b(version.encode('ascii'), digest_size=16)
+    for field in fields:
+        digest.update(b'\x1f' + str(row.get(field, '')).encode('utf-8'))
+    return digest.hexdigest()
+
+def discard_manifest(folder, name=MANIFEST_NAME):
+    """Delete the manifest of `folder`; for runs that rewrite its outputs without recording them
+
+    The next incremental run then renders every row again instead of
+    trusting hashes of files that were overwritten since.
+    """
+    try:
+        os.remove(os.path.join(folder, name))
+    except FileNotFoundError:
+        return False
+    return True
+
+class RenderManifest:
+    """Which rows of the previous run were rendered from which content
+
+    For every key (the application_id) the manifest stores the row hash and
+    the output file, relative to the manifest's folder. A run asks
+    up_to_date() per row and only renders rows whose hash changed or whose
+    output went missing; record() the new outputs, then prune() deletes
+    outputs of rows that are no longer in the data and save() writes the
+    manifest for the next run.
+    """
+
+    def __init__(self, folder, name=MANIFEST_NAME):
+        self.folder = folder
+        self.path = os.path.join(folder, name)
+        self._entries = {}
+        self._seen = set()
+        if os.path.exists(self.path):
+            with open(self.path, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    self._entries[row['key']] = (row['hash'], row['output'])
+
+    def __len__(self):
+        return len(self._entries)
+
+    def up_to_date(self, key, digest):
+        """Mark `key` as present; True if its output exists and was rendered from `digest`"""
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        return (entry is not None and entry[0] == digest
+                and os.path.exists(os.path.join(self.folder, entry[1])))
+
+    def output(self, key):
+        """Path of the recorded output of `key`"""
+        return os.path.join(self.folder, self._entries[key][1])
+
+    def record(self, key, digest, output):
+        """Remember a fresh render of `key`; removes its previous output if the file name changed"""
+        self._seen.add(key)
+        output = os.path.relpath(output, self.folder)
+        previous = self._entries.get(key)
+        if previous is not None and previous[1] != output:
+            self._remove(previous[1])
+        self._entries[key] = (digest, output)
+
+    def forget(self, key):
+        """Drop `key` (e.g. its render failed) so the next run retries it"""
+        self._entries.pop(key, None)
+
+    def prune(self):
+        """Delete the outputs of keys not seen in this run; returns how many were removed"""
+        stale = [key for key in self._entries if key not in self._seen]
+        for key in stale:
+            self._remove(self._entries.pop(key)[1])
+        return len(stale)
+
+    def _remove(self, output):
+        try:
+            os.remove(os.path.join(self.folder, output))
+        except FileNotFoundError:
+            pass
+
+    def save(self):
+        os.makedirs(self.folder, exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(MANIFEST_FIELDS)
+            writer.writerows((key, digest, output) for key, (digest, output) in self._entries.items())
+        os.replace(tmp, self.path)
@@ -0,0 +1,50 @@
+from multiprocessing import shared_memory
+
+from PIL import Image
+
+# Pillow maps these modes onto a buffer without copying; RGB is kept with a
+# padding byte per pixel internally, so it is shared as RGBX
+_SHARED_MODES = {'RGB': 'RGBX'}
+
+class SharedImage:
+    """A decoded PIL image whose pixels live in multiprocessing.shared_memory
+
+    The owning process creates it and hands `spec` (picklable) to workers,
+    which call attach_image(spec) to get a read-only image over the same
+    pages instead of decoding and holding their own copy. close() unlinks
+    the block; workers must be done with it by then.
+    """
+
+    def __init__(self, image):
+        self.mode = image.mode
+        shared_mode = _SHARED_MODES.get(image.mode, image.mode)
+        data = image.convert(shared_mode).tobytes()
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+        self._shm.buf[:len(data)] = data
+        self.spec = (self._shm.name, shared_mode, image.size)
+
+    @property
+    def nbytes(self):
+        return self._shm.size
+
+    def close(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def attach_image(spec):
+    """(shared memory handle, read-only image over it) for a SharedImage spec
+
+    The image is only valid while the handle stays open; convert() or copy()
+    it before drawing.
+    """
+    name, mode, size = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, Image.frombuffer(mode, size, shm.buf, 'raw', mode, 0, 1)
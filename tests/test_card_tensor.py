@@ -0,0 +1,53 @@
+import json
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from card_tensor import CardTensor, CardTensorWriter, labels_path
+
+def _card(value):
+    return Image.new('RGB', (4, 3), (value, value, value))
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'cards.npy')
+    with CardTensorWriter(path, 3, 3, 4, fields=('nama',)) as writer:
+        for slot, name in enumerate(['Siti', None, 'Budi']):
+            if name is None:
+                writer.record(slot, f'APP{slot}', None)
+                continue
+            writer.store(slot, _card(10 * (slot + 1)))
+            writer.record(slot, f'APP{slot}', {'nama': name})
+
+    tensor = CardTensor(path)
+    assert len(tensor) == 3 and tensor[0].shape == (3, 4, 3)
+    assert int(tensor[2][0, 0, 0]) == 30
+    assert not np.any(tensor[1])
+    assert tensor.labels(0) == {'application_id': 'APP0', 'nama': 'Siti'}
+    assert tensor.labels(1) == {'application_id': 'APP1', 'nama': None}
+    assert tensor.application_ids == ['APP0', 'APP1', 'APP2']
+    assert tensor.slot('APP2') == 2
+
+def test_records_must_be_in_order(tmp_path):
+    with CardTensorWriter(str(tmp_path / 'cards.npy'), 2, 3, 4) as writer:
+        with pytest.raises(ValueError):
+            writer.record(1, 'APP1', {})
+        writer.record(0, 'APP0', {})
+        writer.record(1, 'APP1', {})
+
+def test_missing_rows_raise_on_close(tmp_path):
+    path = str(tmp_path / 'cards.npy')
+    with pytest.raises(ValueError, match='room for 3 cards but 1 were recorded'):
+        with CardTensorWriter(path, 3, 3, 4) as writer:
+            writer.record(0, 'APP0', {})
+    # The sidecar is still complete JSON
+    with open(labels_path(path), encoding='utf-8') as f:
+        assert json.load(f)['rows'] == [['APP0']]
+
+def test_error_inside_the_block_propagates_unchanged(tmp_path):
+    path = str(tmp_path / 'cards.npy')
+    with pytest.raises(KeyError, match='nama'):
+        with CardTensorWriter(path, 3, 3, 4, fields=('nama',)) as writer:
+            writer.record(0, 'APP0', {})
+    with open(labels_path(path), encoding='utf-8') as f:
+        assert json.load(f)['rows'] == []
@@ -0,0 +1,59 @@
+import json
+import os
+
+import pytest
+
+import generate_indonesian_dummy_data as generator
+
+# Small seeded pools keep the runs fast and byte-reproducible
+OPTIONS = dict(seed=1, pooled=True, pool_size=64)
+
+def _generate(path, num_records, **kwargs):
+    generator.generate_with_checkpoints(str(path), num_records, **OPTIONS, **kwargs)
+    return path.read_bytes()
+
+def test_no_checkpoint_file_unless_asked_for(tmp_path):
+    path = tmp_path / 'data.csv'
+    _generate(path, 5, checkpoint_every=0)
+    assert not os.path.exists(generator.checkpoint_path(str(path)))
+
+def test_resume_truncates_rows_after_the_last_checkpoint(tmp_path):
+    expected = _generate(tmp_path / 'full.csv', 30, checkpoint_every=10)
+
+    path = tmp_path / 'data.csv'
+    _generate(path, 20, checkpoint_every=10)
+    # Pretend the run targeted 30 records and died halfway through a row
+    checkpoint = generator.checkpoint_path(str(path))
+    with open(checkpoint, encoding='utf-8') as f:
+        state = json.load(f)
+    state['target'] = 30
+    with open(checkpoint, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    with open(path, 'ab') as f:
+        f.write(b'APP-partial,row,that never')
+
+    generator.generate_with_checkpoints(str(path), resume=True, checkpoint_every=10)
+    assert path.read_bytes() == expected
+    assert generator.load_checkpoint(str(path))['next_index'] == 30
+
+def test_append_continues_ids(tmp_path):
+    expected = _generate(tmp_path / 'full.csv', 30, checkpoint_every=10)
+    path = tmp_path / 'data.csv'
+    _generate(path, 20, checkpoint_every=10)
+    generator.generate_with_checkpoints(str(path), append=10, checkpoint_every=0)
+    assert path.read_bytes() == expected
+    # Without checkpoint_every the appended run still records where it ended
+    assert generator.load_checkpoint(str(path))['next_index'] == 30
+
+def test_resume_needs_a_checkpoint(tmp_path):
+    path = tmp_path / 'data.csv'
+    _generate(path, 5, checkpoint_every=0)
+    with pytest.raises(FileNotFoundError):
+        generator.generate_with_checkpoints(str(path), resume=True)
+
+@pytest.mark.parametrize('flags', [['--columnar', '--resume'], ['--columnar', '--append', '5'],
+                                   ['--workers', '2', '--resume'], ['--shards', '2', '--append', '5']])
+def test_cli_rejects_resume_and_append_where_unsupported(flags, capsys):
+    with pytest.raises(SystemExit):
+        generator.main(flags)
+    assert 'not supported' in capsys.readouterr().err
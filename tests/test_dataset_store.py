@@ -0,0 +1,67 @@
+import csv
+
+import pytest
+
+from dataset_store import DatasetStore, count_rows, csv_to_store, read_rows, store_to_csv
+
+HEADER = ['application_id', 'age', 'gender', 'name']
+ROWS = [
+    ['APP1', '31', 'Male', 'Mumpuni Thamrin'],
+    ['APP2', '-4', 'Female', 'Siti Rahayu'],
+    ['APP3', '27', 'Male', 'Budi Santoso'],
+]
+
+def _write_csv(path, lines):
+    path.write_text(''.join(line + '\r\n' for line in lines), encoding='utf-8')
+
+def _csv_lines(rows):
+    return [','.join(row) for row in rows]
+
+def test_round_trip_keeps_every_column_kind(tmp_path):
+    source = tmp_path / 'data.csv'
+    _write_csv(source, _csv_lines([HEADER] + ROWS))
+    store_path = tmp_path / 'data.ijad'
+    # A tiny dictionary limit pushes `name` into a plain string column
+    assert csv_to_store(str(source), str(store_path), dict_limit=2) == 3
+    with DatasetStore(str(store_path)) as store:
+        kinds = {column['name']: column['kind'] for column in store.columns}
+        assert kinds == {'application_id': 'str', 'age': 'int', 'gender': 'dict', 'name': 'str'}
+        assert [dict(row) for row in store] == [dict(zip(HEADER, row)) for row in ROWS]
+    exported = tmp_path / 'exported.csv'
+    assert store_to_csv(str(store_path), str(exported)) == 3
+    assert exported.read_bytes() == source.read_bytes()
+
+def test_blank_lines_are_skipped_like_dictreader(tmp_path):
+    source = tmp_path / 'data.csv'
+    _write_csv(source, _csv_lines([HEADER, ROWS[0], '', ROWS[1], ROWS[2]]) + [''])
+    store_path = tmp_path / 'data.ijad'
+    assert csv_to_store(str(source), str(store_path)) == 3
+    with DatasetStore(str(store_path)) as store:
+        assert len(store) == count_rows(str(source)) == 3
+        assert [row['application_id'] for row in store] == ['APP1', 'APP2', 'APP3']
+    with open(source, newline='', encoding='utf-8') as f:
+        expected = list(csv.DictReader(f))
+    assert [dict(row) for row in read_rows(str(store_path))] == expected
+
+def test_short_rows_are_padded(tmp_path):
+    source = tmp_path / 'data.csv'
+    _write_csv(source, _csv_lines([HEADER, ROWS[0], ['APP2', '40'], ROWS[2]]))
+    store_path = tmp_path / 'data.ijad'
+    csv_to_store(str(source), str(store_path))
+    with DatasetStore(str(store_path)) as store:
+        assert dict(store[1]) == {'application_id': 'APP2', 'age': '40', 'gender': '', 'name': ''}
+        assert dict(store[2]) == dict(zip(HEADER, ROWS[2]))
+
+def test_long_rows_are_rejected(tmp_path):
+    source = tmp_path / 'data.csv'
+    _write_csv(source, _csv_lines([HEADER, ROWS[0], ROWS[1] + ['extra']]))
+    with pytest.raises(ValueError, match='Line 3'):
+        csv_to_store(str(source), str(tmp_path / 'data.ijad'))
+
+def test_empty_csv(tmp_path):
+    source = tmp_path / 'data.csv'
+    _write_csv(source, _csv_lines([HEADER]))
+    store_path = tmp_path / 'data.ijad'
+    assert csv_to_store(str(source), str(store_path)) == 0
+    with DatasetStore(str(store_path)) as store:
+        assert len(store) == 0 and store.fieldnames == HEADER
@@ -0,0 +1,52 @@
+import re
+
+import numpy as np
+import pytest
+
+from id_allocator import APPLICATION_ID_SPACE, NIK_SPACE, IdAllocator, format_nik, run_tag
+
+def test_application_id_format():
+    ids = IdAllocator(42, year=2026)
+    assert ids.application_id(0) == f"APP2026{run_tag(42)}00000001"
+    assert re.fullmatch(r"APP2026[0-9A-F]{6}\d{8}", ids.application_id(APPLICATION_ID_SPACE - 1))
+
+def test_application_id_rejects_indices_past_the_fixed_width():
+    ids = IdAllocator(42, year=2026)
+    with pytest.raises(ValueError):
+        ids.application_id(APPLICATION_ID_SPACE)
+    with pytest.raises(ValueError):
+        ids.application_id(-1)
+
+def test_run_tag_depends_on_the_seed_only():
+    assert IdAllocator(7).tag == IdAllocator(7).tag == run_tag(7)
+    tags = {run_tag(seed) for seed in range(1000)}
+    assert len(tags) == 1000
+
+def test_application_ids_are_unique_within_and_across_seeds():
+    first, second = IdAllocator(1), IdAllocator(2)
+    ids = [first.application_id(i) for i in range(5000)] + [second.application_id(i) for i in range(5000)]
+    assert len(set(ids)) == len(ids)
+
+def test_nik_numbers_are_a_permutation():
+    ids = IdAllocator(3)
+    values = [ids.nik_number(i) for i in range(20000)]
+    assert len(set(values)) == len(values)
+    assert all(0 <= value < NIK_SPACE for value in values)
+    # Highest indices still map inside the space
+    assert 0 <= ids.nik_number(NIK_SPACE - 1) < NIK_SPACE
+    with pytest.raises(ValueError):
+        ids.nik_number(NIK_SPACE)
+
+def test_nik_numbers_vectorised_matches_scalar():
+    ids = IdAllocator(5)
+    indices = np.arange(0, 3000)
+    assert ids.nik_numbers(indices).tolist() == [ids.nik_number(i) for i in range(3000)]
+
+def test_nik_depends_on_the_seed():
+    assert [IdAllocator(1).nik(i) for i in range(50)] != [IdAllocator(2).nik(i) for i in range(50)]
+    assert IdAllocator(1).nik(10) == IdAllocator(1).nik(10)
+
+def test_format_nik():
+    assert format_nik(0) == "111010100000"
+    nik = format_nik(NIK_SPACE - 1)
+    assert len(nik) == 12 and nik.startswith("36")
@@ -0,0 +1,47 @@
+import csv
+import re
+import zlib
+from collections import Counter
+
+import pytest
+from reportlab import rl_config
+
+import generate_indonesian_dummy_data as generator
+import generate_indonesian_pdf_forms as forms
+
+@pytest.fixture(scope='module')
+def applicants(tmp_path_factory):
+    path = tmp_path_factory.mktemp('data') / 'data.csv'
+    generator.generate_with_checkpoints(str(path), 8, seed=3, pooled=True, pool_size=64, checkpoint_every=0)
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    # One row with values long enough to wrap over several lines
+    rows[0]['technical_skills'] = ', '.join(['Kubernetes Administration'] * 30)
+    rows[0]['address_street'] = 'Jl. ' + 'Panjang Sekali ' * 20
+    return rows
+
+def _page_texts(data):
+    """Text drawn on each page, read from the page streams"""
+    pages = []
+    for stream in re.findall(rb'stream\r?\n(.*?)endstream', data, re.S):
+        try:
+            content = zlib.decompress(stream)
+        except zlib.error:
+            continue
+        if b'Halaman' in content:
+            pages.append(Counter(re.findall(rb'\((.*?)\) Tj', content)))
+    return pages
+
+def test_engines_draw_the_same_pages(applicants, monkeypatch):
+    # Only the canvas engine writes Flate-only streams on its own
+    monkeypatch.setattr(rl_config, 'useA85', 0)
+    for applicant in applicants:
+        platypus, canvas = [_page_texts(forms.render_indonesian_pdf(applicant, engine=engine)[1])
+                            for engine in forms.ENGINES]
+        assert platypus and canvas == platypus
+
+def test_canvas_engine_leaves_the_global_stream_encoding_alone(applicants):
+    use_a85 = rl_config.useA85
+    _, data = forms.render_indonesian_pdf(applicants[0], engine='canvas')
+    assert rl_config.useA85 == use_a85
+    assert b'/ASCII85Decode' not in data and b'/FlateDecode' in data
@@ -0,0 +1,102 @@
+import os
+
+import pytest
+
+import generate_ektp_images_from_csv as ektp
+import generate_indonesian_dummy_data as generator
+import generate_indonesian_pdf_forms as forms
+from render_manifest import MANIFEST_NAME, RenderManifest, discard_manifest, row_hash
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _output(folder, name, content=b'pdf'):
+    path = os.path.join(folder, name)
+    with open(path, 'wb') as f:
+        f.write(content)
+    return path
+
+def test_up_to_date_after_save_and_reload(tmp_path):
+    folder = str(tmp_path)
+    manifest = RenderManifest(folder)
+    manifest.record('APP1', 'hash1', _output(folder, 'APP1.pdf'))
+    manifest.save()
+
+    manifest = RenderManifest(folder)
+    assert len(manifest) == 1
+    assert manifest.up_to_date('APP1', 'hash1')
+    assert not manifest.up_to_date('APP1', 'hash2')
+    assert not manifest.up_to_date('APP2', 'hash1')
+    os.remove(manifest.output('APP1'))
+    assert not manifest.up_to_date('APP1', 'hash1')
+
+def test_prune_deletes_outputs_of_rows_not_seen(tmp_path):
+    folder = str(tmp_path)
+    manifest = RenderManifest(folder)
+    kept = _output(folder, 'APP1.pdf')
+    manifest.record('APP1', 'hash1', kept)
+    manifest.record('APP2', 'hash2', _output(folder, 'APP2.pdf'))
+    manifest.save()
+
+    manifest = RenderManifest(folder)
+    manifest.up_to_date('APP1', 'hash1')
+    assert manifest.prune() == 1
+    assert sorted(os.listdir(folder)) == sorted([MANIFEST_NAME, os.path.basename(kept)])
+
+def test_row_hash_depends_on_fields_and_version():
+    row = {'name': 'Siti', 'age': '30', 'other': 'x'}
+    assert row_hash(row, ('name', 'age'), 'v1') == row_hash(dict(row, other='y'), ('name', 'age'), 'v1')
+    assert row_hash(row, ('name', 'age'), 'v1') != row_hash(dict(row, age='31'), ('name', 'age'), 'v1')
+    assert row_hash(row, ('name', 'age'), 'v1') != row_hash(row, ('name', 'age'), 'v2')
+
+def test_discard_manifest(tmp_path):
+    folder = str(tmp_path)
+    assert not discard_manifest(folder)
+    RenderManifest(folder).save()
+    assert discard_manifest(folder)
+    assert not os.path.exists(os.path.join(folder, MANIFEST_NAME))
+
+@pytest.fixture(scope='module')
+def data_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp('data') / 'data.csv'
+    generator.generate_with_checkpoints(str(path), 3, seed=5, pooled=True, pool_size=64, checkpoint_every=0)
+    return str(path)
+
+def _skipped(capsys):
+    """Rows the last run skipped, from its summary line"""
+    lines = [line for line in capsys.readouterr().out.splitlines() if 'unchanged' in line]
+    return int(lines[-1].split()[1]) if lines else None
+
+def test_pdf_incremental_skip_and_invalidation(data_file, tmp_path, capsys):
+    folder = str(tmp_path / 'forms')
+    run = lambda incremental: forms.process_csv_and_generate_indonesian_pdfs(
+        data_file, output_folder=folder, engine='canvas', incremental=incremental)
+    manifest = os.path.join(folder, MANIFEST_NAME)
+
+    run(True)
+    assert _skipped(capsys) == 0 and os.path.exists(manifest)
+    run(True)
+    assert _skipped(capsys) == 3
+
+    # A plain run rewrites the forms behind the manifest's back
+    run(False)
+    assert not os.path.exists(manifest)
+    run(True)
+    assert _skipped(capsys) == 0
+
+def test_ektp_plain_run_discards_the_manifest(data_file, tmp_path, monkeypatch, capsys):
+    # Template, fonts and photo paths are relative to the repository root
+    monkeypatch.chdir(ROOT)
+    folder = str(tmp_path / 'ktp')
+    monkeypatch.setattr(ektp, 'OUTPUT_DIR', folder)
+    argv = [data_file, '--encode-threads', '0']
+    manifest = os.path.join(folder, MANIFEST_NAME)
+
+    ektp.main(argv + ['--incremental'])
+    assert _skipped(capsys) == 0 and os.path.exists(manifest)
+    ektp.main(argv + ['--incremental'])
+    assert _skipped(capsys) == 3
+
+    ektp.main(argv)
+    assert not os.path.exists(manifest)
+    ektp.main(argv + ['--incremental'])
+    assert _skipped(capsys) == 0